@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+NUMBER_OF_EVENTS = 10000
+
+EVENTS_SCHEMA = """\
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="recentDate">
+    <xs:restriction base="xs:date">
+      <xs:minInclusive value="2000-01-01"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:element name="events">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="event" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="timestamp" type="xs:dateTime"/>
+              <xs:element name="day" type="recentDate"/>
+              <xs:element name="elapsed" type="xs:duration"/>
+            </xs:sequence>
+            <xs:attribute name="time" type="xs:time"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+
+
+def create_events_document():
+    lines = ['<events>']
+    for k in range(NUMBER_OF_EVENTS):
+        lines.append(f'  <event time="{k % 24:02}:{k % 60:02}:00Z">'
+                     f'<timestamp>2026-{k % 12 + 1:02}-{k % 28 + 1:02}T10:00:00Z</timestamp>'
+                     f'<day>2026-{k % 12 + 1:02}-{k % 28 + 1:02}</day>'
+                     f'<elapsed>PT{k}M</elapsed></event>')
+    lines.append('</events>')
+    return '\n'.join(lines)
+
+
+def run_timeit(stmt='pass', setup='pass', number=10):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing the decoding of date/time values                ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+
+    schema = xmlschema.XMLSchema(EVENTS_SCHEMA)
+    document = xmlschema.XMLResource(create_events_document())
+    setup = 'from __main__ import schema, document'
+
+    print(f"Document with {NUMBER_OF_EVENTS} events:")
+    run_timeit('schema.decode(document)', setup)
+    run_timeit('schema.decode(document, datetime_types=True)', setup)
+    run_timeit('schema.decode(document, use_decode_plans=True)', setup)
+    run_timeit('schema.decode(document, datetime_types=True, use_decode_plans=True)', setup)
+    run_timeit('schema.is_valid(document)', setup)
+    print()
+
+    xsd_type = schema.types['recentDate']
+    context = xmlschema.validators.ValidationContext(document)
+    setup = 'from __main__ import xsd_type, context'
+
+    print("Single values of a date type restricted with a range facet:")
+    run_timeit("xsd_type.raw_decode('2026-06-15', 'strict', context)", setup, 100000)
+    run_timeit("xsd_type.lexical_decode('2026-06-15', 'strict', context)", setup, 100000)
+    print()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+NUMBER_OF_READINGS = 10000
+
+READINGS_SCHEMA = """\
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:simpleType name="price">
+    <xs:restriction base="xs:decimal">
+      <xs:minInclusive value="0"/>
+      <xs:totalDigits value="10"/>
+      <xs:fractionDigits value="2"/>
+    </xs:restriction>
+  </xs:simpleType>
+  <xs:element name="readings">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="reading" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="value" type="xs:decimal"/>
+              <xs:element name="price" type="price"/>
+              <xs:element name="count" type="xs:int"/>
+            </xs:sequence>
+            <xs:attribute name="weight" type="xs:decimal"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+
+
+def create_readings_document():
+    lines = ['<readings>']
+    for k in range(NUMBER_OF_READINGS):
+        lines.append(f'  <reading weight="0.{k:04}"><value>{k * 7 - 30000}.{k % 1000:03}</value>'
+                     f'<price>{k % 500}.{k % 100:02}</price><count>{k}</count></reading>')
+    lines.append('</readings>')
+    return '\n'.join(lines)
+
+
+def run_timeit(stmt='pass', setup='pass', number=10):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing the decoding of decimal values to floats        ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+
+    schema = xmlschema.XMLSchema(READINGS_SCHEMA)
+    document = xmlschema.XMLResource(create_readings_document())
+    setup = 'from __main__ import schema, document, xmlschema'
+
+    print(f"Document with {NUMBER_OF_READINGS} readings:")
+    run_timeit('schema.decode(document)', setup)
+    run_timeit('schema.decode(document, decimal_type=float)', setup)
+    run_timeit('schema.decode(document, decimal_type=float, use_decode_plans=True)', setup)
+    run_timeit('xmlschema.to_json(document, schema=schema)', setup)
+    run_timeit('schema.is_valid(document)', setup)
+    print()
+
+    xsd_type = schema.types['price']
+    context = xmlschema.validators.ValidationContext(document)
+    setup = 'from __main__ import xsd_type, context'
+
+    print("Single values of a decimal type restricted with range and digits facets:")
+    run_timeit("float(xsd_type.raw_decode('123.45', 'strict', context))", setup, 100000)
+    run_timeit("xsd_type.lexical_decode('123.45', 'strict', context)", setup, 100000)
+    print()
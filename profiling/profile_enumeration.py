@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+NUMBER_OF_VALUES = 10000
+
+
+def create_code_list_schema(base_type, values):
+    lines = ['<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">',
+             '  <xs:simpleType name="codeType">',
+             f'    <xs:restriction base="{base_type}">']
+    lines.extend(f'      <xs:enumeration value="{v}"/>' for v in values)
+    lines.extend(('    </xs:restriction>', '  </xs:simpleType>', '</xs:schema>'))
+    return '\n'.join(lines)
+
+
+def run_timeit(stmt='pass', setup='pass', number=1000):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing enumeration facets with 10k-value code lists    ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+    from xmlschema.names import XSD_ENUMERATION
+
+    setup = 'from __main__ import facet, enumeration, first, last'
+    for base_type, values in [
+        ('xs:string', [f'C{k:05}' for k in range(NUMBER_OF_VALUES)]),
+        ('xs:decimal', [f'{k}.5' for k in range(NUMBER_OF_VALUES)]),
+    ]:
+        schema = xmlschema.XMLSchema(create_code_list_schema(base_type, values))
+        facet = schema.types['codeType'].get_facet(XSD_ENUMERATION)
+        enumeration = facet.enumeration
+        first, last = enumeration[0], enumeration[-1]
+
+        print(f"Enumeration of {len(enumeration)} {base_type} values:")
+        run_timeit('last in enumeration', setup)
+        run_timeit('facet(first)', setup)
+        run_timeit('facet(last)', setup)
+        run_timeit("schema.types['codeType'].is_valid(values[-1])",
+                   'from __main__ import schema, values')
+        print()
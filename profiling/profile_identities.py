@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+NUMBER_OF_ROWS = 10000
+
+IDENTITIES_SCHEMA = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="table">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="row" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="code" type="xs:string"/>
+              <xs:element name="parent" type="xs:int" minOccurs="0"/>
+            </xs:sequence>
+            <xs:attribute name="id" type="xs:int" use="required"/>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+    <xs:key name="rowKey">
+      <xs:selector xpath="row"/>
+      <xs:field xpath="@id"/>
+    </xs:key>
+    <xs:unique name="codeUnique">
+      <xs:selector xpath="./row"/>
+      <xs:field xpath="code"/>
+    </xs:unique>
+    <xs:keyref name="parentRef" refer="rowKey">
+      <xs:selector xpath="row"/>
+      <xs:field xpath="parent"/>
+    </xs:keyref>
+  </xs:element>
+</xs:schema>"""
+
+
+def create_table(rows):
+    lines = ['<table>']
+    lines.extend(
+        f'<row id="{k}"><code>C{k:06}</code><parent>{k // 2}</parent></row>'
+        for k in range(1, rows + 1)
+    )
+    lines.append('</table>')
+    return ''.join(lines)
+
+
+def run_timeit(stmt='pass', setup='pass', number=1000):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing identity constraints on a 10k-row table         ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+    from xmlschema.validators.identities import FieldValueSelector
+
+    schema = xmlschema.XMLSchema(IDENTITIES_SCHEMA)
+    resource = xmlschema.XMLResource(create_table(NUMBER_OF_ROWS).replace(
+        '<parent>0</parent>', ''
+    ))
+    assert schema.is_valid(resource)
+
+    print("Validation with compiled selectors and fields:")
+    run_timeit('schema.validate(resource)', 'from __main__ import schema, resource', 5)
+
+    for identity in schema.identities.values():
+        identity.selector.steps = None
+        for selectors in identity.elements.values():
+            for s in selectors:
+                s.steps = None
+
+    print("Validation with XPath selectors and fields:")
+    run_timeit('schema.validate(resource)', 'from __main__ import schema, resource', 5)
+
+    # Check also selectors created at validation time
+    assert all(isinstance(s, FieldValueSelector)
+               for identity in schema.identities.values()
+               for selectors in identity.elements.values() for s in selectors)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+import subprocess
+import sys
+from pathlib import Path
+
+# Each measure is taken in a new interpreter process, for having a cold import.
+PROFILE_SCRIPT = """
+from time import perf_counter
+start_time = perf_counter()
+import xmlschema
+import_time = perf_counter() - start_time
+start_time = perf_counter()
+meta_schema = xmlschema.{0}.meta_schema
+create_time = perf_counter() - start_time
+start_time = perf_counter()
+meta_schema.build()
+build_time = perf_counter() - start_time
+print(import_time, create_time, build_time)
+"""
+
+
+def run_cold_import(class_name, number=10):
+    project_dir = Path(__file__).absolute().parent.parent
+    results = []
+    for _ in range(number):
+        output = subprocess.check_output(
+            [sys.executable, '-c', PROFILE_SCRIPT.format(class_name)],
+            cwd=project_dir,
+            text=True,
+        )
+        results.append(tuple(float(x) for x in output.split()))
+
+    import_time, create_time, build_time = (min(x) for x in zip(*results))
+    print(f"{class_name}: import={import_time:.4f}s, meta-schema "
+          f"creation={create_time:.4f}s, meta-schema build={build_time:.4f}s")
+
+
+if __name__ == '__main__':
+    print('*' * 50)
+    print("*** Cold import profile for xmlschema package ***")
+    print('*' * 50)
+    print()
+
+    run_cold_import('XMLSchema10')
+    run_cold_import('XMLSchema11')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import repeat
+
+NUMBER_OF_GLOBALS = 2000
+
+
+def create_large_schema(number):
+    lines = ['<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">']
+    for k in range(number):
+        lines.append(f"""
+  <xs:complexType name="type{k}">
+    <xs:sequence>
+      <xs:element name="a" type="xs:string" minOccurs="0"/>
+      <xs:element name="b" type="xs:int" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:ID"/>
+  </xs:complexType>
+  <xs:element name="elem{k}" type="type{k}"/>""")
+    lines.append('</xs:schema>')
+    return '\n'.join(lines)
+
+
+def run_repeat(stmt='pass', setup='pass', number=10):
+    # The setup creates a new schema for each run of the statement
+    seconds = sum(repeat(stmt, setup=setup, number=1, repeat=number))
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing eager and lazy build of a large schema          ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+
+    schema_source = create_large_schema(NUMBER_OF_GLOBALS)
+    xml_source = '<elem7 id="x1"><a>foo</a><b>1</b><b>2</b></elem7>'
+
+    setup = 'from __main__ import xmlschema, schema_source, xml_source'
+    eager_setup = setup + '; schema = xmlschema.XMLSchema(schema_source, build=False)'
+    lazy_setup = setup + \
+        '; schema = xmlschema.XMLSchema(schema_source, build=False, lazy_build=True)'
+
+    run_repeat('schema.build()', eager_setup)
+    run_repeat('schema.build()', lazy_setup)
+    print()
+
+    run_repeat('schema.build(); schema.is_valid(xml_source)', eager_setup)
+    run_repeat('schema.build(); schema.is_valid(xml_source)', lazy_setup)
+    run_repeat('schema.build_all()', lazy_setup)
+    print()
+
+    schema = xmlschema.XMLSchema(schema_source, lazy_build=True)
+    schema.is_valid(xml_source)
+    print(f"Staged globals after validation: {schema.maps.global_maps.total_staged}")
+    print(f"Built globals after validation: {schema.maps.global_maps.total}")
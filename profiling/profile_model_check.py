@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+
+def create_wide_model_schema(number):
+    lines = ['<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">',
+             '  <xs:complexType name="wideType">',
+             '    <xs:choice maxOccurs="unbounded">']
+    for k in range(number):
+        lines.append(f'      <xs:element name="elem{k}" type="xs:string"/>')
+        lines.append(f'      <xs:sequence><xs:element name="opt{k}" minOccurs="0"/>'
+                     f'<xs:element name="last{k}"/></xs:sequence>')
+    lines.extend(('    </xs:choice>', '  </xs:complexType>', '</xs:schema>'))
+    return '\n'.join(lines)
+
+
+def create_deep_model_schema(number):
+    lines = ['<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">',
+             '  <xs:complexType name="deepType">']
+    for k in range(number):
+        lines.append(f'<xs:sequence minOccurs="0"><xs:element name="elem{k}" minOccurs="0"/>')
+    lines.append('<xs:element name="last" minOccurs="0"/>')
+    lines.append('</xs:sequence>' * number)
+    lines.extend(('  </xs:complexType>', '</xs:schema>'))
+    return '\n'.join(lines)
+
+
+def run_timeit(stmt='pass', setup='pass', number=1):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing model checks with paths and with automata       ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+    from xmlschema import limits
+    from xmlschema.validators.models import check_model, check_model_automaton  # noqa: F401
+
+    limits.MAX_MODEL_DEPTH = 10000
+    setup = 'from __main__ import check_model, check_model_automaton, group'
+
+    for size in (100, 200, 400, 800):
+        schema = xmlschema.XMLSchema(create_wide_model_schema(size), build=False)
+        schema.build()
+        group = schema.types['wideType'].content
+        print(f"Wide model with {size * 3} elements:")
+        run_timeit('check_model(group)', setup)
+        run_timeit('check_model_automaton(group)', setup)
+        print()
+
+    for size in (25, 50, 100, 150):
+        schema = xmlschema.XMLSchema(create_deep_model_schema(size), build=False,
+                                     validation='lax')
+        schema.build()
+        group = schema.types['deepType'].content
+        print(f"Deep model with {size} nested sequences:")
+        run_timeit('check_model_automaton(group)', setup)
+        try:
+            run_timeit('check_model(group)', setup)
+        except xmlschema.XMLSchemaModelError as err:
+            print(err.message)
+        print()
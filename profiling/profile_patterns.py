@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+from timeit import timeit
+
+PATTERN_TYPES = {
+    'zipCode': (['\\d{5}'], '00184'),
+    'isoCountryCode': (['[A-Z]{2}'], 'IT'),
+    'isoCurrencyCode': (['[A-Z]{3}'], 'EUR'),
+    'iban': (['[A-Z]{2}\\d{2}[A-Z0-9]{11,30}'], 'IT60X0542811101000000123456'),
+    'uuid': (['[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'],
+             '123e4567-e89b-12d3-a456-426614174000'),
+    'phoneNumber': (['\\+\\d{2} \\d{3} \\d{7}', '\\d{3}-\\d{7}', '\\d{3} \\d{7}'],
+                    '055 1234567'),
+    'countryOrCurrency': (['[A-Z]{2}', '[A-Z]{3}', '\\d{3}'], '978'),
+}
+
+
+def create_pattern_types_schema():
+    lines = ['<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">']
+    for name, (patterns, _) in PATTERN_TYPES.items():
+        lines.append(f'  <xs:simpleType name="{name}">')
+        lines.append('    <xs:restriction base="xs:string">')
+        lines.extend(f'      <xs:pattern value="{p}"/>' for p in patterns)
+        lines.append('    </xs:restriction>')
+        lines.append('  </xs:simpleType>')
+    lines.append('</xs:schema>')
+    return '\n'.join(lines)
+
+
+def match_each_pattern(facet, value):
+    # The check done before compiling the patterns of a facet set
+    return any(pattern.match(value) is not None for pattern in facet.patterns)
+
+
+def run_timeit(stmt='pass', setup='pass', number=100000):
+    seconds = timeit(stmt, setup=setup, number=number)
+    print("{}: {}s".format(stmt, seconds))
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing pattern facets with compiled matchers           ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+    from xmlschema.names import XSD_PATTERN
+
+    schema = xmlschema.XMLSchema(create_pattern_types_schema())
+    setup = 'from __main__ import facet, value, match_each_pattern'
+
+    for name, (patterns, value) in PATTERN_TYPES.items():
+        facet = schema.types[name].get_facet(XSD_PATTERN)
+        facet(value)  # compile the patterns
+
+        print(f"Type {name!r} with patterns {patterns!r}:")
+        run_timeit('match_each_pattern(facet, value)', setup)
+        run_timeit('facet(value)', setup)
+        print()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+import time
+import tracemalloc
+
+NUMBER_OF_ERRORS = 100000
+
+
+def create_invalid_document(number):
+    # Each item produces a decode error for element 'a', a decode error for
+    # attribute 'b' and a children error for the misplaced element 'c'.
+    items = ['<item><a b="y">x</a><c/></item>'] * (number // 3)
+    return '<root>{}</root>'.format(''.join(items))
+
+
+SCHEMA_SOURCE = """
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="root">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="item" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="a">
+                <xs:complexType>
+                  <xs:simpleContent>
+                    <xs:extension base="xs:int">
+                      <xs:attribute name="b" type="xs:int"/>
+                    </xs:extension>
+                  </xs:simpleContent>
+                </xs:complexType>
+              </xs:element>
+              <xs:element name="d" minOccurs="0"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+
+
+if __name__ == '__main__':
+    print('*' * 62)
+    print("*** Timing and memory usage of collecting validation errors ***")
+    print('*' * 62)
+    print()
+
+    import xmlschema
+
+    schema = xmlschema.XMLSchema(SCHEMA_SOURCE)
+    resource = xmlschema.XMLResource(create_invalid_document(NUMBER_OF_ERRORS))
+
+    start_time = time.perf_counter()
+    errors = list(schema.iter_errors(resource))
+    elapsed = time.perf_counter() - start_time
+    print(f"Collected {len(errors)} errors in {elapsed:.3f}s")
+
+    del errors
+    tracemalloc.start()
+    errors = list(schema.iter_errors(resource))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Memory used by collected errors: {current / 2**20:.1f} MiB "
+          f"(peak {peak / 2**20:.1f} MiB)")
+
+    start_time = time.perf_counter()
+    for error in errors:
+        _ = error.reason, error.message, error.sourceline
+    elapsed = time.perf_counter() - start_time
+    print(f"Accessed reasons and messages of {len(errors)} errors in {elapsed:.3f}s")
+
+    start_time = time.perf_counter()
+    for error in errors[-100:]:
+        _ = error.path, str(error)
+    elapsed = time.perf_counter() - start_time
+    print(f"Accessed paths and string forms of 100 errors in {elapsed:.3f}s")
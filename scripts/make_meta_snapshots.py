@@ -0,0 +1,55 @@
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+# type: ignore
+#
+"""Meta-schema snapshots generator utility, to run before building the package."""
+
+if __name__ == '__main__':
+    import argparse
+    import inspect
+    import os
+    import sys
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(
+        description="Generate the pre-built meta-schema snapshots of xmlschema"
+    )
+    parser.add_argument(
+        '-c', '--clean', action='store_true', default=False,
+        help="remove the meta-schema snapshots instead of generating them"
+    )
+    args = parser.parse_args()
+
+    os.chdir(Path(__file__).parent.parent)
+    assert Path('xmlschema').is_dir(), 'xmlschema/ package directory not found!'
+    sys.path.insert(0, os.getcwd())
+
+    from xmlschema.validators.schemas import MetaSchemaDescriptor, XMLSchema10, XMLSchema11
+    from xmlschema.snapshots import save_meta_snapshot, load_meta_snapshot
+
+    for schema_class in (XMLSchema10, XMLSchema11):
+        snapshot = schema_class.META_SNAPSHOT
+        if args.clean:
+            if os.path.isfile(snapshot):
+                os.unlink(snapshot)
+                print(f"Removed {snapshot}")
+            continue
+
+        descriptor = inspect.getattr_static(schema_class, 'meta_schema')
+        assert isinstance(descriptor, MetaSchemaDescriptor), \
+            f"meta-schema of {schema_class!r} is already created!"
+
+        meta_schema = descriptor.create()
+        meta_schema.build()
+        save_meta_snapshot(meta_schema, snapshot)
+
+        if load_meta_snapshot(descriptor.meta_schema_class, snapshot) is None:
+            sys.exit(f"Generated snapshot {snapshot} can't be loaded!")
+        print(f"Saved {snapshot} ({os.path.getsize(snapshot)} bytes)")
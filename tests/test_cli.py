@@ -124,6 +124,14 @@ class TestConsoleScripts(unittest.TestCase):
         self.assertEqual("vehicles.xml is valid\n", mock_out.getvalue())
         self.assertEqual('0', str(self.ctx.exception))
 
+    @patch('sys.stderr', new_callable=io.StringIO)
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_validate_command_09(self, mock_out, mock_err):
+        self.run_validate('--max-errors=1', 'vehicles-2_errors.xml')
+        self.assertEqual(mock_out.getvalue(), '')
+        self.assertEqual("vehicles-2_errors.xml is not valid\n", mock_err.getvalue())
+        self.assertEqual('1', str(self.ctx.exception))
+
     @patch('sys.stderr', new_callable=io.StringIO)
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_xml2json_command_01(self, mock_out, mock_err):
@@ -179,6 +187,16 @@ class TestConsoleScripts(unittest.TestCase):
         self.assertIn("vehicles.xml converted to vehicles.json\n", mock_out.getvalue())
         self.assertIn("skip vehicles.json: the destination file exists!", mock_out.getvalue())
 
+    @patch('sys.stderr', new_callable=io.StringIO)
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_xml2json_command_06(self, mock_out, mock_err):
+        self.run_xml2json('--max-errors=1', 'vehicles-2_errors.xml')
+        os.unlink('vehicles-2_errors.json')
+        self.assertEqual(mock_err.getvalue(), '')
+        msg = "vehicles-2_errors.xml converted to vehicles-2_errors.json with 1 errors\n"
+        self.assertEqual(msg, mock_out.getvalue())
+        self.assertEqual('1', str(self.ctx.exception))
+
     @patch('sys.stderr', new_callable=io.StringIO)
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_json2xml_command_01(self, mock_out, mock_err):
@@ -248,6 +266,14 @@ class TestConsoleScripts(unittest.TestCase):
         self.assertIn("'sometimes' is not a valid value", mock_err.getvalue())
         self.assertEqual('2', str(self.ctx.exception))
 
+    @patch('sys.stderr', new_callable=io.StringIO)
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_wrong_max_errors(self, mock_out, mock_err):
+        self.run_validate('--max-errors=0', 'vehicles.xml')
+        self.assertEqual(mock_out.getvalue(), '')
+        self.assertIn("'0' is not a positive integer", mock_err.getvalue())
+        self.assertEqual('2', str(self.ctx.exception))
+
     def test_get_loglevel(self):
         self.assertEqual(get_loglevel(0), logging.ERROR)
         self.assertEqual(get_loglevel(1), logging.WARNING)
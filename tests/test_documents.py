@@ -16,6 +16,7 @@ import io
 import pathlib
 import tempfile
 from decimal import Decimal
+from functools import partial
 from textwrap import dedent
 from xml.etree import ElementTree
 
@@ -31,7 +32,7 @@ from xmlschema import XMLSchema10, XMLSchema11, XmlDocument, XMLResourceError, \
 from xmlschema.names import XSD_NAMESPACE, XSI_NAMESPACE, XSD_SCHEMA
 from xmlschema.utils.etree import is_etree_element, is_etree_document, is_lxml_element
 from xmlschema.resources import XMLResource
-from xmlschema.documents import get_context
+from xmlschema.documents import get_context, DocumentSchemaCache, document_schema_cache
 from xmlschema.testing import etree_elements_assert_equal, SKIP_REMOTE_TESTS, \
     XMLSchemaTestCase, run_xmlschema_tests
 
@@ -294,6 +295,75 @@ class TestXmlDocuments(XMLSchemaTestCase):
             XmlDocument(self.col_xml_file, use_location_hints=False)
         self.assertIn('provide a schema argument', str(ctx.exception))
 
+    def test_schema_cache(self):
+        cache = DocumentSchemaCache(maxsize=2)
+        self.assertEqual(repr(cache), 'DocumentSchemaCache(maxsize=2)')
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+
+        schema = cache.get_schema(XMLSchema10, self.vh_xsd_file)
+        self.assertTrue(schema.built)
+        self.assertIn(schema, cache)
+        self.assertIs(cache.get_schema(XMLSchema10, self.vh_xsd_file), schema)
+        self.assertEqual(cache.cache_info(), (1, 1, 2, 1))
+
+        self.assertIsNot(cache.get_schema(XMLSchema11, self.vh_xsd_file), schema)
+        self.assertIsNot(cache.get_schema(XMLSchema10, self.col_xsd_file), schema)
+        self.assertEqual(cache.cache_info(), (1, 3, 2, 2))
+        self.assertNotIn(schema, cache)  # least recently used is discarded
+
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+
+        def uri_mapper(uri, suffix):
+            return uri
+
+        schema = cache.get_schema(XMLSchema10, self.vh_xsd_file,
+                                  uri_mapper=partial(uri_mapper, suffix='1'))
+        self.assertIsNot(cache.get_schema(XMLSchema10, self.vh_xsd_file,
+                                          uri_mapper=partial(uri_mapper, suffix='2')), schema)
+
+        cache.clear()
+        with tempfile.TemporaryDirectory() as dirname:
+            schema_file = pathlib.Path(dirname).joinpath('schema.xsd')
+            schema_file.write_text('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                                   '<xs:element name="root"/></xs:schema>')
+            schema = cache.get_schema(XMLSchema10, str(schema_file))
+            self.assertIs(cache.get_schema(XMLSchema10, str(schema_file)), schema)
+
+            schema_file.write_text('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                                   '<xs:element name="root2"/></xs:schema>')
+            other = cache.get_schema(XMLSchema10, str(schema_file))
+            self.assertIsNot(other, schema)
+            self.assertIn('root2', other.elements)
+            self.assertEqual(cache.cache_info(), (1, 2, 2, 1))
+
+        with self.assertRaises(TypeError):
+            DocumentSchemaCache(maxsize=None)
+        with self.assertRaises(ValueError):
+            DocumentSchemaCache(maxsize=0)
+
+    def test_use_schema_cache_argument(self):
+        document_schema_cache.clear()
+        try:
+            xml_file = self.casepath('examples/vehicles/vehicles-1_error.xml')
+            self.assertIsNone(validate(self.vh_xml_file, use_schema_cache=True))
+            self.assertFalse(is_valid(xml_file, use_schema_cache=True))
+            self.assertIsInstance(to_dict(self.vh_xml_file, use_schema_cache=True), dict)
+            self.assertEqual(document_schema_cache.cache_info()[:2], (2, 1))
+
+            xml_document = XmlDocument(self.vh_xml_file, use_schema_cache=True)
+            self.assertIn(xml_document.schema, document_schema_cache)
+            self.assertIs(XmlDocument(xml_file, validation='lax',
+                                      use_schema_cache=True).schema, xml_document.schema)
+            self.assertEqual(len(document_schema_cache), 1)
+
+            self.assertNotIn(XmlDocument(self.vh_xml_file).schema, document_schema_cache)
+            self.assertIsNot(XmlDocument(self.vh_xml_file, cls=XMLSchema11,
+                                         use_schema_cache=True).schema, xml_document.schema)
+            self.assertEqual(document_schema_cache.cache_info()[:2], (4, 2))
+        finally:
+            document_schema_cache.clear()
+
     def test_xml_document_init_with_schema(self):
         xml_document = XmlDocument(self.vh_xml_file)
         self.assertEqual(os.path.basename(xml_document.url), 'vehicles.xml')
@@ -9,7 +9,11 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import pathlib
+import tempfile
+import threading
 import warnings
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 from xmlschema import XMLSchema11
 from xmlschema import SchemaLoader, LocationSchemaLoader, SafeSchemaLoader
@@ -167,5 +171,121 @@ class TestSafeSchemaLoader11(TestSafeSchemaLoader):
     schema_class = XMLSchema11
 
 
+class ConcurrentRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves files counting the requests that are served at the same time. If
+    *wait_overlap* is set, the requests of sources other than main.xsd wait
+    for an overlapping request before answering, for at most *timeout* seconds.
+    """
+    lock = threading.Lock()
+    overlap = threading.Event()
+    wait_overlap = False
+    timeout = 5.0
+    active = 0
+    max_active = 0
+
+    @classmethod
+    def reset(cls, wait_overlap=False):
+        cls.overlap.clear()
+        cls.wait_overlap = wait_overlap
+        cls.active = cls.max_active = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            if cls.active > 1:
+                cls.overlap.set()
+
+        try:
+            if cls.wait_overlap and not self.path.endswith('/main.xsd'):
+                if not cls.overlap.wait(cls.timeout):
+                    cls.overlap.set()  # serial requests: don't wait on the others
+            super().do_GET()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConcurrentLoading(XMLSchemaTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        dirpath = pathlib.Path(cls.tmp_dir.name)
+
+        includes = ''.join(f'<xs:include schemaLocation="inc{k}.xsd"/>' for k in range(4))
+        imports = ''.join(
+            f'<xs:import namespace="http://xmlschema.test/ns{k}" schemaLocation="imp{k}.xsd"/>'
+            for k in range(4)
+        )
+        dirpath.joinpath('main.xsd').write_text(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+            ' targetNamespace="http://xmlschema.test/ns">'
+            f'{imports}{includes}<xs:element name="root"/></xs:schema>'
+        )
+        for k in range(4):
+            dirpath.joinpath(f'inc{k}.xsd').write_text(
+                '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+                ' targetNamespace="http://xmlschema.test/ns">'
+                f'<xs:element name="elem{k}" type="xs:string"/></xs:schema>'
+            )
+            dirpath.joinpath(f'imp{k}.xsd').write_text(
+                '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+                f' targetNamespace="http://xmlschema.test/ns{k}">'
+                f'<xs:include schemaLocation="sub{k}.xsd"/></xs:schema>'
+            )
+            dirpath.joinpath(f'sub{k}.xsd').write_text(
+                '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+                f' targetNamespace="http://xmlschema.test/ns{k}">'
+                f'<xs:element name="elem{k}" type="xs:int"/></xs:schema>'
+            )
+
+        handler = partial(ConcurrentRequestHandler, directory=cls.tmp_dir.name)
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.url = 'http://127.0.0.1:{}/main.xsd'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.tmp_dir.cleanup()
+
+    def test_concurrent_loading(self):
+        ConcurrentRequestHandler.reset()
+        schema = self.schema_class(self.url)
+        self.assertEqual(ConcurrentRequestHandler.max_active, 1)
+
+        ConcurrentRequestHandler.reset(wait_overlap=True)
+        other = self.schema_class(self.url, loader_workers=4)
+        self.assertGreater(ConcurrentRequestHandler.max_active, 1)
+
+        self.assertEqual(len(schema.maps.owned_schemas), 13)
+        self.assertEqual(len(other.maps.owned_schemas), 13)
+        # Schemas are registered in the same order of the serial loading
+        self.assertDictEqual(
+            {ns: [s.url for s in schemas] for ns, schemas in schema.maps.namespaces.items()},
+            {ns: [s.url for s in schemas] for ns, schemas in other.maps.namespaces.items()}
+        )
+        self.assertListEqual(list(schema.maps.elements), list(other.maps.elements))
+        self.assertFalse(other.maps.loader.prefetched)
+
+    def test_concurrent_loading_with_missing_sources(self):
+        url = self.url.replace('main.xsd', 'imp0.xsd')
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("ignore")
+            schema = self.schema_class(url, loader_workers=2, locations=[
+                ('http://xmlschema.test/ns9', url.replace('imp0.xsd', 'missing.xsd'))
+            ])
+        self.assertEqual(len(schema.maps.owned_schemas), 2)
+        self.assertIn(url.replace('imp0.xsd', 'missing.xsd'), schema.maps.loader.missing_locations)
+
+
 if __name__ == '__main__':
     run_xmlschema_tests("loaders.py module")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+import os
+import pathlib
+import tempfile
+import threading
+from functools import partial
+
+from xmlschema import XMLSchema10, XMLSchema11
+from xmlschema.registry import SchemaRegistry, schema_registry
+from xmlschema.testing import XMLSchemaTestCase, run_xmlschema_tests
+
+
+class TestSchemaRegistry(XMLSchemaTestCase):
+    cases_dir = pathlib.Path(__file__).absolute().parent.joinpath('test_cases')
+
+    def setUp(self):
+        self.registry = SchemaRegistry()
+        self.vh_xsd_file = self.casepath('examples/vehicles/vehicles.xsd')
+        self.col_xsd_file = self.casepath('examples/collection/collection.xsd')
+
+    def test_default_registry(self):
+        self.assertIsInstance(schema_registry, SchemaRegistry)
+
+    def test_get_schema(self):
+        schema = self.registry.get_schema(self.vh_xsd_file)
+        self.assertIsInstance(schema, XMLSchema10)
+        self.assertTrue(schema.built)
+        self.assertEqual(len(self.registry), 1)
+        self.assertIn(schema, self.registry)
+        self.assertListEqual(self.registry.schemas, [schema])
+        self.assertEqual(repr(self.registry), 'SchemaRegistry(1 schemas)')
+
+        self.assertIs(self.registry.get_schema(self.vh_xsd_file), schema)
+        self.assertIs(self.registry.get_schema(pathlib.Path(self.vh_xsd_file)), schema)
+        self.assertIs(self.registry.get_schema(self.vh_xsd_file, loglevel=20), schema)
+        self.assertEqual(len(self.registry), 1)
+
+        other = self.registry.get_schema(self.vh_xsd_file, XMLSchema11)
+        self.assertIsInstance(other, XMLSchema11)
+        self.assertIsNot(self.registry.get_schema(self.vh_xsd_file, validation='lax'), schema)
+        self.assertIsNot(self.registry.get_schema(self.col_xsd_file), schema)
+        self.assertEqual(len(self.registry), 4)
+
+        self.registry.clear()
+        self.assertEqual(len(self.registry), 0)
+        self.assertIsNot(self.registry.get_schema(self.vh_xsd_file), schema)
+
+    def test_get_schema_from_string(self):
+        source = '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">' \
+                 '<xs:element name="root"/></xs:schema>'
+        schema = self.registry.get_schema(source)
+        self.assertIs(self.registry.get_schema(source), schema)
+        self.assertIs(self.registry.get_schema(source.encode()), schema)
+
+        with open(self.col_xsd_file) as fp:
+            schema = self.registry.get_schema(fp)
+        self.assertTrue(schema.built)
+        self.assertNotIn(schema, self.registry)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_get_schema_with_callable_settings(self):
+        def uri_mapper(uri, suffix):
+            return uri
+
+        mapper1 = partial(uri_mapper, suffix='1')
+        mapper2 = partial(uri_mapper, suffix='2')
+        schema = self.registry.get_schema(self.vh_xsd_file, uri_mapper=mapper1)
+        self.assertIs(self.registry.get_schema(self.vh_xsd_file, uri_mapper=mapper1), schema)
+        self.assertIsNot(self.registry.get_schema(self.vh_xsd_file, uri_mapper=mapper2), schema)
+        self.assertIsNot(self.registry.get_schema(self.vh_xsd_file,
+                                                  uri_mapper=lambda x: x), schema)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_evict(self):
+        schema = self.registry.get_schema(self.vh_xsd_file)
+        self.assertFalse(self.registry.evict(self.vh_xsd_file, XMLSchema11))
+        self.assertFalse(self.registry.evict(self.vh_xsd_file, validation='lax'))
+        self.assertTrue(self.registry.evict(self.vh_xsd_file))
+        self.assertFalse(self.registry.evict(self.vh_xsd_file))
+        self.assertNotIn(schema, self.registry)
+
+    def test_invalidate(self):
+        schema = self.registry.get_schema(self.vh_xsd_file)
+        col_schema = self.registry.get_schema(self.col_xsd_file)
+
+        # vehicles.xsd includes cars.xsd and bikes.xsd
+        cars_xsd_file = self.casepath('examples/vehicles/cars.xsd')
+        self.assertEqual(self.registry.invalidate(cars_xsd_file), 1)
+        self.assertNotIn(schema, self.registry)
+        self.assertIn(col_schema, self.registry)
+        self.assertEqual(self.registry.invalidate(cars_xsd_file), 0)
+        self.assertEqual(self.registry.invalidate(), 0)
+
+    def test_invalidate_changed_sources(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            xsd_file = os.path.join(dirname, 'schema.xsd')
+            with open(xsd_file, 'w') as fp:
+                fp.write('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                         '<xs:element name="root"/></xs:schema>')
+
+            schema = self.registry.get_schema(xsd_file)
+            self.assertEqual(self.registry.invalidate(), 0)
+
+            with open(xsd_file, 'w') as fp:
+                fp.write('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                         '<xs:element name="root2"/></xs:schema>')
+
+            self.assertEqual(self.registry.invalidate(), 1)
+            other = self.registry.get_schema(xsd_file)
+            self.assertIsNot(other, schema)
+            self.assertIn('root2', other.elements)
+
+    def test_concurrent_get_schema(self):
+        schemas = []
+
+        def get_schema():
+            schemas.append(self.registry.get_schema(self.vh_xsd_file))
+
+        threads = [threading.Thread(target=get_schema) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(schemas), 8)
+        self.assertTrue(all(s is schemas[0] for s in schemas))
+        self.assertEqual(len(self.registry), 1)
+
+
+if __name__ == '__main__':
+    run_xmlschema_tests("registry.py module")
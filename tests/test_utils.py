@@ -12,6 +12,7 @@
 import sys
 import unittest
 import decimal
+import pickle
 import logging
 import warnings
 from collections import OrderedDict
@@ -34,6 +35,7 @@ from xmlschema.utils.logger import set_logging_level, logged, format_xmlschema_s
 from xmlschema.utils.decoding import raw_encode_value, raw_encode_attributes, \
     count_digits, strictly_equal
 from xmlschema.utils.misc import deprecated, will_change
+from xmlschema.utils.counters import DiskCounter, DiskIdRegistry, IdRegistry
 
 from xmlschema.testing import iter_nested_items, etree_elements_assert_equal, \
     run_xmlschema_tests
@@ -860,6 +862,90 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(ctx[0].category, DeprecationWarning)
         self.assertTrue(str(ctx[0].message).endswith(" will be removed in v2.0."))
 
+    def test_disk_counter(self):
+        counter = DiskCounter([(('a',), 1), ((1,), 2)])
+        self.assertEqual(len(counter), 2)
+        self.assertEqual(repr(counter), 'DiskCounter(<2 items>)')
+        self.assertEqual(counter[('a',)], 1)
+        self.assertEqual(counter[(decimal.Decimal('1.0'),)], 2)
+        self.assertEqual(counter[('b',)], 0)
+        self.assertIn((1.0,), counter)
+        self.assertNotIn(('b',), counter)
+        self.assertNotIn([1], counter)
+
+        self.assertEqual(counter.add(('b',)), 1)
+        self.assertEqual(counter.add(('b',)), 2)
+        counter[('a',)] = 5
+        self.assertEqual(dict(counter.items()), {('a',): 5, (1,): 2, ('b',): 2})
+
+        del counter[(1,)]
+        self.assertListEqual(list(counter), [('a',), ('b',)])
+        with self.assertRaises(KeyError):
+            del counter[(1,)]
+        with self.assertRaises(TypeError):
+            pickle.dumps(counter)
+
+        counter.clear()
+        self.assertEqual(len(counter), 0)
+        counter.close()
+
+    def test_id_registry(self):
+        registry = IdRegistry()
+        self.assertEqual(repr(registry), 'IdRegistry(<0 items>)')
+        registry.add_ref('a')
+        registry.add_ref('b')
+        registry.add_ref('a')
+        self.assertTrue(registry.add_id('b'))
+        self.assertFalse(registry.add_id('b'))
+        registry.add_ref('b')
+        self.assertIn('b', registry)
+        self.assertNotIn('a', registry)
+        self.assertEqual(len(registry), 2)
+        self.assertListEqual(list(registry.iter_unresolved()), ['a'])
+        self.assertIsNone(registry.disk)
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+
+        registry = IdRegistry(limit=2)
+        registry.add_ref('c')
+        registry.add_ref('a')
+        self.assertTrue(registry.add_id('b'))
+        self.assertIsInstance(registry.disk, DiskIdRegistry)
+        self.assertEqual(len(registry.ids) + len(registry.refs), 0)
+        self.assertTrue(registry.add_id('a'))
+        self.assertFalse(registry.add_id('b'))
+        registry.add_ref('d')
+        registry.add_ref('b')
+        self.assertIn('b', registry)
+        self.assertEqual(len(registry), 4)
+        self.assertListEqual(list(registry.iter_unresolved()), ['c', 'd'])
+
+        registry.clear()
+        self.assertIsNone(registry.disk)
+        self.assertEqual(len(registry), 0)
+
+    def test_disk_id_registry(self):
+        registry = DiskIdRegistry(ids=['a'], refs=['c', 'b'])
+        self.assertEqual(repr(registry), 'DiskIdRegistry(<3 items>)')
+        self.assertIn('a', registry)
+        self.assertNotIn('b', registry)
+        self.assertNotIn(1, registry)
+
+        self.assertFalse(registry.add_id('a'))
+        self.assertTrue(registry.add_id('b'))
+        registry.add_ref('a')
+        registry.add_ref('d')
+        registry.add_ref('c')
+        self.assertEqual(len(registry), 4)
+        self.assertListEqual(list(registry.iter_unresolved()), ['c', 'd'])
+        with self.assertRaises(TypeError):
+            pickle.dumps(registry)
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        registry.close()
+
 
 if __name__ == '__main__':
     run_xmlschema_tests('utils')
@@ -20,6 +20,7 @@ from elementpath import XPath1Parser, XPath2Parser, Selector, LazyElementNode
 from xmlschema import XMLSchema10, XMLSchema11
 from xmlschema.names import XSD_NAMESPACE
 from xmlschema.xpath import XMLSchemaProxy, XPathElement, split_path, ElementSelector
+from xmlschema.xpath.mixin import parse_find_path
 from xmlschema.validators import XsdAtomic, XsdAtomicRestriction
 
 CASES_DIR = os.path.join(os.path.dirname(__file__), 'test_cases/')
@@ -302,6 +303,21 @@ class XMLSchemaXPathTest(unittest.TestCase):
         self.assertIsNotNone(bike)
         self.assertListEqual(list(self.xs1.iterfind("/(vh:vehicles/*/*)")), [car, bike])
 
+    def test_find_path_tokens_cache(self):
+        parse_find_path.cache_clear()
+        car = self.xs1.find('//vh:car')
+        self.assertIs(self.xs1.find('//vh:car'), car)
+        self.assertListEqual(self.xs1.findall('//vh:car'), [car])
+        self.assertListEqual(list(self.xs1.iterfind('//vh:car')), [car])
+        self.assertEqual(parse_find_path.cache_info().misses, 1)
+        self.assertEqual(parse_find_path.cache_info().hits, 3)
+
+        namespaces = {'': self.xs1.target_namespace}
+        self.assertIs(self.xs1.find('//car', namespaces), car)
+        self.assertIs(self.xs1.elements['vehicles'].find('cars/car', namespaces), car)
+        self.assertIsNone(self.xs1.elements['vehicles'].find('//car', {}))
+        self.assertEqual(parse_find_path.cache_info().misses, 4)
+
     def test_iter(self):
         xsd_element = self.xs1.elements['vehicles']
         descendants = list(xsd_element.iter())
@@ -13,6 +13,7 @@ import os
 import pathlib
 import decimal
 from textwrap import dedent
+from unittest.mock import patch
 from xml.etree import ElementTree
 
 try:
@@ -25,6 +26,7 @@ from xmlschema import XMLSchema10, XMLSchemaValidationError, XMLSchemaStopValida
     XMLSchemaChildrenValidationError
 
 from xmlschema.validators import XMLSchema11, ValidationContext
+from xmlschema.validators.exceptions import XMLSchemaValidationFailure
 from xmlschema.testing import XsdValidatorTestCase
 from xmlschema import DataElement, XMLResource
 from xmlschema.converters import XMLSchemaConverter, JsonMLConverter
@@ -103,6 +105,61 @@ class TestValidationContext(unittest.TestCase):
         self.assertIsNone(error.obj)
         self.assertEqual(context.validation_error('lax', self.schema, error, obj=10).obj, 10)
 
+    def test_fail_fast_validation_error(self):
+        elem = ElementTree.XML('<foo/>')
+        context = ValidationContext(source=XMLResource(elem), fail_fast=True)
+
+        with self.assertRaises(XMLSchemaValidationFailure):
+            context.validation_error('lax', self.schema, 'Test error', obj=elem)
+        with self.assertRaises(XMLSchemaValidationFailure):
+            context.missing_element_error('lax', self.schema, elem)
+        with self.assertRaises(XMLSchemaValidationError):
+            context.validation_error('strict', self.schema, 'Test error', obj=elem)
+
+        self.assertIsInstance(context.validation_error('skip', self.schema, 'Test error'),
+                              XMLSchemaValidationError)
+        self.assertListEqual(context.errors, [])
+
+    def test_max_errors_validation_error(self):
+        elem = ElementTree.XML('<foo/>')
+        context = ValidationContext(source=XMLResource(elem), max_errors=2)
+        self.assertFalse(context.max_errors_exceeded)
+
+        context.validation_error('lax', self.schema, 'Test error 1', obj=elem)
+        context.validation_error('skip', self.schema, 'Test error 2', obj=elem)
+        context.validation_error('lax', self.schema, 'Test error 3', obj=elem)
+        self.assertFalse(context.max_errors_exceeded)
+
+        with self.assertRaises(XMLSchemaStopValidation):
+            context.validation_error('lax', self.schema, 'Test error 4', obj=elem)
+        self.assertTrue(context.max_errors_exceeded)
+        self.assertEqual(len(context.errors), 2)
+
+        context.clear()
+        self.assertFalse(context.max_errors_exceeded)
+
+        with self.assertRaises(ValueError):
+            ValidationContext(source=XMLResource(elem), max_errors=0)
+
+    def test_aggregate_errors(self):
+        elem = ElementTree.XML('<foo/>')
+        context = ValidationContext(source=XMLResource(elem), aggregate_errors=2)
+
+        for _ in range(5):
+            context.validation_error('lax', self.schema, 'Test error 1', obj=elem)
+        context.validation_error('lax', self.schema.maps, 'Test error 2', obj=elem)
+        context.validation_error('skip', self.schema, 'Test error 3', obj=elem)
+
+        self.assertEqual(len(context.errors), 3)
+        self.assertListEqual([e.occurrences for e in context.errors], [5, 1, 1])
+        self.assertEqual(len(context.error_groups), 2)
+
+        context.clear()
+        self.assertEqual(len(context.error_groups), 0)
+
+        with self.assertRaises(ValueError):
+            ValidationContext(source=XMLResource(elem), aggregate_errors=0)
+
 
 class TestValidationMixin(unittest.TestCase):
 
@@ -111,6 +168,15 @@ class TestValidationMixin(unittest.TestCase):
         xsd_file = os.path.join(CASES_DIR, 'examples/vehicles/vehicles.xsd')
         cls.schema = XMLSchema10(xsd_file)
 
+    def test_is_valid(self):
+        xml_file = os.path.join(CASES_DIR, 'examples/vehicles/vehicles.xml')
+        root = ElementTree.parse(xml_file).getroot()
+        self.assertTrue(self.schema.elements['vehicles'].is_valid(root))
+
+        xml_file = os.path.join(CASES_DIR, 'examples/vehicles/vehicles-1_error.xml')
+        root = ElementTree.parse(xml_file).getroot()
+        self.assertFalse(self.schema.elements['vehicles'].is_valid(root))
+
     def test_validate(self):
         xml_file = os.path.join(CASES_DIR, 'examples/vehicles/vehicles.xml')
         root = ElementTree.parse(xml_file).getroot()
@@ -238,6 +304,167 @@ class TestValidation(XsdValidatorTestCase):
         vh_2_file = self.casepath('examples/vehicles/vehicles-2_errors.xml')
         self.assertFalse(xmlschema.is_valid(vh_2_file))
 
+    def test_is_valid_stops_at_first_error(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="a" type="xs:int" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>"""))
+
+        visited = []
+
+        def extra_validator(elem, xsd_element):
+            visited.append(elem.text)
+
+        xml_data = '<root><a>1</a><a>x</a><a>y</a><a>3</a></root>'
+        self.assertFalse(schema.is_valid(xml_data, extra_validator=extra_validator))
+        self.assertListEqual(visited, ['1'])
+
+        visited.clear()
+        self.assertEqual(len(list(schema.iter_errors(xml_data,
+                                                     extra_validator=extra_validator))), 2)
+        self.assertListEqual(visited, ['1', 'x', 'y', '3', None])
+
+        self.assertTrue(schema.is_valid('<root><a>1</a><a>2</a></root>'))
+        self.assertFalse(schema.is_valid('<root/>'))
+        self.assertFalse(schema.is_valid('<unknown/>'))
+        self.assertFalse(schema.is_valid('<root><a>1</a></root>', path='unknown',
+                                         allow_empty=False))
+
+    def test_max_errors(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="a" type="xs:int" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>"""))
+
+        visited = []
+
+        def extra_validator(elem, xsd_element):
+            visited.append(elem.text)
+
+        xml_data = '<root><a>x</a><a>2</a><a>y</a><a>z</a><a>5</a></root>'
+        errors = list(schema.iter_errors(xml_data, max_errors=2,
+                                         extra_validator=extra_validator))
+        self.assertListEqual([e.obj for e in errors], ['x', 'y'])
+        self.assertListEqual(visited, ['x', '2', 'y'])
+
+        for max_errors in (3, 4):
+            errors = list(schema.iter_errors(xml_data, max_errors=max_errors))
+            self.assertEqual(len(errors), 3)
+
+        resource = XMLResource(xml_data, lazy=True)
+        self.assertEqual(len(list(schema.iter_errors(resource, max_errors=1))), 1)
+        self.assertEqual(len(list(xmlschema.iter_errors(xml_data, schema, max_errors=1))), 1)
+
+        data, errors = schema.decode(xml_data, validation='lax', max_errors=3)
+        self.assertEqual(data, {'a': [None, 2, None, None, 5]})
+        self.assertEqual(len(errors), 3)
+
+        data, errors = schema.decode(xml_data, validation='lax', max_errors=2)
+        self.assertIsNone(data)
+        self.assertEqual(len(errors), 2)
+
+        root = ElementTree.XML(xml_data)
+        data, errors = schema.elements['root'].decode(root, validation='lax', max_errors=1)
+        self.assertIsNone(data)
+        self.assertEqual(len(errors), 1)
+
+        with self.assertRaises(XMLSchemaValidationError):
+            schema.decode(xml_data, max_errors=1)
+
+    def test_aggregate_errors(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="a" maxOccurs="unbounded">
+                                <xs:simpleType>
+                                    <xs:restriction base="xs:int">
+                                        <xs:maxInclusive value="10"/>
+                                    </xs:restriction>
+                                </xs:simpleType>
+                            </xs:element>
+                            <xs:element name="b" type="xs:int" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>"""))
+
+        xml_data = '<root>{}{}{}</root>'.format('<a>20</a>' * 10, '<b>x</b>' * 3, '<c/>')
+        self.assertEqual(len(list(schema.iter_errors(xml_data))), 14)
+
+        errors = list(schema.iter_errors(xml_data, aggregate_errors=2))
+        self.assertListEqual([e.occurrences for e in errors], [10, 1, 3, 1, 1])
+        self.assertListEqual([e.obj for e in errors[:4]], [20, 20, 'x', 'x'])
+        self.assertIn('Occurrences: 10', str(errors[0]))
+        self.assertNotIn('Occurrences:', str(errors[1]))
+
+        resource = XMLResource(xml_data, lazy=True)
+        errors = list(schema.iter_errors(resource, aggregate_errors=1))
+        self.assertListEqual([e.occurrences for e in errors], [10, 3, 1])
+        errors = list(xmlschema.iter_errors(xml_data, schema, aggregate_errors=1))
+        self.assertListEqual([e.occurrences for e in errors], [10, 3, 1])
+
+        data, errors = schema.decode(xml_data, validation='lax', aggregate_errors=1)
+        self.assertEqual(len(data['a']), 10)
+        self.assertListEqual([e.occurrences for e in errors], [10, 3, 1])
+
+        errors = list(schema.iter_errors(xml_data, aggregate_errors=1, max_errors=2))
+        self.assertListEqual([e.occurrences for e in errors], [10, 3])
+
+    def test_lazy_validation_ancestors(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:choice maxOccurs="unbounded">
+                            <xs:element name="a" type="itemsType"/>
+                            <xs:element name="b" type="itemsType"/>
+                        </xs:choice>
+                    </xs:complexType>
+                </xs:element>
+                <xs:complexType name="itemsType">
+                    <xs:sequence>
+                        <xs:element name="item" maxOccurs="unbounded">
+                            <xs:complexType>
+                                <xs:sequence>
+                                    <xs:element name="code" type="xs:int" maxOccurs="unbounded"/>
+                                </xs:sequence>
+                            </xs:complexType>
+                            <xs:unique name="codeUnique">
+                                <xs:selector xpath="code"/>
+                                <xs:field xpath="."/>
+                            </xs:unique>
+                        </xs:element>
+                    </xs:sequence>
+                </xs:complexType>
+            </xs:schema>"""))
+
+        xml_data = '<root>{}{}{}</root>'.format(
+            '<a><item><code>1</code><code>2</code></item><item><code>1</code></item></a>',
+            '<b><item><code>1</code><code>1</code></item><item><code>x</code></item></b>',
+            '<a><item><code>3</code><code>3</code></item></a>',
+        )
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertEqual(len(errors), 3)
+
+        resource = XMLResource(xml_data, lazy=2)
+        with patch.object(schema, 'findall', wraps=schema.findall) as findall:
+            self.assertListEqual([e.reason for e in schema.iter_errors(resource)], errors)
+        self.assertEqual(findall.call_count, 1)
+
     def test_document_iter_errors_api(self):
         self.assertListEqual(list(xmlschema.iter_errors(self.vh_xml_file)), [])
         self.assertListEqual(list(xmlschema.iter_errors(self.vh_xml_file, use_defaults=False)), [])
@@ -363,6 +590,32 @@ class TestValidation(XsdValidatorTestCase):
                 namespaces={'vh': 'http://example.com/vehicles'}
             ))
 
+    def test_schema_path_cache(self):
+        schema = self.schema_class(self.casepath('examples/vehicles/vehicles.xsd'))
+        document = ElementTree.parse(self.vh_xml_file)
+        namespaces = {'vh': 'http://example.com/vehicles'}
+
+        entries = document.findall('vh:cars/vh:car', namespaces)
+        for entry in entries:
+            self.assertTrue(schema.is_valid(
+                entry, schema_path='.//vh:cars/vh:car', namespaces=namespaces
+            ))
+
+        xsd_element = schema.get_element(entries[0].tag, './/vh:cars/vh:car', namespaces)
+        self.assertIs(xsd_element, schema.find('.//vh:cars/vh:car', namespaces))
+        self.assertIsNone(schema.get_element(entries[0].tag, './/vh:bikes', namespaces))
+
+        cache_info = schema.maps.cache.cache_info(schema._get_path_element)
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, len(entries))
+
+        schema.maps.cache.clear()
+        cache_info = schema.maps.cache.cache_info(schema._get_path_element)
+        self.assertEqual(cache_info.currsize, 0)
+        self.assertIs(
+            schema.get_element(entries[0].tag, './/vh:cars/vh:car', namespaces), xsd_element
+        )
+
     def test_issue_064(self):
         self.check_validity(self.st_schema, '<name xmlns="ns"></name>', False)
 
@@ -12,6 +12,7 @@ import pathlib
 
 from xmlschema import XMLSchemaParseError
 from xmlschema.validators import XMLSchema11
+from xmlschema.validators.validation import PLAN_DECODING, PLAN_HOOKS
 from xmlschema.testing import XsdValidatorTestCase
 
 
@@ -108,6 +109,60 @@ class TestXsdElements(XsdValidatorTestCase):
         self.assertEqual(model_group[1].value_constraint, 'alpha')
         self.assertEqual(model_group[2].value_constraint, 'beta')
 
+    def test_decode_plans(self):
+        schema = self.check_schema("""
+        <xs:element name="root">
+            <xs:complexType>
+                <xs:sequence maxOccurs="unbounded">
+                    <xs:element name="elem1" type="xs:int"/>
+                    <xs:element name="elem2" type="xs:string" default="alpha"/>
+                    <xs:element name="elem3" type="xs:decimal" fixed="1.0"/>
+                    <xs:element name="elem4" type="xs:anyType" minOccurs="0"/>
+                </xs:sequence>
+            </xs:complexType>
+        </xs:element>""")
+        model_group = schema.elements['root'].type.content
+
+        for flags in (PLAN_DECODING, 0):
+            for xsd_element in model_group[:3]:
+                plan = xsd_element.get_decode_plan(flags)
+                self.assertNotEqual(plan, xsd_element.raw_decode)
+                self.assertIs(xsd_element.get_decode_plan(flags), plan)
+
+            xsd_element = model_group[3]
+            self.assertEqual(xsd_element.get_decode_plan(flags), xsd_element.raw_decode)
+            xsd_element = model_group[0]
+            self.assertEqual(xsd_element.get_decode_plan(flags | PLAN_HOOKS),
+                             xsd_element.raw_decode)
+
+        schema.maps.cache.enabled = False
+        try:
+            xsd_element = model_group[0]
+            self.assertEqual(xsd_element.get_decode_plan(0), xsd_element.raw_decode)
+        finally:
+            schema.maps.cache.enabled = True
+
+        for xml_data in ['<root><elem1>1</elem1><elem2/><elem3/></root>',
+                         '<root><elem1>1</elem1><elem2/><elem3>1.00</elem3>'
+                         '<elem4><a/></elem4><elem1>2</elem1><elem2>beta</elem2>'
+                         '<elem3>1</elem3></root>',
+                         '<root><elem1>a</elem1><elem2><a/></elem2><elem3>2</elem3></root>',
+                         '<root xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+                         '<elem1 xsi:nil="true"/><elem2 a="1"/><elem3/></root>']:
+            errors = [(e.reason, e.path) for e in schema.iter_errors(xml_data)]
+            self.assertListEqual(
+                [(e.reason, e.path) for e in schema.iter_errors(xml_data, use_decode_plans=True)],
+                errors
+            )
+            for kwargs in ({}, {'keep_empty': True}, {'decimal_type': str}):
+                data, errors = schema.decode(xml_data, validation='lax', **kwargs)
+                plan_data, plan_errors = schema.decode(
+                    xml_data, validation='lax', use_decode_plans=True, **kwargs
+                )
+                self.assertEqual(plan_data, data)
+                self.assertListEqual([e.reason for e in plan_errors],
+                                     [e.reason for e in errors])
+
 
 class TestXsd11Elements(TestXsdElements):
 
@@ -412,6 +412,70 @@ class TestValidatorExceptions(unittest.TestCase):
             self.assertIn('Collect XMLSchemaDecodeError', ctx.output[0])
             self.assertIn('with traceback:', ctx.output[0])
 
+    def test_lazy_error_details(self):
+        schema = XMLSchema("""
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:element name="a">
+                <xs:complexType>
+                  <xs:sequence>
+                    <xs:element name="b1" type="xs:int"/>
+                  </xs:sequence>
+                  <xs:attribute name="c" type="xs:int"/>
+                </xs:complexType>
+              </xs:element>
+            </xs:schema>""")
+
+        errors = list(schema.iter_errors('<a c="x"><b1>y</b1><b2/></a>'))
+        self.assertEqual(len(errors), 3)
+        self.assertNotIn('_message', errors[0].__dict__)
+
+        self.assertEqual(errors[0].attribute, 'c')
+        self.assertEqual(errors[0]._reason, "invalid literal for int() with base 10: 'x'")
+        self.assertEqual(errors[0].reason,
+                         "attribute c='x': invalid literal for int() with base 10: 'x'")
+        self.assertEqual(errors[0].reason, errors[0]._reason)
+        self.assertTrue(errors[0].message.startswith("failed decoding 'x' with "))
+
+        self.assertIsNone(errors[1].attribute)
+        self.assertEqual(errors[1].reason, "invalid literal for int() with base 10: 'y'")
+        self.assertEqual(errors[1].path, '/a/b1')
+
+        self.assertIsInstance(errors[2], XMLSchemaChildrenValidationError)
+        self.assertIsNone(errors[2]._reason)
+        self.assertEqual(errors[2].invalid_tag, 'b2')
+        self.assertEqual(errors[2].reason, "Unexpected child with tag 'b2' at position 2.")
+        self.assertEqual(errors[2].path, '/a')
+
+        errors[2].reason = 'custom reason'
+        self.assertEqual(errors[2].reason, 'custom reason')
+
+        # Names are prefixed with the local namespace declarations in scope
+        schema = XMLSchema("""
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                targetNamespace="urn:a" elementFormDefault="qualified">
+              <xs:element name="a">
+                <xs:complexType>
+                  <xs:sequence>
+                    <xs:element name="b" maxOccurs="unbounded">
+                      <xs:complexType>
+                        <xs:sequence>
+                          <xs:element name="x" minOccurs="0"/>
+                        </xs:sequence>
+                        <xs:attribute name="c" type="xs:int" form="qualified"/>
+                      </xs:complexType>
+                    </xs:element>
+                  </xs:sequence>
+                </xs:complexType>
+              </xs:element>
+            </xs:schema>""")
+
+        xml_data = '<a xmlns="urn:a"><b xmlns:p="urn:a" p:c="x"><p:y/></b><b/></a>'
+        reasons = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertListEqual(reasons, [
+            "attribute p:c='x': invalid literal for int() with base 10: 'x'",
+            "Unexpected child with tag 'p:y' at position 1.",
+        ])
+
     @unittest.skipIf(lxml_etree is None, 'lxml is not installed ...')
     def test_sourceline__issue_456(self):
         xsd_file = CASES_DIR.joinpath('examples/vehicles/vehicles.xsd')
@@ -10,6 +10,7 @@
 #
 import unittest
 import decimal
+import pickle
 import pathlib
 from xml.etree import ElementTree
 from textwrap import dedent
@@ -1003,6 +1004,61 @@ class TestXsdFacets(unittest.TestCase):
         facet.append(ElementTree.Element(XSD_ENUMERATION, value='NaN'))
         self.assertIsNone(facet(float('nan')))
 
+    def test_enumeration_facet_lookup(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:simpleType name="enum1">
+                    <xs:restriction base="xs:decimal">
+                        <xs:enumeration value="1.0"/>
+                        <xs:enumeration value="2.5"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="enum2">
+                    <xs:restriction base="xs:string">
+                        <xs:enumeration value="1"/>
+                        <xs:enumeration value="two"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="enum3">
+                    <xs:restriction base="xs:date">
+                        <xs:enumeration value="2020-01-01"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="list1">
+                    <xs:list itemType="xs:int"/>
+                </xs:simpleType>
+                <xs:simpleType name="enum4">
+                    <xs:restriction base="list1">
+                        <xs:enumeration value="1 2"/>
+                    </xs:restriction>
+                </xs:simpleType>
+            </xs:schema>"""))
+
+        facet = schema.types['enum1'].get_facet(XSD_ENUMERATION)
+        self.assertIsNone(facet(decimal.Decimal('1')))
+        self.assertIsNone(facet(1))
+        self.assertIsNone(facet(1.0))
+        self.assertIsNone(facet(2.5))
+        self.assertRaises(XMLSchemaValidationError, facet, '1')
+        self.assertRaises(XMLSchemaValidationError, facet, decimal.Decimal('NaN'))
+
+        del facet[0]
+        self.assertRaises(XMLSchemaValidationError, facet, 1)
+        self.assertEqual(facet.enumeration, [decimal.Decimal('2.5')])
+        facet.insert(0, ElementTree.Element(XSD_ENUMERATION, value='1'))
+        self.assertIsNone(facet(1))
+        self.assertEqual(facet.enumeration, [decimal.Decimal('1'), decimal.Decimal('2.5')])
+
+        facet = schema.types['enum2'].get_facet(XSD_ENUMERATION)
+        self.assertIsNone(facet('1'))
+        self.assertRaises(XMLSchemaValidationError, facet, 1)
+        self.assertRaises(XMLSchemaValidationError, facet, 'one')
+
+        self.assertTrue(schema.types['enum3'].is_valid('2020-01-01'))
+        self.assertFalse(schema.types['enum3'].is_valid('2020-01-02'))
+        self.assertTrue(schema.types['enum4'].is_valid('1 2'))
+        self.assertFalse(schema.types['enum4'].is_valid('1'))
+
     def test_enumeration_facet_derivation(self):
         with self.assertRaises(XMLSchemaParseError) as ec:
             self.schema_class(dedent("""\
@@ -1074,6 +1130,73 @@ class TestXsdFacets(unittest.TestCase):
         self.assertIn("missing required attribute 'value'", str(schema.all_errors[0]))
         self.assertIn("unexpected meta character ']' at position 0", str(schema.all_errors[1]))
 
+    def test_compiled_pattern_facets(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:simpleType name="zipCode">
+                    <xs:restriction base="xs:string">
+                        <xs:pattern value="\\d{5}"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="countryCode">
+                    <xs:restriction base="xs:string">
+                        <xs:pattern value="[A-Z]{2}"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="anyCode">
+                    <xs:restriction base="xs:string">
+                        <xs:pattern value="[A-Z]{2}"/>
+                        <xs:pattern value="\\d{3}-\\d{4}"/>
+                        <xs:pattern value="x|y"/>
+                    </xs:restriction>
+                </xs:simpleType>
+                <xs:simpleType name="itCode">
+                    <xs:restriction base="anyCode">
+                        <xs:pattern value="IT|\\d+-\\d+"/>
+                    </xs:restriction>
+                </xs:simpleType>
+            </xs:schema>"""))
+
+        facet = schema.types['zipCode'].get_facet(XSD_PATTERN)
+        self.assertIsNone(facet('12345'))
+        self.assertIsNone(facet('\u0661\u0662\u0663\u0664\u0665'))  # Unicode decimal digits
+        for value in ('1234', '123456', '1234a', '12345\n', ''):
+            self.assertRaises(XMLSchemaValidationError, facet, value)
+        self.assertRaises(XMLSchemaValidationError, facet, 12345)
+
+        facet = schema.types['countryCode'].get_facet(XSD_PATTERN)
+        self.assertIsNone(facet('IT'))
+        for value in ('it', 'I', 'ITA', 'I1', 'IT\n'):
+            self.assertRaises(XMLSchemaValidationError, facet, value)
+
+        facet = schema.types['anyCode'].get_facet(XSD_PATTERN)
+        for value in ('IT', '123-4567', 'x', 'y'):
+            self.assertIsNone(facet(value))
+        for value in ('ITx', 'xy', '123-45678', 'x\n', ''):
+            self.assertRaises(XMLSchemaValidationError, facet, value)
+
+        # Patterns of different derivation steps must be all matched
+        xsd_type = schema.types['itCode']
+        self.assertTrue(xsd_type.is_valid('IT'))
+        self.assertTrue(xsd_type.is_valid('123-4567'))
+        self.assertFalse(xsd_type.is_valid('FR'))
+        self.assertFalse(xsd_type.is_valid('x'))
+
+        # Changes to the facets are applied to the compiled matcher
+        facet.append(ElementTree.Element(XSD_PATTERN, value='z'))
+        self.assertIsNone(facet('z'))
+        del facet[1:]
+        self.assertRaises(XMLSchemaValidationError, facet, 'x')
+        self.assertIsNone(facet('IT'))
+        facet[0] = ElementTree.Element(XSD_PATTERN, value='[a-z]+')
+        self.assertIsNone(facet('it'))
+        self.assertRaises(XMLSchemaValidationError, facet, 'IT')
+
+        # The compiled matchers are not serialized
+        facet = pickle.loads(pickle.dumps(schema)).types['zipCode'].get_facet(XSD_PATTERN)
+        self.assertIsNone(facet('00184'))
+        self.assertRaises(XMLSchemaValidationError, facet, '0018')
+
     def test_get_annotation__issue_255(self):
         schema = self.schema_class(dedent("""\
             <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
@@ -10,10 +10,13 @@
 #
 import pathlib
 import xml.etree.ElementTree as ElementTree
+from collections import Counter
+from decimal import Decimal
 
 from xmlschema import XMLSchemaParseError, XMLSchemaValidationError
 from xmlschema.validators import XMLSchema11
 from xmlschema.validators.identities import IdentityCounter, KeyrefCounter, FieldValueSelector
+from xmlschema.utils.counters import DiskCounter
 from xmlschema.testing import XsdValidatorTestCase
 
 
@@ -375,6 +378,103 @@ class TestXsdIdentities(XsdValidatorTestCase):
         self.assertIn("value ('3',) not found", str(errors[1]))
         self.assertIn("(2 times)", str(errors[1]))
 
+    def test_identity_counter_limit(self):
+        schema = self.check_schema("""
+            <xs:element name="primary_key" type="xs:string">
+              <xs:key name="key1">
+                <xs:selector xpath="."/>
+                <xs:field xpath="."/>
+              </xs:key>
+              <xs:keyref name="keyref1" refer="key1">
+                <xs:selector xpath="."/>
+                <xs:field xpath="."/>
+              </xs:keyref>
+            </xs:element>""")
+
+        elem = ElementTree.XML('<primary_key>3</primary_key>')
+        key_counter = IdentityCounter(schema.identities['key1'], elem, limit=2)
+        self.assertIsNone(key_counter.increase(('1',)))
+        self.assertIsNone(key_counter.increase((Decimal('2.0'),)))
+        self.assertIsInstance(key_counter.counter, Counter)
+        self.assertIsNone(key_counter.increase('4'))
+        self.assertIsInstance(key_counter.counter, DiskCounter)
+        self.assertEqual(repr(key_counter), 'IdentityDiskCounter(<3 items>)')
+
+        with self.assertRaises(ValueError) as ctx:
+            key_counter.increase(('1',))
+        self.assertIn("duplicated value ('1',)", str(ctx.exception))
+        with self.assertRaises(ValueError):
+            key_counter.increase((2,))
+
+        counter = KeyrefCounter(schema.identities['keyref1'], elem, limit=1)
+        self.assertIsNone(counter.increase(('1',)))
+        self.assertIsNone(counter.increase((Decimal('2'),)))
+        self.assertIsNone(counter.increase(('3',)))
+        self.assertIsNone(counter.increase(('3',)))
+        self.assertIsNone(counter.increase(('4',)))
+        self.assertIsInstance(counter.counter, DiskCounter)
+
+        identities = {schema.identities['key1']: key_counter}
+        errors = list(counter.iter_errors(identities))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("value ('3',) not found", str(errors[0]))
+        self.assertIn("(2 times)", str(errors[0]))
+
+        other_counter = IdentityCounter(schema.identities['key1'], elem)
+        other_counter.increase(('1',))
+        other_counter.increase(('5',))
+        key_counter.update(other_counter)
+        self.assertEqual(key_counter.counter[('1',)], 3)
+        self.assertEqual(key_counter.counter[('5',)], 1)
+
+        key_counter.reset(elem)
+        self.assertEqual(key_counter.counter, Counter())
+        other_counter.increase(('6',))
+        key_counter.update(other_counter)
+        self.assertIsInstance(key_counter.counter, DiskCounter)
+
+    def test_identity_limit(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+                <xs:complexType>
+                    <xs:sequence>
+                        <xs:element name="item" maxOccurs="unbounded">
+                            <xs:complexType>
+                                <xs:attribute name="id" type="xs:int"/>
+                                <xs:attribute name="ref" type="xs:int"/>
+                            </xs:complexType>
+                        </xs:element>
+                    </xs:sequence>
+                </xs:complexType>
+                <xs:key name="key1">
+                    <xs:selector xpath="item"/>
+                    <xs:field xpath="@id"/>
+                </xs:key>
+                <xs:keyref name="keyref1" refer="key1">
+                    <xs:selector xpath="item"/>
+                    <xs:field xpath="@ref"/>
+                </xs:keyref>
+            </xs:element>""")
+
+        xml_data = '<root>{}</root>'.format(
+            ''.join(f'<item id="{k}" ref="{k // 2 + 1}"/>' for k in range(1, 21))
+        )
+        self.assertTrue(schema.is_valid(xml_data))
+        self.assertTrue(schema.is_valid(xml_data, identity_limit=5))
+        self.assertIsNone(schema.validate(xml_data, identity_limit=5))
+
+        xml_data = xml_data.replace('id="3"', 'id="04"').replace('ref="11"', 'ref="21"')
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertEqual(len(errors), 3)
+        self.assertListEqual(
+            [e.reason for e in schema.iter_errors(xml_data, identity_limit=5)], errors
+        )
+        _data, errors = schema.decode(xml_data, validation='lax', identity_limit=5)
+        self.assertEqual(len(errors), 3)
+
+        with self.assertRaises(ValueError):
+            schema.is_valid(xml_data, identity_limit=0)
+
     def test_key_multiple_values__issue_418(self):
         xsd_file = self.casepath('issues/issue_418/issue_418.xsd')
         schema = self.schema_class(xsd_file)
@@ -387,6 +487,150 @@ class TestXsdIdentities(XsdValidatorTestCase):
             schema.validate(xml_file)
         self.assertIn("field selects multiple values", str(ctx.exception))
 
+    def test_compiled_paths(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+                <xs:complexType>
+                    <xs:sequence>
+                        <xs:element name="item" maxOccurs="unbounded">
+                            <xs:complexType>
+                                <xs:sequence>
+                                    <xs:element name="code" type="xs:int"/>
+                                    <xs:element name="any" type="xs:anyType" minOccurs="0"/>
+                                </xs:sequence>
+                                <xs:attribute name="id" type="xs:int"/>
+                                <xs:attribute name="group" type="xs:string" default="g0"/>
+                            </xs:complexType>
+                        </xs:element>
+                    </xs:sequence>
+                </xs:complexType>
+                <xs:key name="key1">
+                    <xs:selector xpath="item"/>
+                    <xs:field xpath="@id"/>
+                    <xs:field xpath="@group"/>
+                </xs:key>
+                <xs:unique name="unique1">
+                    <xs:selector xpath=".//item|./item"/>
+                    <xs:field xpath="./code"/>
+                </xs:unique>
+                <xs:unique name="unique2">
+                    <xs:selector xpath="*"/>
+                    <xs:field xpath="any"/>
+                </xs:unique>
+            </xs:element>""")
+
+        selector = schema.identities['key1'].selector
+        self.assertEqual(selector.steps, [(False, ('item',))])
+        self.assertEqual(schema.identities['unique1'].selector.steps,
+                         [(True, ('item',)), (False, ('item',))])
+        self.assertEqual(schema.identities['key1'].fields[0].steps, [(False, ('@id',))])
+
+        elem = ElementTree.XML('<root><item/><!-- c --><item/></root>')
+        self.assertListEqual(list(selector.select_elements(elem)), list(elem))
+
+        xsd_element = schema.find('root/item')
+        selectors = schema.identities['key1'].elements[xsd_element]
+        self.assertEqual([s.steps for s in selectors], [('@id',), ('@group',)])
+        selectors = schema.identities['unique1'].elements[xsd_element]
+        self.assertEqual(selectors[0].steps, ('code',))
+        selectors = schema.identities['unique2'].elements[xsd_element]
+        self.assertIsNone(selectors[0].steps)  # not an atomic type
+
+        self.assertTrue(schema.is_valid(
+            '<root><item id="1"><code>1</code></item>'
+            '<item id="1" group="g1"><code>02</code></item></root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            '<root><item id="1"><code>1</code></item>'
+            '<item id="01" group="g0"><code>2</code></item></root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            '<root><item id="1"><code>1</code></item>'
+            '<item id="2"><code> 01 </code></item></root>'
+        ))
+
+    def test_compiled_paths_list_types(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+                <xs:complexType>
+                    <xs:sequence>
+                        <xs:element name="item" maxOccurs="unbounded">
+                            <xs:complexType>
+                                <xs:sequence>
+                                    <xs:element name="k" type="xs:NMTOKENS"/>
+                                </xs:sequence>
+                                <xs:attribute name="tokens" type="xs:NMTOKENS"/>
+                            </xs:complexType>
+                        </xs:element>
+                    </xs:sequence>
+                </xs:complexType>
+                <xs:key name="key1">
+                    <xs:selector xpath="item"/>
+                    <xs:field xpath="k"/>
+                </xs:key>
+                <xs:unique name="unique1">
+                    <xs:selector xpath="item"/>
+                    <xs:field xpath="@tokens"/>
+                </xs:unique>
+            </xs:element>""")
+
+        xsd_element = schema.find('root/item')
+        self.assertIsNone(schema.identities['key1'].elements[xsd_element][0].steps)
+        self.assertIsNone(schema.identities['unique1'].elements[xsd_element][0].steps)
+
+        self.assertTrue(schema.is_valid(
+            '<root><item tokens="a b"><k>a</k></item>'
+            '<item tokens="a"><k>a b</k></item></root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            '<root><item><k>a</k></item><item><k> a </k></item></root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            '<root><item tokens="a b"><k>a</k></item>'
+            '<item tokens="a  b"><k>b</k></item></root>'
+        ))
+
+    def test_compiled_paths_with_prefixes(self):
+        schema = self.check_schema("""
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                    xmlns:tns="http://xmlschema.test/ns"
+                    targetNamespace="http://xmlschema.test/ns">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element ref="tns:item" maxOccurs="unbounded"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                    <xs:key name="key1">
+                        <xs:selector xpath="child::tns:*"/>
+                        <xs:field xpath="attribute::id"/>
+                    </xs:key>
+                    <xs:key name="key2">
+                        <xs:selector xpath="unknown:item"/>
+                        <xs:field xpath="@id"/>
+                    </xs:key>
+                </xs:element>
+                <xs:element name="item">
+                    <xs:complexType>
+                        <xs:attribute name="id" type="xs:string"/>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>""", validation='lax')
+
+        key1 = schema.identities['key1']
+        self.assertEqual(key1.selector.steps, [(False, ('{http://xmlschema.test/ns}*',))])
+        self.assertEqual(key1.fields[0].steps, [(False, ('@id',))])
+        self.assertIsNone(schema.identities['key2'].selector.steps)
+
+        self.assertTrue(schema.is_valid(
+            '<tns:root xmlns:tns="http://xmlschema.test/ns">'
+            '<tns:item id="a"/><tns:item id="b"/></tns:root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            '<tns:root xmlns:tns="http://xmlschema.test/ns">'
+            '<tns:item id="a"/><tns:item id="a"/></tns:root>'
+        ))
+
 
 class TestXsd11Identities(TestXsdIdentities):
 
@@ -12,17 +12,19 @@
 import unittest
 import copy
 import pathlib
+import random
 from itertools import zip_longest
 
 from textwrap import dedent
 from typing import Any, Union, List, Optional
 
-from xmlschema import XMLSchema11
+from xmlschema import XMLSchema11, limits
 from xmlschema.exceptions import XMLSchemaValueError
 from xmlschema.validators.exceptions import XMLSchemaValidationError, XMLSchemaModelError
 from xmlschema.validators.particles import ParticleMixin
 from xmlschema.validators.models import distinguishable_paths, ModelVisitor, \
-    sort_content, iter_collapsed_content
+    ModelAutomaton, check_model, check_model_automaton, compile_model, \
+    sort_content, iter_collapsed_content, _check_follow_sets
 from xmlschema.validators.groups import XsdGroup
 from xmlschema.validators.elements import XsdElement
 from xmlschema.testing import XsdValidatorTestCase
@@ -1358,6 +1360,341 @@ class TestModelValidation(XsdValidatorTestCase):
         self.assertIs(model.element, a)
         self.assertListEqual(list(model.advance_until(b.name)), [])
 
+    def test_compile_model(self):
+        schema = self.check_schema("""
+            <xs:element name="a"/>
+            <xs:element name="b"/>
+            <xs:element name="c"/>
+            <xs:complexType name="aType">
+                <xs:sequence>
+                    <xs:element ref="a" maxOccurs="unbounded"/>
+                    <xs:choice minOccurs="0" maxOccurs="2">
+                        <xs:element ref="b"/>
+                        <xs:element ref="c"/>
+                    </xs:choice>
+                </xs:sequence>
+            </xs:complexType>""")
+
+        group = schema.types['aType'].content
+        a, b, c = group[0], group[1][0], group[1][1]
+
+        automaton = compile_model(group)
+        self.assertIsInstance(automaton, ModelAutomaton)
+        self.assertIs(automaton.root, group)
+        self.assertTrue(repr(automaton).startswith('ModelAutomaton(root='))
+
+        self.assertIsNone(automaton.match([]))
+        self.assertListEqual(automaton.match(['a']), [(a, a)])
+        self.assertListEqual(automaton.match(['a', 'a', 'c', 'b']),
+                             [(a, a), (a, a), (c, c), (b, b)])
+        self.assertIsNone(automaton.match(['b']))
+        self.assertIsNone(automaton.match(['a', 'b', 'b', 'b']))
+        self.assertIsNone(automaton.match(['a', 'd']))
+
+        self.assertIs(group.automaton, group.get_automaton())
+        self.assertListEqual(group.get_automaton().match(['a', 'b']), [(a, a), (b, b)])
+
+        max_model_states = limits.MAX_MODEL_STATES
+        try:
+            limits.MAX_MODEL_STATES = 3
+            self.assertIsNone(compile_model(group))
+            limits.MAX_MODEL_STATES = 0
+            self.assertIsNone(compile_model(group))
+        finally:
+            limits.MAX_MODEL_STATES = max_model_states
+
+        with self.assertRaises(ValueError):
+            limits.MAX_MODEL_STATES = -1
+        self.assertEqual(limits.MAX_MODEL_STATES, max_model_states)
+
+    def test_compiled_model_fallback(self):
+        schema = self.schema_class(
+            """<?xml version="1.0" encoding="UTF-8"?>
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="a" minOccurs="0" maxOccurs="unbounded"/>
+                            <xs:choice minOccurs="2" maxOccurs="2">
+                                <xs:element name="b" minOccurs="0"/>
+                            </xs:choice>
+                            <xs:element name="c" minOccurs="2" maxOccurs="3"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>
+            """)
+
+        group = schema.elements['root'].type.content
+        self.assertIsNone(compile_model(group))  # an emptiable choice repeated twice
+        self.assertIsNone(group.get_automaton())
+
+        schema = self.schema_class(
+            """<?xml version="1.0" encoding="UTF-8"?>
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="root">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="a" minOccurs="0" maxOccurs="unbounded"/>
+                            <xs:element name="c" minOccurs="2" maxOccurs="3"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:schema>
+            """)
+        self.assertIsNotNone(schema.elements['root'].type.content.get_automaton())
+
+        self.assertIsNone(schema.validate('<root><c/><c/></root>'))
+        self.assertIsNone(schema.validate('<root><a/><a/><c/><c/><c/></root>'))
+        self.assertEqual(schema.decode('<root><a/><c/><c/></root>'),
+                         {'a': [None], 'c': [None, None]})
+        self.assertEqual(schema.encode({'a': [None], 'c': [None, None]}, path='root').tag,
+                         'root')
+
+        errors = list(schema.iter_errors('<root><a/><c/></root>'))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("The content of element 'root' is not complete", str(errors[0]))
+
+        max_model_states = limits.MAX_MODEL_STATES
+        try:
+            limits.MAX_MODEL_STATES = 0
+            schema.maps.cache.clear()
+            self.assertIsNone(schema.elements['root'].type.content.get_automaton())
+            self.assertEqual(
+                [(e.reason, e.path) for e in schema.iter_errors('<root><a/><c/></root>')],
+                [(e.reason, e.path) for e in errors]
+            )
+        finally:
+            limits.MAX_MODEL_STATES = max_model_states
+            schema.maps.cache.clear()
+
+        errors = list(schema.iter_errors('<root><c/><a/><c/></root>'))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Unexpected child with tag 'a' at position 2", str(errors[0]))
+
+    def test_compiled_model_with_competing_occurrences(self):
+        # The model visitor counts occurrences greedily, so these models
+        # would accept more contents if compiled into automata.
+        models = [
+            ('<xs:sequence maxOccurs="unbounded">'
+             '<xs:element name="c" minOccurs="2" maxOccurs="3"/></xs:sequence>',
+             '<root><c/><c/><c/><c/></root>'),
+            ('<xs:sequence minOccurs="2" maxOccurs="2">'
+             '<xs:any namespace="##other" processContents="lax" '
+             'minOccurs="0" maxOccurs="unbounded"/>'
+             '<xs:element name="c" maxOccurs="unbounded"/></xs:sequence>',
+             '<root><x xmlns="http://xmlschema.test/ns"/><c/><c/></root>'),
+        ]
+        for model, xml_data in models:
+            schema = self.schema_class(dedent(f"""\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                    <xs:element name="root">
+                        <xs:complexType>{model}</xs:complexType>
+                    </xs:element>
+                </xs:schema>"""))
+            self.assertIsNone(compile_model(schema.elements['root'].type.content))
+            self.assertFalse(schema.is_valid(xml_data))
+            self.assertFalse(self.schema_class(schema.source.text, use_cache=False)
+                             .is_valid(xml_data))
+
+    def test_compiled_models_match_model_visitor(self):
+        rng = random.Random(1)
+
+        def get_occurs():
+            min_occurs = rng.choice([0, 0, 1, 1, 2])
+            max_occurs = rng.choice([min_occurs, min_occurs + 1, min_occurs + 2,
+                                     max(min_occurs, 1), 'unbounded'])
+            return f' minOccurs="{min_occurs}" maxOccurs="{max_occurs}"'
+
+        def get_particle(depth):
+            value = rng.random()
+            if value < 0.08:
+                return f'<xs:any namespace="##other" processContents="lax"{get_occurs()}/>'
+            elif depth > 2 or value < 0.5:
+                return f'<xs:element ref="{rng.choice("abc")}"{get_occurs()}/>'
+
+            model = rng.choice(['sequence', 'choice'])
+            items = ''.join(get_particle(depth + 1) for _ in range(rng.randint(1, 3)))
+            return f'<xs:{model}{get_occurs()}>{items}</xs:{model}>'
+
+        def visitor_match(group, tags):
+            model = ModelVisitor(group)
+            matches = []
+            for tag in tags:
+                while model.element is not None:
+                    xsd_element = model.match_element(tag)
+                    if xsd_element is None:
+                        if any(True for _ in model.advance(False)):
+                            return None
+                        continue
+                    matches.append((xsd_element, model.element))
+                    if any(True for _ in model.advance(True)):
+                        return None
+                    break
+                else:
+                    return None
+            return None if any(True for _ in model.stop()) else matches
+
+        compiled = 0
+        for _ in range(400):
+            schema = self.schema_class(dedent(f"""\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                    <xs:element name="a"/>
+                    <xs:element name="b"/>
+                    <xs:element name="c"/>
+                    <xs:complexType name="aType">{get_particle(0)}</xs:complexType>
+                </xs:schema>"""), validation='lax')
+            if schema.all_errors or not isinstance(schema.types['aType'].content, XsdGroup):
+                continue
+
+            group = schema.types['aType'].content
+            automaton = compile_model(group)
+            if automaton is None:
+                continue
+
+            compiled += 1
+            for _ in range(20):
+                # Random walks on the automaton, plus a random tail
+                state, tags = 0, []
+                while len(tags) < 10:
+                    transitions = list(automaton.transitions[state].items())
+                    if not transitions or state in automaton.finals and rng.random() < 0.25:
+                        break
+                    particle, state = rng.choice(transitions)
+                    tags.append(particle.name or '{http://xmlschema.test/ns}x')
+                if rng.random() < 0.3:
+                    tags.append(rng.choice('abc'))
+
+                matched = automaton.match(tags)
+                if matched is not None:
+                    self.assertEqual(matched, visitor_match(group, tags),
+                                     msg=f"{group.tostring()} with {tags}")
+
+        self.assertGreater(compiled, 20)
+
+    def test_check_model_automaton(self):
+        models = [
+            # Valid models
+            '<xs:sequence><xs:element ref="a"/><xs:element ref="b"/></xs:sequence>',
+            '<xs:sequence><xs:element ref="a" minOccurs="2" maxOccurs="2"/>'
+            '<xs:element ref="a"/></xs:sequence>',
+            '<xs:sequence><xs:sequence minOccurs="0" maxOccurs="unbounded">'
+            '<xs:element ref="b"/><xs:element ref="a"/></xs:sequence>'
+            '<xs:element ref="a" minOccurs="0"/></xs:sequence>',
+            '<xs:choice maxOccurs="unbounded"><xs:element ref="a"/>'
+            '<xs:sequence><xs:element ref="b" minOccurs="0"/><xs:element ref="c"/>'
+            '</xs:sequence></xs:choice>',
+            # Invalid models
+            '<xs:choice><xs:element ref="a"/><xs:element ref="a"/></xs:choice>',
+            '<xs:sequence><xs:element ref="a" minOccurs="1" maxOccurs="2"/>'
+            '<xs:element ref="a"/></xs:sequence>',
+            '<xs:sequence><xs:sequence minOccurs="0" maxOccurs="unbounded">'
+            '<xs:element ref="a"/><xs:element ref="b"/></xs:sequence>'
+            '<xs:element ref="a" minOccurs="0"/></xs:sequence>',
+            '<xs:sequence><xs:element ref="a" minOccurs="0"/>'
+            '<xs:any processContents="lax"/></xs:sequence>',
+        ]
+
+        for k, model in enumerate(models):
+            schema = self.schema_class(dedent(f"""\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                    <xs:element name="a"/>
+                    <xs:element name="b"/>
+                    <xs:element name="c"/>
+                    <xs:complexType name="aType">{model}</xs:complexType>
+                </xs:schema>"""), validation='skip')
+            group = schema.types['aType'].content
+
+            try:
+                check_model(group)
+            except XMLSchemaModelError as err:
+                self.assertGreaterEqual(k, 4)
+                with self.assertRaises(XMLSchemaModelError) as ctx:
+                    check_model_automaton(group)
+                if isinstance(group[-1], XsdElement) or self.schema_class.XSD_VERSION == '1.0':
+                    self.assertEqual(ctx.exception.message, err.message)
+            else:
+                self.assertIsNone(check_model_automaton(group))
+
+    def test_check_model_automaton_differences(self):
+        upa_msg = "Unique Particle Attribution violation between {!r} and {!r}"
+
+        def get_group(model):
+            schema = self.schema_class(dedent(f"""\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                    <xs:element name="a"/>
+                    <xs:element name="b"/>
+                    <xs:element name="c"/>
+                    <xs:complexType name="aType">{model}</xs:complexType>
+                </xs:schema>"""), validation='skip')
+            return schema.types['aType'].content
+
+        # A UPA violation (b b) missed by check_model()
+        group = get_group(
+            '<xs:sequence><xs:element ref="c" minOccurs="0"/><xs:sequence maxOccurs="2">'
+            '<xs:element ref="b"/><xs:element ref="b" minOccurs="0"/>'
+            '<xs:element ref="c" minOccurs="0"/></xs:sequence></xs:sequence>'
+        )
+        self.assertIsNone(check_model(group))
+        with self.assertRaises(XMLSchemaModelError) as ctx:
+            check_model_automaton(group)
+        self.assertEqual(ctx.exception.message, upa_msg.format(group[1][0], group[1][1]))
+
+        # A deterministic model rejected by check_model()
+        group = get_group(
+            '<xs:sequence><xs:sequence><xs:sequence minOccurs="0">'
+            '<xs:element ref="b" minOccurs="2" maxOccurs="3"/></xs:sequence>'
+            '<xs:element ref="c"/></xs:sequence><xs:choice><xs:element ref="c"/>'
+            '<xs:element ref="b"/></xs:choice></xs:sequence>'
+        )
+        with self.assertRaises(XMLSchemaModelError) as ctx:
+            check_model(group)
+        self.assertEqual(ctx.exception.message, upa_msg.format(group[0][0][0], group[1][1]))
+        self.assertIsNone(check_model_automaton(group))
+
+        # A model with more violations is reported like check_model()
+        group = get_group(
+            '<xs:sequence maxOccurs="unbounded"><xs:element ref="c" minOccurs="0"/>'
+            '<xs:sequence minOccurs="2" maxOccurs="2"><xs:element ref="b"/>'
+            '<xs:element ref="b" minOccurs="0"/><xs:element ref="c" minOccurs="0"/>'
+            '</xs:sequence></xs:sequence>'
+        )
+        with self.assertRaises(XMLSchemaModelError) as ctx:
+            check_model(group)
+        self.assertEqual(ctx.exception.message, upa_msg.format(group[0], group[1][2]))
+        with self.assertRaises(XMLSchemaModelError) as ctx:
+            check_model_automaton(group)
+        self.assertEqual(ctx.exception.message, upa_msg.format(group[0], group[1][2]))
+        with self.assertRaises(XMLSchemaModelError) as ctx:
+            _check_follow_sets(group)
+        self.assertEqual(ctx.exception.message, upa_msg.format(group[1][0], group[1][1]))
+
+    def test_check_model_automaton_with_deep_model(self):
+        depth = limits.MAX_MODEL_DEPTH + 5
+        model = ''.join(f'<xs:sequence minOccurs="0"><xs:element name="e{k}"/>'
+                        for k in range(depth)) + '</xs:sequence>' * depth
+
+        source = dedent(f"""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:complexType name="aType">{model}</xs:complexType>
+            </xs:schema>""")
+        with self.assertWarns(Warning):
+            schema = self.schema_class(source)
+        self.assertEqual(len(schema.warnings), 1)
+        self.assertIn('maximum recursion depth', schema.warnings[0])
+
+        schema = self.schema_class(source, model_checker='automaton')
+        self.assertEqual(schema.warnings, [])
+        self.assertIsNone(check_model_automaton(schema.types['aType'].content))
+
+        with self.assertRaises(XMLSchemaModelError):
+            source = source.replace('name="e6"', 'name="e6" minOccurs="0"')
+            self.schema_class(source.replace('name="e7"', 'name="e6"'),
+                              model_checker='automaton')
+
+        with self.assertRaises(ValueError):
+            self.schema_class(source, model_checker='unknown')
+
 
 class TestModelValidation11(TestModelValidation):
     schema_class = XMLSchema11
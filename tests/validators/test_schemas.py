@@ -9,13 +9,19 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import sys
+import threading
 import unittest
+import inspect
 import logging
 import warnings
 import pathlib
 import pickle
 import os
+import tempfile
+import urllib.request
+from functools import partial
 from textwrap import dedent
+from unittest.mock import patch
 from xml.etree.ElementTree import Element
 
 import xmlschema
@@ -26,7 +32,8 @@ from xmlschema.loaders import SchemaLoader
 from xmlschema.validators import XMLSchemaBase, XMLSchema10, XMLSchema11, \
     XsdGlobals, XsdComponent
 from xmlschema.testing import SKIP_REMOTE_TESTS, XsdValidatorTestCase
-from xmlschema.validators.schemas import logger
+from xmlschema.validators.schemas import logger, MetaSchemaDescriptor
+from xmlschema.snapshots import load_meta_snapshot, save_meta_snapshot
 from xmlschema.validators.builders import XsdBuilders
 from xmlschema.validators import XMLSchemaValidationError, XsdComplexType, \
     XsdAttributeGroup, XsdElement, XsdGroup
@@ -746,6 +753,70 @@ class TestXMLSchema10(XsdValidatorTestCase):
         _schema = pickle.loads(s)
         self.assertEqual(2, len(_schema.errors))
 
+    def test_schema_snapshots(self):
+        xml_file = self.casepath('examples/vehicles/vehicles.xml')
+
+        with tempfile.TemporaryDirectory() as dirname:
+            schema_dir = pathlib.Path(dirname).joinpath('schemas')
+            cache_dir = pathlib.Path(dirname).joinpath('cache')
+            schema_dir.mkdir()
+            for path in self.cases_dir.joinpath('examples/vehicles').glob('*.xsd'):
+                schema_dir.joinpath(path.name).write_bytes(path.read_bytes())
+
+            schema_file = schema_dir.joinpath('vehicles.xsd')
+            schema = self.schema_class(schema_file, cache_dir=cache_dir)
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 1)
+            self.assertTrue(schema.is_valid(xml_file))
+
+            with patch.object(SchemaLoader, 'load_declared_schemas') as mocked:
+                _schema = self.schema_class(schema_file, cache_dir=cache_dir)
+                mocked.assert_not_called()
+
+            self.assertTrue(_schema.is_valid(xml_file))
+            self.assertIs(_schema.maps.validator, _schema)
+            self.assertIs(_schema.maps.parent, self.schema_class.meta_schema)
+            self.assertEqual(len(_schema.maps.schemas), len(schema.maps.schemas))
+            self.assertEqual(_schema.maps.settings.cache_dir, str(cache_dir))
+
+            # A changed included source invalidates the snapshot
+            cars_file = schema_dir.joinpath('cars.xsd')
+            cars_file.write_text(cars_file.read_text().replace('name="car"', 'name="car2"'))
+            with patch.object(SchemaLoader, 'load_declared_schemas',
+                              autospec=True,
+                              side_effect=SchemaLoader.load_declared_schemas) as mocked:
+                _schema = self.schema_class(schema_file, cache_dir=cache_dir)
+                mocked.assert_called()
+
+            self.assertFalse(_schema.is_valid(xml_file))
+
+            # Schemas built with different settings have different snapshots
+            self.schema_class(schema_file, cache_dir=cache_dir, validation='lax')
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 2)
+
+            # A change of the package code invalidates the snapshots
+            with patch('xmlschema.snapshots.get_modules_digest', return_value=''):
+                self.schema_class(schema_file, cache_dir=cache_dir, validation='lax')
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 3)
+
+            # Callables are keyed by name, only if the name identifies them
+            self.schema_class(schema_file, cache_dir=cache_dir, uri_mapper=str)
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 4)
+            self.schema_class(schema_file, cache_dir=cache_dir, uri_mapper=partial(str))
+            self.schema_class(schema_file, cache_dir=cache_dir, uri_mapper=lambda x: x)
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 4)
+
+            with patch.object(SchemaLoader, 'load_declared_schemas',
+                              autospec=True,
+                              side_effect=SchemaLoader.load_declared_schemas) as mocked:
+                self.schema_class(schema_file, cache_dir=cache_dir,
+                                  opener=urllib.request.build_opener())
+                mocked.assert_called()
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 4)
+
+            snapshots = _schema.maps.settings.get_snapshots()
+            snapshots.clear()
+            self.assertEqual(len(list(cache_dir.glob('*.pickle'))), 0)
+
     def test_pickling_subclassed_schema__issue_263(self):
         schema_file = self.cases_dir.joinpath('examples/vehicles/vehicles.xsd')
         xml_file = self.cases_dir.joinpath('examples/vehicles/vehicles.xml')
@@ -1195,6 +1266,106 @@ class TestXMLSchemaMeta(unittest.TestCase):
         bases = CustomXMLSchema10.meta_schema.__class__.__bases__
         self.assertEqual(bases, (XMLSchemaBase,))
 
+    def test_lazy_meta_schema_creation(self):
+
+        class CustomXMLSchema11(XMLSchema11):
+            builders = XsdBuilders()
+            META_SCHEMA = os.path.join(SCHEMAS_DIR, 'XSD_1.1/XMLSchema.xsd')
+
+        descriptor = inspect.getattr_static(CustomXMLSchema11, 'meta_schema')
+        self.assertIsInstance(descriptor, MetaSchemaDescriptor)
+        self.assertEqual(descriptor.meta_schema_class.__name__, 'MetaCustomXMLSchema11')
+
+        results = []
+
+        def get_meta_schema():
+            results.append(CustomXMLSchema11.meta_schema)
+
+        threads = [threading.Thread(target=get_meta_schema) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(x is results[0] for x in results))
+        self.assertIsInstance(results[0], descriptor.meta_schema_class)
+        self.assertTrue(results[0].is_meta())
+
+        # After the creation the descriptor is replaced by the meta-schema instance
+        self.assertIs(inspect.getattr_static(CustomXMLSchema11, 'meta_schema'), results[0])
+        self.assertIsNot(results[0], XMLSchema11.meta_schema)
+
+    def test_meta_schema_snapshots(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            snapshot = os.path.join(dirname, 'meta-schema.pickle')
+
+            class CustomXMLSchema10(XMLSchema10):
+                builders = XsdBuilders()
+                META_SCHEMA = os.path.join(SCHEMAS_DIR, 'XSD_1.0/XMLSchema.xsd')
+                META_SNAPSHOT = snapshot
+
+            descriptor = inspect.getattr_static(CustomXMLSchema10, 'meta_schema')
+            self.assertEqual(descriptor.snapshot, snapshot)
+            meta_schema_class = descriptor.meta_schema_class
+            self.assertIsNone(load_meta_snapshot(meta_schema_class, snapshot))
+
+            meta_schema = descriptor.create()
+            with self.assertRaises(ValueError):
+                save_meta_snapshot(meta_schema, snapshot)
+
+            meta_schema.build()
+            save_meta_snapshot(meta_schema, snapshot)
+            self.assertTrue(os.path.isfile(snapshot))
+
+            with patch.object(meta_schema_class, 'create_meta_schema') as mock:
+                loaded = CustomXMLSchema10.meta_schema
+                mock.assert_not_called()
+
+            self.assertIsInstance(loaded, meta_schema_class)
+            self.assertIsNot(loaded, meta_schema)
+            self.assertTrue(loaded.is_meta())
+            self.assertTrue(loaded.maps.built)
+            self.assertEqual(loaded.url, meta_schema.url)
+            self.assertEqual(list(loaded.maps.types), list(meta_schema.maps.types))
+            self.assertEqual(list(loaded.maps.elements), list(meta_schema.maps.elements))
+
+            vh_dir = pathlib.Path(__file__).parent.parent.joinpath(
+                'test_cases/examples/vehicles'
+            )
+            schema = CustomXMLSchema10(vh_dir.joinpath('vehicles.xsd'))
+            self.assertIs(schema.maps.parent, loaded)
+            self.assertTrue(schema.is_valid(vh_dir.joinpath('vehicles.xml')))
+
+            # Mismatching versions or sources invalidate the snapshot
+            with patch('xmlschema.__version__', '0.0.0'):
+                self.assertIsNone(load_meta_snapshot(meta_schema_class, snapshot))
+            with patch('xmlschema.snapshots.get_file_digest', return_value=''):
+                self.assertIsNone(load_meta_snapshot(meta_schema_class, snapshot))
+            with patch('xmlschema.snapshots.get_modules_digest', return_value=''):
+                self.assertIsNone(load_meta_snapshot(meta_schema_class, snapshot))
+            with patch('xmlschema.snapshots.get_modules_digest', return_value=None):
+                # An installed distribution is identified only by the version
+                self.assertIsNotNone(load_meta_snapshot(meta_schema_class, snapshot))
+            self.assertIsNotNone(load_meta_snapshot(meta_schema_class, snapshot))
+            self.assertIsNone(load_meta_snapshot(XMLSchema11.meta_schema.__class__, snapshot))
+
+            with open(snapshot, 'wb') as fp:
+                fp.write(b'not a pickle')
+            with self.assertLogs('xmlschema', level='WARNING'):
+                self.assertIsNone(load_meta_snapshot(meta_schema_class, snapshot))
+
+            # Fallback to the creation of the meta-schema from sources
+            class CustomXMLSchema11(XMLSchema11):
+                builders = XsdBuilders()
+                META_SCHEMA = os.path.join(SCHEMAS_DIR, 'XSD_1.1/XMLSchema.xsd')
+                META_SNAPSHOT = os.path.join(dirname, 'missing.pickle')
+
+            descriptor = inspect.getattr_static(CustomXMLSchema11, 'meta_schema')
+            self.assertIsInstance(descriptor, MetaSchemaDescriptor)
+            self.assertIsInstance(CustomXMLSchema11.meta_schema, descriptor.meta_schema_class)
+            self.assertTrue(CustomXMLSchema11.meta_schema.is_meta())
+
 
 if __name__ == '__main__':
     from xmlschema.testing import run_xmlschema_tests
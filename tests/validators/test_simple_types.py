@@ -9,10 +9,14 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import pathlib
+from decimal import Decimal
 
 from xmlschema import XMLSchemaParseError, XMLSchemaValidationError
+from xmlschema.caching import CacheInfo
+from xmlschema.exceptions import XMLSchemaValueError
 from xmlschema.names import XSD_LIST, XSD_UNION
 from xmlschema.validators import XMLSchema11
+from xmlschema.validators.simple_types import decode_text
 from xmlschema.testing import XsdValidatorTestCase
 
 
@@ -235,6 +239,281 @@ class TestXsdSimpleTypes(XsdValidatorTestCase):
 
         self.assertIsNone(schema.validate('<value>2007-12-31T12:30:40</value>'))
 
+    def test_value_cache(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+              <xs:complexType>
+                <xs:sequence maxOccurs="unbounded">
+                  <xs:element name="code" type="codeType"/>
+                  <xs:element name="flag" type="xs:boolean"/>
+                  <xs:element name="key" type="xs:ID" minOccurs="0"/>
+                  <xs:element name="ref" type="xs:IDREF" minOccurs="0"/>
+                </xs:sequence>
+              </xs:complexType>
+            </xs:element>
+            <xs:simpleType name="codeType">
+              <xs:restriction base="xs:string">
+                <xs:pattern value="[A-Z]{2}"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="keyType">
+              <xs:restriction base="xs:ID"/>
+            </xs:simpleType>
+            <xs:simpleType name="qnameType">
+              <xs:restriction base="xs:QName"/>
+            </xs:simpleType>
+            <xs:simpleType name="listType">
+              <xs:list itemType="xs:int"/>
+            </xs:simpleType>""")
+
+        self.assertTrue(schema.types['codeType'].is_value_cacheable())
+        self.assertTrue(schema.meta_schema.types['boolean'].is_value_cacheable())
+        for name in ('ID', 'IDREF', 'QName'):
+            self.assertFalse(schema.meta_schema.types[name].is_value_cacheable())
+        for name in ('keyType', 'qnameType', 'listType'):
+            self.assertFalse(schema.types[name].is_value_cacheable())
+
+        xml_data = '<root>{}</root>'.format(
+            '<code>AB</code><flag>true</flag><code>ab</code><flag>1</flag>'
+            '<code>AB</code><flag>maybe</flag><key>k1</key><ref>k1</ref>'
+            '<code>AB</code><flag>true</flag><key>k1</key><ref>k2</ref>'
+        )
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertGreaterEqual(len(errors), 3)
+        self.assertListEqual(
+            [e.reason for e in schema.iter_errors(xml_data, use_value_cache=True)], errors
+        )
+        self.assertFalse(schema.is_valid(xml_data, use_value_cache=True))
+
+        data, errors = schema.decode(xml_data, validation='lax')
+        cached_data, cached_errors = schema.decode(
+            xml_data, validation='lax', use_value_cache=True
+        )
+        self.assertEqual(cached_data, data)
+        self.assertListEqual([e.reason for e in cached_errors], [e.reason for e in errors])
+
+        cache_info = schema.maps.cache.cache_info(decode_text)
+        self.assertIsInstance(cache_info, CacheInfo)
+        self.assertGreaterEqual(cache_info.currsize, 5)  # 'AB', 'ab', 'true', '1', 'maybe'
+        self.assertGreater(cache_info.hits, cache_info.misses)
+
+        schema.maps.cache.clear()
+        self.assertEqual(schema.maps.cache.cache_info(decode_text).currsize, 0)
+
+        with self.assertRaises(XMLSchemaValueError):
+            schema.maps.cache.cache_info(len)
+
+        schema.maps.cache.enabled = False
+        try:
+            self.assertIsNone(schema.maps.cache.cache_info(decode_text))
+            self.assertEqual(
+                schema.decode(xml_data, validation='lax', use_value_cache=True)[0], data
+            )
+        finally:
+            schema.maps.cache.enabled = True
+
+    def test_id_references(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+              <xs:complexType>
+                <xs:sequence maxOccurs="unbounded">
+                  <xs:element name="ref" type="xs:IDREF" minOccurs="0"/>
+                  <xs:element name="key" type="xs:ID" minOccurs="0"/>
+                </xs:sequence>
+              </xs:complexType>
+            </xs:element>""")
+
+        xml_data = '<root>{}</root>'.format(
+            '<ref>k2</ref><key>k1</key><ref>k1</ref><ref>k3</ref>'
+            '<key>k2</key><key>k4</key><ref>k5</ref><ref>k6</ref><ref>k4</ref>'
+        )
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertListEqual(errors, [
+            "IDREF 'k3' not found in XML document",
+            "IDREF 'k5' not found in XML document",
+            "IDREF 'k6' not found in XML document",
+        ])
+        for limit in (1, 2, 5, 100):
+            self.assertListEqual(
+                [e.reason for e in schema.iter_errors(xml_data, identity_limit=limit)],
+                errors
+            )
+
+        self.assertTrue(schema.is_valid('<root><ref>k1</ref><key>k1</key></root>'))
+        self.assertTrue(schema.is_valid(
+            '<root><ref>k1</ref><key>k1</key></root>', identity_limit=1
+        ))
+
+    def test_lexical_datetimes(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+              <xs:complexType>
+                <xs:sequence maxOccurs="unbounded">
+                  <xs:element name="day" type="recentDate"/>
+                  <xs:element name="timestamp" type="utcTimestamp"/>
+                  <xs:element name="elapsed" type="xs:duration"/>
+                </xs:sequence>
+                <xs:attribute name="time" type="xs:time"/>
+              </xs:complexType>
+            </xs:element>
+            <xs:simpleType name="recentDate">
+              <xs:restriction base="xs:date">
+                <xs:minInclusive value="2000-01-01"/>
+                <xs:maxExclusive value="2100-01-01"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="utcTimestamp">
+              <xs:restriction base="xs:dateTime">
+                <xs:minInclusive value="2000-01-01T00:00:00Z"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="shortDuration">
+              <xs:restriction base="xs:duration">
+                <xs:maxInclusive value="P1D"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="holiday">
+              <xs:restriction base="xs:date">
+                <xs:enumeration value="2026-12-25"/>
+              </xs:restriction>
+            </xs:simpleType>""")
+
+        self.assertIsNotNone(schema.meta_schema.types['date'].get_lexical_checker())
+        self.assertIsNone(schema.meta_schema.types['string'].get_lexical_checker())
+        self.assertIsNone(schema.types['shortDuration'].get_lexical_checker())
+        self.assertIsNone(schema.types['holiday'].get_lexical_checker())
+
+        checker = schema.types['recentDate'].get_lexical_checker()
+        self.assertTrue(checker('2024-02-29'))
+        for text in ('2023-02-29', '1999-12-31', '2100-01-01', '2024-01-01Z', '12024-01-01'):
+            self.assertFalse(checker(text))  # invalid or checked decoding the value
+
+        checker = schema.types['utcTimestamp'].get_lexical_checker()
+        self.assertTrue(checker('2026-06-15T10:00:00Z'))
+        for text in ('2026-06-15T10:00:00', '2026-06-15T10:00:00.5Z',
+                     '2026-06-15T10:00:00+02:00', '2026-06-15T24:00:00Z'):
+            self.assertFalse(checker(text))
+
+        xml_data = (
+            '<root time=" 10:30:00Z "><day> 2026-06-15 </day>'
+            '<timestamp>2026-06-15T10:00:00Z</timestamp><elapsed>PT90M</elapsed>'
+            '<day>2024-02-29</day><timestamp>2026-06-15T12:00:00+02:00</timestamp>'
+            '<elapsed>P1Y2M</elapsed><day>2023-02-29</day>'
+            '<timestamp>2000-01-01T01:00:00+02:00</timestamp><elapsed>P1H</elapsed>'
+            '<day>1999-12-31</day><timestamp>1999-12-31T23:00:00Z</timestamp>'
+            '<elapsed>-P1D</elapsed></root>'
+        )
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertEqual(len(errors), 5)
+
+        for use_decode_plans in (False, True):
+            data, decode_errors = schema.decode(
+                xml_data, validation='lax', use_decode_plans=use_decode_plans
+            )
+            self.assertListEqual([e.reason for e in decode_errors], errors)
+            self.assertDictEqual(data, {
+                '@time': '10:30:00Z',
+                'day': ['2026-06-15', '2024-02-29', None, '1999-12-31'],
+                'timestamp': ['2026-06-15T10:00:00Z', '2026-06-15T12:00:00+02:00',
+                              '2000-01-01T01:00:00+02:00', '1999-12-31T23:00:00Z'],
+                'elapsed': ['PT90M', 'P1Y2M', None, '-P1D'],
+            })
+
+            _, decode_errors = schema.decode(
+                xml_data, validation='lax', datetime_types=True,
+                use_decode_plans=use_decode_plans
+            )
+            self.assertListEqual([e.reason for e in decode_errors], errors)
+
+    def test_float_decimals(self):
+        schema = self.check_schema("""
+            <xs:element name="root">
+              <xs:complexType>
+                <xs:sequence maxOccurs="unbounded">
+                  <xs:element name="value" type="xs:decimal"/>
+                  <xs:element name="price" type="priceType"/>
+                  <xs:element name="count" type="xs:int"/>
+                </xs:sequence>
+                <xs:attribute name="ratio" type="ratioType"/>
+              </xs:complexType>
+            </xs:element>
+            <xs:simpleType name="priceType">
+              <xs:restriction base="xs:decimal">
+                <xs:minExclusive value="0"/>
+                <xs:totalDigits value="5"/>
+                <xs:fractionDigits value="2"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="ratioType">
+              <xs:restriction base="xs:decimal">
+                <xs:maxInclusive value="0.1"/>
+              </xs:restriction>
+            </xs:simpleType>
+            <xs:simpleType name="codeType">
+              <xs:restriction base="xs:decimal">
+                <xs:enumeration value="1.5"/>
+              </xs:restriction>
+            </xs:simpleType>""")
+
+        self.assertIsNotNone(schema.meta_schema.types['decimal'].get_lexical_checker())
+        self.assertIsNone(schema.meta_schema.types['integer'].get_lexical_checker())
+        self.assertIsNone(schema.types['codeType'].get_lexical_checker())
+
+        checker = schema.types['priceType'].get_lexical_checker()
+        for text in ('1', '0.01', '999.99', '+12.50', '0012.3400'):
+            self.assertTrue(checker(text))
+        for text in ('0', '-1', '0.001', '10000.5', 'NaN', 'INF', '1e3', '1,5'):
+            self.assertFalse(checker(text))
+
+        checker = schema.types['ratioType'].get_lexical_checker()
+        self.assertTrue(checker('0.09999'))
+        self.assertFalse(checker('0.1'))  # checked decoding the value
+        self.assertFalse(checker('0.10000000000000000001'))
+        self.assertFalse(checker('-1' + '0' * 309))  # overflows to -INF
+
+        # Decimal values out of the float range are not decoded as floats
+        overflow = '1' + '0' * 309
+        self.assertFalse(schema.is_valid(
+            f'<root><value>{overflow}</value><price>1</price><count>1</count></root>'
+        ))
+        self.assertFalse(schema.is_valid(
+            f'<root ratio="-{overflow}"><value>1</value><price>1</price><count>1</count></root>'
+        ))
+        data, decode_errors = schema.decode(
+            f'<root><value>{overflow}</value><price>1</price><count>1</count></root>',
+            validation='lax', decimal_type=float
+        )
+        self.assertEqual(len(decode_errors), 1)
+
+        xml_data = (
+            '<root ratio=" 0.1 "><value> -12.50 </value><price>0012.3400</price>'
+            '<count>1</count><value>.5</value><price>0.001</price><count>2</count>'
+            '<value>1e3</value><price>10000.5</price><count>3</count>'
+            '<value>7</value><price>999.99</price><count>4</count></root>'
+        )
+        errors = [e.reason for e in schema.iter_errors(xml_data)]
+        self.assertEqual(len(errors), 3)
+
+        for use_decode_plans in (False, True):
+            data, decode_errors = schema.decode(
+                xml_data, validation='lax', decimal_type=float,
+                use_decode_plans=use_decode_plans
+            )
+            self.assertListEqual([e.reason for e in decode_errors], errors)
+            self.assertDictEqual(data, {
+                '@ratio': 0.1,
+                'value': [-12.5, 0.5, None, 7.0],
+                'price': [12.34, 0.001, 10000.5, 999.99],
+                'count': [1, 2, 3, 4],
+            })
+            self.assertTrue(all(type(v) is float for v in data['value'] if v is not None))
+
+            data, decode_errors = schema.decode(
+                xml_data, validation='lax', use_decode_plans=use_decode_plans
+            )
+            self.assertListEqual([e.reason for e in decode_errors], errors)
+            self.assertEqual(data['value'][0], Decimal('-12.50'))
+
 
 class TestXsd11SimpleTypes(TestXsdSimpleTypes):
 
@@ -8,11 +8,16 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
+import os
+import pathlib
+import tempfile
+import threading
 import unittest
 import warnings
+from textwrap import dedent
 from typing import Any
 
-from xmlschema import XMLSchema10, XMLSchema11
+from xmlschema import XMLSchema10, XMLSchema11, XMLSchemaParseError, XMLSchemaModelError
 from xmlschema.namespaces import NamespaceView
 import xmlschema.names as nm
 
@@ -223,6 +228,265 @@ class TestXsd10GlobalsMaps(unittest.TestCase):
                     global_counter += 1
         self.assertEqual(global_counter, self.total_globals)
 
+    def test_lazy_build(self):
+        vh_dir = pathlib.Path(__file__).parent.parent.joinpath('test_cases/examples/vehicles')
+        schema = self.schema_class(vh_dir.joinpath('vehicles.xsd'), lazy_build=True)
+        maps = schema.maps
+
+        self.assertTrue(maps.built)
+        self.assertTrue(maps.lazy_build)
+        self.assertEqual(maps.validation_attempted, 'partial')
+        self.assertEqual(schema.validation_attempted, 'partial')
+        self.assertEqual(maps.validity, 'notKnown')
+        self.assertEqual(schema.validity, 'notKnown')
+        staged = maps.global_maps.total_staged
+        self.assertGreater(staged, 0)
+
+        # Staged names are available as keys of the maps
+        self.assertIn('{http://example.com/vehicles}cars', maps.elements.staged)
+        self.assertIn('{http://example.com/vehicles}cars', list(maps.elements))
+        self.assertEqual(len(schema.elements), 3)
+
+        self.assertTrue(schema.is_valid(vh_dir.joinpath('vehicles.xml')))
+        self.assertFalse(schema.is_valid(vh_dir.joinpath('vehicles-1_error.xml')))
+        self.assertLess(maps.global_maps.total_staged, staged)
+        self.assertTrue(schema.elements['vehicles'].built)
+
+        schema.build_all()
+        self.assertEqual(maps.global_maps.total_staged, 0)
+        self.assertEqual(maps.validation_attempted, 'full')
+        self.assertEqual(maps.validity, 'valid')
+        self.assertEqual(schema.validity, 'valid')
+
+        eager_schema = self.schema_class(vh_dir.joinpath('vehicles.xsd'))
+        self.assertListEqual(list(schema.maps.types), list(eager_schema.maps.types))
+        self.assertListEqual(
+            [c.name for c in schema.maps.iter_components()],
+            [c.name for c in eager_schema.maps.iter_components()]
+        )
+
+    def test_lazy_build_with_identities(self):
+        schema = self.schema_class(dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:element name="root">
+                <xs:complexType>
+                  <xs:sequence>
+                    <xs:element ref="item" maxOccurs="unbounded"/>
+                  </xs:sequence>
+                </xs:complexType>
+                <xs:key name="item_id">
+                  <xs:selector xpath="item"/>
+                  <xs:field xpath="@id"/>
+                </xs:key>
+              </xs:element>
+              <xs:element name="item">
+                <xs:complexType>
+                  <xs:attribute name="id" type="xs:int"/>
+                </xs:complexType>
+              </xs:element>
+              <xs:complexType name="unused"/>
+            </xs:schema>"""), lazy_build=True)
+
+        self.assertEqual(schema.maps.types.staged, ['unused'])
+        self.assertTrue(schema.is_valid('<root><item id="1"/><item id="2"/></root>'))
+        self.assertFalse(schema.is_valid('<root><item id="1"/><item id="1"/></root>'))
+
+    def test_lazy_build_errors(self):
+        source = dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:element name="root" type="xs:string"/>
+              <xs:element name="wrong" type="unknown"/>
+            </xs:schema>""")
+
+        with self.assertRaises(XMLSchemaParseError):
+            self.schema_class(source)
+
+        schema = self.schema_class(source, lazy_build=True)
+        self.assertEqual(schema.validation_attempted, 'partial')
+        self.assertEqual(schema.validity, 'notKnown')
+        self.assertTrue(schema.is_valid('<root>foo</root>'))
+
+        # A failed build restores the staged component
+        for _ in range(2):
+            with self.assertRaises(XMLSchemaParseError):
+                schema.is_valid('<wrong>foo</wrong>')
+            self.assertNotIn('wrong', schema.maps.elements._store)
+            self.assertIn('wrong', schema.maps.elements.staged)
+
+        with self.assertRaises(XMLSchemaParseError):
+            schema.build_all()
+        self.assertEqual(schema.validity, 'notKnown')
+
+    def test_lazy_build_model_errors(self):
+        source = dedent("""\
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+              <xs:element name="root" type="xs:string"/>
+              <xs:element name="upa">
+                <xs:complexType>
+                  <xs:choice>
+                    <xs:sequence>
+                      <xs:element name="a"/>
+                      <xs:element name="b"/>
+                    </xs:sequence>
+                    <xs:sequence>
+                      <xs:element name="a"/>
+                      <xs:element name="c"/>
+                    </xs:sequence>
+                  </xs:choice>
+                </xs:complexType>
+              </xs:element>
+              <xs:element name="wrong">
+                <xs:complexType>
+                  <xs:group ref="missing"/>
+                </xs:complexType>
+              </xs:element>
+            </xs:schema>""")
+
+        schema = self.schema_class(source, lazy_build=True)
+        self.assertTrue(schema.is_valid('<root>foo</root>'))
+        with self.assertRaises(XMLSchemaModelError):
+            schema.is_valid('<upa><a/><b/></upa>')
+        self.assertIn('upa', schema.maps.elements.staged)
+
+        for _ in range(2):
+            with self.assertRaises(XMLSchemaParseError):
+                schema.is_valid('<wrong/>')
+        with self.assertRaises(XMLSchemaParseError):
+            schema.build_all()
+
+        schema = self.schema_class(source, lazy_build=True, validation='lax')
+        self.assertTrue(schema.is_valid('<root>foo</root>'))
+        schema.is_valid('<upa><a/><b/></upa>')
+        self.assertEqual(schema.validity, 'invalid')
+        self.assertEqual(len(schema.all_errors), 1)
+        schema.build_all()
+        self.assertEqual(len(schema.all_errors), 2)
+
+    def test_concurrent_lazy_build(self):
+        vh_dir = pathlib.Path(__file__).parent.parent.joinpath('test_cases/examples/vehicles')
+        schema = self.schema_class(vh_dir.joinpath('vehicles.xsd'), lazy_build=True)
+        results = []
+
+        def validate():
+            results.append(schema.is_valid(vh_dir.joinpath('vehicles.xml')))
+
+        threads = [threading.Thread(target=validate) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertListEqual(results, [True] * 8)
+
+    def test_reload(self):
+        sources = {
+            'main.xsd': """\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                    xmlns:b="tns-b" xmlns:c="tns-c" targetNamespace="tns-a">
+                  <xs:include schemaLocation="part.xsd"/>
+                  <xs:import namespace="tns-b" schemaLocation="b.xsd"/>
+                  <xs:import namespace="tns-c" schemaLocation="c.xsd"/>
+                  <xs:element name="root" type="b:rootType"/>
+                  <xs:element name="other" type="c:otherType"/>
+                </xs:schema>""",
+            'part.xsd': """\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                  <xs:simpleType name="itemType">
+                    <xs:restriction base="xs:int"/>
+                  </xs:simpleType>
+                </xs:schema>""",
+            'b.xsd': """\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                    xmlns:a="tns-a" targetNamespace="tns-b">
+                  <xs:import namespace="tns-a"/>
+                  <xs:complexType name="rootType">
+                    <xs:sequence>
+                      <xs:element name="item" type="a:itemType" maxOccurs="unbounded"/>
+                    </xs:sequence>
+                  </xs:complexType>
+                </xs:schema>""",
+            'c.xsd': """\
+                <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                    targetNamespace="tns-c">
+                  <xs:complexType name="otherType"/>
+                </xs:schema>""",
+        }
+
+        with tempfile.TemporaryDirectory() as dirname:
+            for name, source in sources.items():
+                with open(os.path.join(dirname, name), 'w') as fp:
+                    fp.write(dedent(source))
+
+            schema = self.schema_class(os.path.join(dirname, 'main.xsd'))
+            maps = schema.maps
+            xml_data = '<a:root xmlns:a="tns-a"><item>1</item><item>foo</item></a:root>'
+            self.assertFalse(schema.is_valid(xml_data))
+
+            part_xsd_file = os.path.join(dirname, 'part.xsd')
+            part_schema = maps.get_schema('tns-a', part_xsd_file)
+            root_type = maps.types['{tns-b}rootType']
+            other_type = maps.types['{tns-c}otherType']
+            total_globals = maps.global_maps.total
+
+            with open(part_xsd_file, 'w') as fp:
+                fp.write(dedent("""\
+                    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                      <xs:simpleType name="itemType">
+                        <xs:restriction base="xs:string"/>
+                      </xs:simpleType>
+                    </xs:schema>"""))
+
+            maps.reload(part_xsd_file)
+            self.assertTrue(maps.built)
+            self.assertEqual(maps.validity, 'valid')
+            self.assertEqual(maps.global_maps.total, total_globals)
+            self.assertTrue(schema.is_valid(xml_data))
+
+            # Only the globals of the reloaded namespace and of its importers are rebuilt
+            self.assertIsNot(maps.types['{tns-b}rootType'], root_type)
+            self.assertIs(maps.types['{tns-c}otherType'], other_type)
+
+            new_part_schema = maps.get_schema('tns-a', part_xsd_file)
+            self.assertIsNot(new_part_schema, part_schema)
+            self.assertNotIn(part_schema, maps)
+            self.assertIs(schema.includes['part.xsd'], new_part_schema)
+            self.assertIs(maps.types['{tns-a}itemType'].schema, new_part_schema)
+
+            with open(part_xsd_file, 'w') as fp:
+                fp.write('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                         '<xs:simpleType name="itemType"/></xs:schema>')
+
+            with self.assertRaises(XMLSchemaParseError):
+                maps.reload(part_xsd_file)
+            self.assertIs(maps.get_schema('tns-a', part_xsd_file), new_part_schema)
+            self.assertTrue(maps.built)
+
+            # A source that is valid for the meta-schema but fails to build
+            with open(part_xsd_file, 'w') as fp:
+                fp.write('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                         '<xs:simpleType name="itemType">'
+                         '<xs:restriction base="xs:missing"/>'
+                         '</xs:simpleType></xs:schema>')
+
+            root_type = maps.types['{tns-b}rootType']
+            item_type = maps.types['{tns-a}itemType']
+            with self.assertRaises(XMLSchemaParseError):
+                maps.reload(part_xsd_file)
+
+            self.assertTrue(maps.built)
+            self.assertEqual(maps.validity, 'valid')
+            self.assertEqual(maps.global_maps.total, total_globals)
+            self.assertIs(maps.get_schema('tns-a', part_xsd_file), new_part_schema)
+            self.assertIs(schema.includes['part.xsd'], new_part_schema)
+            self.assertIs(maps.types['{tns-b}rootType'], root_type)
+            self.assertIs(maps.types['{tns-a}itemType'], item_type)
+            self.assertTrue(schema.is_valid(xml_data))
+
+            with self.assertRaises(ValueError):
+                maps.reload(os.path.join(dirname, 'main.xsd'))
+            with self.assertRaises(ValueError):
+                maps.reload(os.path.join(dirname, 'unknown.xsd'))
+
 
 class TestXsd11GlobalsMaps(TestXsd10GlobalsMaps):
 
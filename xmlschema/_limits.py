@@ -19,6 +19,7 @@ A specular protected module is used for performance penalties of the managed mod
 
 """
 MAX_MODEL_DEPTH = 15
+MAX_MODEL_STATES = 500
 MAX_SCHEMA_SOURCES = 1000
 MAX_XML_DEPTH = 1000
 MAX_XML_ELEMENTS = 10 ** 6
@@ -37,6 +37,7 @@ BLOCK_TYPES = frozenset(('text', 'file', 'io', 'url', 'tree'))
 LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL', 10, 20, 30, 40, 50))
 VALIDATION_MODES = frozenset(('strict', 'lax', 'skip'))
 XMLNS_PROCESSING_MODES = frozenset(('stacked', 'collapsed', 'root-only', 'none'))
+MODEL_CHECKERS = frozenset(('paths', 'automaton'))
 
 XSD_VALIDATION_MODES = frozenset(('strict', 'lax', 'skip'))
 """
@@ -357,6 +358,10 @@ class ValidationOption(Option[str]):
     _validators = str_validator, partial(validate_choice, choices=XSD_VALIDATION_MODES),
 
 
+class ModelCheckerOption(Option[str]):
+    _validators = str_validator, partial(validate_choice, choices=MODEL_CHECKERS)
+
+
 class NamespacesOption(Option[Optional[NsmapType]]):
     _validators = partial(validate_type, types=MutableMapping, none=True),
 
@@ -376,6 +381,17 @@ class LocationsOption(Option[Optional[LocationsType]]):
     _validators = partial(validate_type, types=LOCATIONS_TYPES, none=True),
 
 
+class CacheDirOption(Option[Optional[str]]):
+    def validated_value(self, value: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        elif isinstance(value, Path):
+            return str(value)
+
+        msg = _("invalid type {!r} for {}, must be None, a string or a Path instance")
+        raise XMLSchemaTypeError(msg.format(type(value), self))
+
+
 class ElementTypeOption(Option[Optional[ElementType]]):
     def validated_value(self, value: Any) -> Optional[ElementType]:
         if value is None or is_subclass(value, Element) or \
@@ -426,6 +442,18 @@ class MaxDepthOption(Option[Optional[int]]):
     _validators = none_int_validator, non_neg_int_validator
 
 
+class MaxErrorsOption(Option[Optional[int]]):
+    _validators = none_int_validator, pos_int_validator
+
+
+class AggregateErrorsOption(Option[Optional[int]]):
+    _validators = none_int_validator, pos_int_validator
+
+
+class IdentityLimitOption(Option[Optional[int]]):
+    _validators = none_int_validator, pos_int_validator
+
+
 class FillerOption(Option[Optional[FillerType]]):
     _validators = opt_callable_validator,
 
@@ -10,7 +10,8 @@
 from threading import Lock
 from collections.abc import Callable
 from functools import lru_cache, wraps
-from typing import Any, Generic, overload, TypeVar, TYPE_CHECKING, Union, cast
+from typing import Any, Generic, NamedTuple, Optional, overload, TypeVar, \
+    TYPE_CHECKING, Union, cast
 
 from xmlschema.aliases import SchemaType
 from xmlschema.exceptions import XMLSchemaAttributeError, XMLSchemaTypeError, XMLSchemaValueError
@@ -21,11 +22,20 @@ if TYPE_CHECKING:
 
 T = TypeVar('T', bound=Union[SchemaType, 'XsdComponent'])
 RT = TypeVar('RT', covariant=True)
+FT = TypeVar('FT', bound=Callable[..., Any])
 
 
 _cached_functions: dict[Callable[..., Any], tuple[int | None, bool]] = {}
 
 
+class CacheInfo(NamedTuple):
+    """The statistics of a cached function, with the fields of `functools` caches."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
 class SchemaCache:
 
     __slots__ = ('_enabled', '_functions', '_caches', '_lock')
@@ -76,6 +86,18 @@ class SchemaCache:
             self._functions[func] = maxsize, typed
             self._caches[func] = lru_cache(maxsize, typed)(func) if self._enabled else func
 
+    def cache_info(self, func: Callable[..., Any]) -> Optional[CacheInfo]:
+        """
+        Returns the statistics of the cache of a function or of a method decorated
+        with a schema cache decorator, `None` if caching is not enabled.
+        """
+        func = getattr(func, '__wrapped__', func)
+        try:
+            cache = self._caches[func]
+        except KeyError:
+            raise XMLSchemaValueError(f"{func!r} is not cached by {self!r}") from None
+        return CacheInfo(*cache.cache_info()) if self._enabled else None
+
     def clear(self) -> None:
         with self._lock:
             if self._enabled:
@@ -83,6 +105,20 @@ class SchemaCache:
                     cache.cache_clear()
 
 
+def register_cached_function(maxsize: int | None = None,
+                             typed: bool = False) -> Callable[[FT], FT]:
+    """
+    Register a function for caching with an LRU cache stored in XSD global maps cache.
+    The function is returned unchanged and is cached only when called through a
+    :class:`SchemaCache` instance.
+    """
+    def register(func: FT) -> FT:
+        _cached_functions[func] = maxsize, typed
+        return func
+
+    return register
+
+
 def schema_lru_cache(maxsize: int | None = None, typed: bool = False) -> Callable[..., RT]:
     """
     Cache an XSD validator method using an LRU cache stored in XSD global maps cache.
@@ -46,6 +46,16 @@ def defuse_data(value):
     return value
 
 
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError("%r is not a positive integer" % value)
+    return number
+
+
 def get_loglevel(verbosity):
     if verbosity <= 0:
         return logging.ERROR
@@ -90,6 +100,8 @@ def xml2json():
                              "(default is the most compact representation)")
     parser.add_argument('--lazy', action='store_true', default=False,
                         help="use lazy decoding mode (slower but use less memory).")
+    parser.add_argument('--max-errors', type=positive_int, default=None, metavar='N',
+                        help="stop the decoding of an XML file after N errors.")
     parser.add_argument('--defuse', metavar='(always, remote, never)',
                         type=defuse_data, default='remote',
                         help="when to defuse XML data, on remote resources for default.")
@@ -138,6 +150,7 @@ def xml2json():
                     lazy=args.lazy,
                     defuse=args.defuse,
                     validation='lax',
+                    max_errors=args.max_errors,
                     json_options=json_options,
                 )
             except (xmlschema.XMLSchemaException, URLError) as err:
@@ -246,6 +259,8 @@ def validate():
                         metavar="URI/URL", help="schema location hint overrides.")
     parser.add_argument('--lazy', action='store_true', default=False,
                         help="use lazy validation mode (slower but use less memory).")
+    parser.add_argument('--max-errors', type=positive_int, default=None, metavar='N',
+                        help="stop the validation of an XML file after N errors.")
     parser.add_argument('--defuse', metavar='(always, remote, never)',
                         type=defuse_data, default='remote',
                         help="when to defuse XML data, on remote resources for default.")
@@ -260,7 +275,8 @@ def validate():
     for filepath in args.files:
         try:
             errors = list(iter_errors(filepath, schema=args.schema, cls=schema_class,
-                                      locations=args.locations, lazy=args.lazy, defuse=args.defuse))
+                                      locations=args.locations, lazy=args.lazy,
+                                      defuse=args.defuse, max_errors=args.max_errors))
         except (xmlschema.XMLSchemaException, URLError) as err:
             tot_errors += 1
             sys.stderr.write(f"{err}\n")
@@ -8,11 +8,13 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import json
+import threading
 import dataclasses as dc
+from collections import OrderedDict
 from io import IOBase, TextIOBase
 from collections.abc import Iterator
 from functools import partial
-from typing import Any, BinaryIO, IO, Optional, TextIO, Union
+from typing import Any, BinaryIO, IO, NamedTuple, Optional, TextIO, Union, cast
 from xml.etree import ElementTree
 
 from xmlschema.exceptions import XMLSchemaTypeError, XMLSchemaValueError, XMLResourceError
@@ -28,6 +30,7 @@ from xmlschema.converters import ConverterType
 from xmlschema.validators import XMLSchema10, XMLSchemaBase, XMLSchemaValidationError
 from xmlschema.arguments import LocationsOption
 from xmlschema.settings import ResourceSettings, SchemaSettings
+from xmlschema.registry import get_schema_key, get_schema_fingerprints, RegistryEntry
 
 __all__ = ('from_json', 'is_valid', 'iter_errors', 'iter_decode', 'to_dict',
            'to_etree', 'to_json', 'validate', 'XmlDocument')
@@ -43,9 +46,100 @@ class SchemaArgument(Argument[SchemaType]):
         setattr(instance, self._name, self.validated_value(value))
 
 
+class SchemaCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DocumentSchemaCache:
+    """
+    A thread-safe LRU cache of the schemas built by document level APIs from
+    the location hints of XML documents. Schemas are keyed by the schema class,
+    the resolved schema location, the location hints and the schema settings.
+    Cached schemas are shared between documents, so they should be used only
+    for validation, decoding and encoding. A cached schema is replaced if a local
+    file loaded by the schema is changed after its creation.
+
+    :param maxsize: the maximum number of cached schemas.
+    """
+    __slots__ = ('maxsize', 'hits', 'misses', '_schemas', '_lock')
+
+    def __init__(self, maxsize: int = 32) -> None:
+        if not isinstance(maxsize, int):
+            raise XMLSchemaTypeError(_("invalid type {!r} for maxsize").format(type(maxsize)))
+        elif maxsize < 1:
+            raise XMLSchemaValueError(_("maxsize must be a positive integer"))
+
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._schemas: OrderedDict[str, RegistryEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '%s(maxsize=%d)' % (self.__class__.__name__, self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __contains__(self, schema: object) -> bool:
+        return any(e.schema is schema for e in self._schemas.values())
+
+    def cache_info(self) -> SchemaCacheInfo:
+        """Returns the cache statistics."""
+        with self._lock:
+            return SchemaCacheInfo(self.hits, self.misses, self.maxsize, len(self._schemas))
+
+    def get_schema(self, cls: type[XMLSchemaBase],
+                   source: SourceArgType,
+                   **kwargs: Any) -> SchemaType:
+        """
+        Returns the cached schema for the schema class, the source and the settings,
+        creating the schema if it's not cached. Schemas from sources that can't be
+        keyed (e.g. file-like objects) are created without caching them.
+
+        :param cls: the schema class.
+        :param source: the schema source, usually the URL resolved from location hints.
+        :param kwargs: schema settings options, including *locations*.
+        """
+        settings = cast(SchemaSettings, SchemaSettings.get_settings(**kwargs))
+        key = get_schema_key(cls, source, settings)
+        if key is None:
+            return cls(source, **kwargs)
+
+        with self._lock:
+            entry = self._schemas.get(key)
+            if entry is not None and not entry.is_changed():
+                self._schemas.move_to_end(key)
+                self.hits += 1
+                return entry.schema
+            self.misses += 1
+
+        schema = cls(source, **kwargs)
+        entry = RegistryEntry(schema, get_schema_fingerprints(schema), settings)
+        with self._lock:
+            self._schemas[key] = entry
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self.maxsize:
+                self._schemas.popitem(last=False)
+        return schema
+
+    def clear(self) -> None:
+        """Removes all the cached schemas and resets the statistics."""
+        with self._lock:
+            self._schemas.clear()
+            self.hits = self.misses = 0
+
+
+document_schema_cache = DocumentSchemaCache()
+"""The cache used by document level APIs when *use_schema_cache* is `True`."""
+
+
 def get_context(xml_document: Union[XMLSourceType, XMLResource],
                 schema: Optional[Union[XMLSchemaBase, SourceArgType]] = None,
                 cls: Optional[type[XMLSchemaBase]] = None,
+                use_schema_cache: bool = False,
                 **kwargs: Any) -> tuple[XMLResource, SchemaType]:
     """
     Get the XML document validation/decode context.
@@ -62,7 +156,9 @@ def get_context(xml_document: Union[XMLSourceType, XMLResource],
         return xml_document, xml_document.schema
 
     _kwargs = {k: kwargs[k] for k in kwargs if k in SCHEMA_KWARGS}
-    return resource, get_resource_schema(resource, schema, cls, **_kwargs)
+    return resource, get_resource_schema(
+        resource, schema, cls, use_schema_cache=use_schema_cache, **_kwargs
+    )
 
 
 def get_resource_schema(resource: XMLResource,
@@ -71,6 +167,7 @@ def get_resource_schema(resource: XMLResource,
                         validation: str = 'strict',
                         locations: Optional[LocationsType] = None,
                         use_location_hints: bool = True,
+                        use_schema_cache: bool = False,
                         **kwargs: Any) -> SchemaType:
     if cls is None:
         cls = XMLSchema10
@@ -88,9 +185,13 @@ def get_resource_schema(resource: XMLResource,
         else:
             kwargs['locations'] = locations
             if schema is None or isinstance(schema, XMLSchemaBase):
-                return cls(schema_location, **kwargs)
+                source: SourceArgType = schema_location
             else:
-                return cls(schema, **kwargs)
+                source = schema
+
+            if use_schema_cache:
+                return document_schema_cache.get_schema(cls, source, **kwargs)
+            return cls(source, **kwargs)
 
     if isinstance(schema, XMLSchemaBase):
         return schema  # fallback to a schema for a different namespace
@@ -151,6 +252,7 @@ def validate(xml_document: Union[XMLSourceType, XMLResource],
              namespaces: Optional[NsmapType] = None,
              locations: Optional[LocationsType] = None,
              use_location_hints: bool = True,
+             use_schema_cache: bool = False,
              **kwargs: Any) -> None:
     """
     Validates an XML document against a schema instance. This function builds an
@@ -178,11 +280,14 @@ def validate(xml_document: Union[XMLSourceType, XMLResource],
     :param use_location_hints: for default, in case a schema instance has \
     to be built, uses also schema locations hints provided within XML data. \
     set this option to `False` to ignore these schema location hints.
+    :param use_schema_cache: if `True` a schema built from the location hints \
+    of the XML data is taken from and stored in the LRU cache of document APIs, \
+    so it's built only once for documents that share the same schema locations.
     :param kwargs: other optional arguments for building :class:`XMLResource` or \
     :class:`XMLSchema` instances provided as keyword arguments.
     """
     kwargs.update(locations=locations, use_location_hints=use_location_hints)
-    source, schema = get_context(xml_document, schema, cls, **kwargs)
+    source, schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     schema.validate(source, path, schema_path, use_defaults, namespaces,
                     use_location_hints=use_location_hints)
 
@@ -196,13 +301,14 @@ def is_valid(xml_document: Union[XMLSourceType, XMLResource],
              namespaces: Optional[NsmapType] = None,
              locations: Optional[LocationsType] = None,
              use_location_hints: bool = True,
+             use_schema_cache: bool = False,
              **kwargs: Any) -> bool:
     """
     Like :meth:`validate` except that do not raise an exception but returns ``True`` if
     the XML document is valid, ``False`` if it's invalid.
     """
     kwargs.update(validation='lax', locations=locations, use_location_hints=use_location_hints)
-    source, schema = get_context(xml_document, schema, cls, **kwargs)
+    source, schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     return schema.is_valid(source, path, schema_path, use_defaults, namespaces,
                            use_location_hints=use_location_hints)
 
@@ -216,15 +322,21 @@ def iter_errors(xml_document: Union[XMLSourceType, XMLResource],
                 namespaces: Optional[NsmapType] = None,
                 locations: Optional[LocationsType] = None,
                 use_location_hints: bool = True,
+                use_schema_cache: bool = False,
+                max_errors: Optional[int] = None,
+                aggregate_errors: Optional[int] = None,
                 **kwargs: Any) -> Iterator[XMLSchemaValidationError]:
     """
     Creates an iterator for the errors generated by the validation of an XML document.
-    Takes the same arguments of the function :meth:`validate`.
+    Takes the same arguments of the function :meth:`validate`, plus the optional
+    arguments *max_errors* and *aggregate_errors* of :meth:`XMLSchemaBase.iter_errors`.
     """
     kwargs.update(validation='lax', locations=locations, use_location_hints=use_location_hints)
-    source, schema = get_context(xml_document, schema, cls, **kwargs)
+    source, schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     return schema.iter_errors(source, path, schema_path, use_defaults, namespaces,
-                              use_location_hints=use_location_hints)
+                              use_location_hints=use_location_hints,
+                              max_errors=max_errors,
+                              aggregate_errors=aggregate_errors)
 
 
 def iter_decode(xml_document: Union[XMLSourceType, XMLResource],
@@ -234,6 +346,7 @@ def iter_decode(xml_document: Union[XMLSourceType, XMLResource],
                 validation: str = 'lax',
                 locations: Optional[LocationsType] = None,
                 use_location_hints: bool = True,
+                use_schema_cache: bool = False,
                 **kwargs: Any) -> Iterator[Union[Any, XMLSchemaValidationError]]:
     """
     Creates an iterator for decoding an XML source to a data structure. For default
@@ -257,6 +370,9 @@ def iter_decode(xml_document: Union[XMLSourceType, XMLResource],
     :param use_location_hints: for default, in case a schema instance has \
     to be built, uses also schema locations hints provided within XML data. \
     set this option to `False` to ignore these schema location hints.
+    :param use_schema_cache: if `True` a schema built from the location hints \
+    of the XML data is taken from and stored in the LRU cache of document APIs, \
+    so it's built only once for documents that share the same schema locations.
     :param kwargs: other optional arguments of :meth:`XMLSchemaBase.iter_decode` \
     or for building :class:`XMLResource` or :class:`XMLSchema` instances provided \
     as keyword arguments.
@@ -268,7 +384,7 @@ def iter_decode(xml_document: Union[XMLSourceType, XMLResource],
         locations=locations,
         use_location_hints=use_location_hints
     )
-    source, _schema = get_context(xml_document, schema, cls, **kwargs)
+    source, _schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     yield from _schema.iter_decode(source, path=path, **kwargs)
 
 
@@ -279,6 +395,7 @@ def to_dict(xml_document: Union[XMLSourceType, XMLResource],
             validation: str = 'strict',
             locations: Optional[LocationsType] = None,
             use_location_hints: bool = True,
+            use_schema_cache: bool = False,
             **kwargs: Any) -> DecodeType[Any]:
     """
     Decodes an XML document to a Python's nested dictionary. Takes the same arguments
@@ -294,7 +411,7 @@ def to_dict(xml_document: Union[XMLSourceType, XMLResource],
         locations=locations,
         use_location_hints=use_location_hints
     )
-    source, _schema = get_context(xml_document, schema, cls, **kwargs)
+    source, _schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     return _schema.decode(source, path=path, **kwargs)
 
 
@@ -307,6 +424,7 @@ def to_json(xml_document: Union[XMLSourceType, XMLResource],
             locations: Optional[LocationsType] = None,
             use_location_hints: bool = True,
             json_options: Optional[dict[str, Any]] = None,
+            use_schema_cache: bool = False,
             **kwargs: Any) -> JsonDecodeType:
     """
     Serialize an XML document to JSON. For default the XML data is validated during
@@ -331,6 +449,9 @@ def to_json(xml_document: Union[XMLSourceType, XMLResource],
     :param use_location_hints: for default, in case a schema instance has \
     to be built, uses also schema locations hints provided within XML data. \
     set this option to `False` to ignore these schema location hints.
+    :param use_schema_cache: if `True` a schema built from the location hints \
+    of the XML data is taken from and stored in the LRU cache of document APIs, \
+    so it's built only once for documents that share the same schema locations.
     :param json_options: a dictionary with options for the JSON serializer.
     :param kwargs: optional arguments of :meth:`XMLSchemaBase.iter_decode` as keyword arguments \
     to variate the decoding process.
@@ -345,7 +466,7 @@ def to_json(xml_document: Union[XMLSourceType, XMLResource],
         locations=locations,
         use_location_hints=use_location_hints
     )
-    source, _schema = get_context(xml_document, schema, cls, **kwargs)
+    source, _schema = get_context(xml_document, schema, cls, use_schema_cache, **kwargs)
     if json_options is None:
         json_options = {}
     if 'decimal_type' not in kwargs:
@@ -534,6 +655,9 @@ class XmlDocument(XMLResource):
     :param use_location_hints: for default, in case a schema instance has \
     to be built, uses also schema locations hints provided within XML data. \
     set this option to `False` to ignore these schema location hints.
+    :param use_schema_cache: if `True` a schema built from the location hints \
+    of the XML data is taken from and stored in the LRU cache of document APIs, \
+    so it's built only once for documents that share the same schema locations.
     :param kwargs: other optional arguments for building :class:`XMLResource` or \
     :class:`XMLSchema` instances provided as keyword arguments.
     """
@@ -553,6 +677,7 @@ class XmlDocument(XMLResource):
                  namespaces: Optional[NsmapType] = None,
                  locations: Optional[LocationsType] = None,
                  use_location_hints: bool = True,
+                 use_schema_cache: bool = False,
                  **kwargs: Any) -> None:
 
         super().__init__(source, **{k: kwargs[k] for k in kwargs if k in RESOURCE_KWARGS})
@@ -568,6 +693,7 @@ class XmlDocument(XMLResource):
             validation=validation,
             locations=locations,
             use_location_hints=use_location_hints,
+            use_schema_cache=use_schema_cache,
             **{k: kwargs[k] for k in kwargs if k in SCHEMA_KWARGS}
         )
 
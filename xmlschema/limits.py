@@ -19,7 +19,7 @@ from xmlschema import _limits
 
 class LimitsModule(ModuleType):
     def __setattr__(self, attr: str, value: Any) -> None:
-        if attr not in ('MAX_MODEL_DEPTH', 'MAX_SCHEMA_SOURCES',
+        if attr not in ('MAX_MODEL_DEPTH', 'MAX_MODEL_STATES', 'MAX_SCHEMA_SOURCES',
                         'MAX_XML_DEPTH', 'MAX_XML_ELEMENTS'):
             pass
         elif not isinstance(value, int):
@@ -28,6 +28,10 @@ class LimitsModule(ModuleType):
             if value < 5:
                 raise XMLSchemaValueError(_('{} limit must be at least 5').format(attr))
             _limits.MAX_MODEL_DEPTH = value
+        elif attr == 'MAX_MODEL_STATES':
+            if value < 0:
+                raise XMLSchemaValueError(_('{} limit must be at least 0').format(attr))
+            _limits.MAX_MODEL_STATES = value
         elif attr == 'MAX_SCHEMA_SOURCES':
             if value < 10:
                 raise XMLSchemaValueError(_('{} limit must be at least 10').format(attr))
@@ -49,6 +53,13 @@ Maximum XSD model group depth. An `XMLSchemaModelDepthError` is raised if
 this limit is exceeded.
 """
 
+MAX_MODEL_STATES = 500
+"""
+Maximum number of states of the automata compiled from model groups for a fast
+validation of child elements. Models that need more states are validated without
+a compiled automaton. Set to 0 to disable the compilation of model groups.
+"""
+
 MAX_SCHEMA_SOURCES = 1000
 """
 Maximum number of XSD schema sources loadable by each `XsdGlobals` instance.
@@ -10,14 +10,16 @@
 import logging
 import warnings
 import functools
+from collections.abc import Iterator
 from operator import attrgetter
 from types import MappingProxyType
 from typing import Any, Optional, TYPE_CHECKING, cast
 
-from xmlschema.aliases import SchemaType, SourceArgType, LocationsType
+from xmlschema.aliases import ElementType, SchemaType, SourceArgType, LocationsType
 from xmlschema.exceptions import XMLSchemaTypeError, XMLSchemaValueError, \
     XMLResourceBlocked, XMLResourceForbidden, XMLResourceError, XMLResourceParseError
 from xmlschema.translation import gettext as _
+from xmlschema.resources import XMLResource
 from xmlschema.utils.urls import normalize_url
 from xmlschema.utils.etree import iter_schema_declarations
 from xmlschema.arguments import Option, validate_subclass
@@ -46,6 +48,7 @@ class SchemaLoader:
     locations: NamespaceResourcesMap[str]
     schema_class: type[SchemaType]
     missing_locations: set[str]  # Missing or failing resource locations
+    prefetched: dict[str, XMLResource]  # Resources fetched concurrently, by URL
 
     __slots__ = ('maps', 'namespaces', 'locations', 'missing_locations', '__dict__')
 
@@ -59,6 +62,8 @@ class SchemaLoader:
         self.schema_class = type(maps.validator)
         self.locations = get_locations(locations, maps.validator.base_url)
         self.missing_locations = set()
+        self.max_workers = maps.settings.loader_workers
+        self.prefetched = {}
 
         if not use_fallback:
             self.fallback_locations = MappingProxyType({})
@@ -81,6 +86,71 @@ class SchemaLoader:
 
         return locations
 
+    def prefetch(self, schema: SchemaType) -> None:
+        """
+        Fetches and parses concurrently, using a pool of *max_workers* threads,
+        the sources referred by the import/include declarations of a schema and,
+        recursively, by the declarations of the fetched sources. The resources are
+        saved into the *prefetched* map, to be used by :meth:`load_schema`, so the
+        schemas are still loaded and registered in the order of the declarations.
+        Failing sources are skipped, the errors are reported later by the loading.
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        self.prefetched.clear()
+        settings = self.maps.settings
+        namespaces = set(self.namespaces)
+        urls = {s.url for s in self.maps.schemas if s.url is not None}
+        urls.update(self.missing_locations)
+
+        def iter_locations(root: ElementType, base_url: Optional[str]) -> Iterator[str]:
+            for elem in iter_schema_declarations(root):
+                location = elem.get('schemaLocation')
+                if elem.tag == nm.XSD_IMPORT:
+                    namespace = elem.get('namespace', '').strip()
+                    if namespace in namespaces:
+                        continue
+                    namespaces.add(namespace)
+                    if not location and namespace in self.locations:
+                        location = self.locations[namespace][0]
+
+                if location:
+                    url = normalize_url(location, base_url)
+                    if url not in urls:
+                        urls.add(url)
+                        yield url
+
+            if root is schema.source.root:
+                for ns, locations in self.locations.items():
+                    if ns not in namespaces and locations:
+                        namespaces.add(ns)
+                        url = normalize_url(locations[0], base_url)
+                        if url not in urls:
+                            urls.add(url)
+                            yield url
+
+        futures: dict[Future[XMLResource], str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for url in iter_locations(schema.source.root, schema.base_url):
+                futures[executor.submit(settings.get_schema_resource, url)] = url
+
+            while futures:
+                done, _not_done = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = futures.pop(future)
+                    try:
+                        resource = future.result()
+                    except (OSError, ValueError, SyntaxError, XMLResourceError) as err:
+                        logger.debug("Prefetch of %r failed: %s", url, err)
+                        continue
+
+                    self.prefetched[url] = resource
+                    for other_url in iter_locations(resource.root, resource.base_url):
+                        other = executor.submit(settings.get_schema_resource, other_url)
+                        futures[other] = other_url
+
+        logger.debug("Prefetched %d resources for schema %r", len(self.prefetched), schema)
+
     def load_declared_schemas(self, schema: SchemaType,
                               other_sources: Optional[list[SourceArgType]] = None) -> None:
         """
@@ -90,6 +160,9 @@ class SchemaLoader:
         if schema not in self.maps.schemas or schema.maps is not self.maps:
             raise XMLSchemaValueError(f"{schema} is not owned by {self.maps}!")
 
+        if self.max_workers and self.maps.validator is schema:
+            self.prefetch(schema)
+
         logger.debug("Processes inclusions and imports of schema %r", self)
         schema.imported_namespaces.clear()
         base_url = schema.base_url
@@ -173,6 +246,7 @@ class SchemaLoader:
             for ns in self.locations:
                 if ns not in self.maps.namespaces:
                     self.import_namespace(schema, ns)
+            self.prefetched.clear()
 
         # Add explicitly provided other schemas
         if other_sources:
@@ -309,6 +383,9 @@ class SchemaLoader:
             logger.info("Resource %r is already loaded", schema.source)
             return schema
 
+        if self.prefetched and isinstance(source, str):
+            source = self.prefetched.pop(normalize_url(source, base_url), source)
+
         return self.schema_class(
             source=source,
             namespace=namespace,
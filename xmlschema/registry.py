@@ -0,0 +1,224 @@
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+"""
+A process-wide registry of built schemas. Schema instances created from the same
+source, with the same schema class and settings, share the same built instance,
+and so the same global maps and components, instead of being loaded and built
+for each request.
+"""
+import hashlib
+import threading
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, cast
+
+from xmlschema.aliases import SchemaType, SourceArgType
+from xmlschema.settings import SchemaSettings
+from xmlschema.snapshots import SourceFingerprint, get_fingerprint, check_fingerprint
+from xmlschema.utils.urls import get_url, normalize_url
+
+# Settings that don't affect the schema instance
+EXCLUDED_SETTINGS = frozenset(('loglevel', 'loader_workers', 'cache_dir'))
+
+
+def get_setting_key(value: Any) -> str:
+    """
+    Returns a string that identifies a setting value within the process. Classes
+    and callables are identified by the object, because different callables can
+    share the same name (e.g. lambdas or partial objects), so the settings have
+    to be kept alive for all the lifetime of the key.
+    """
+    if isinstance(value, type) or callable(value):
+        module = getattr(value, '__module__', '')
+        qualname = getattr(value, '__qualname__', type(value).__qualname__)
+        return f"{module}.{qualname}@{id(value):#x}"
+    elif isinstance(value, dict):
+        return repr(sorted((k, get_setting_key(v)) for k, v in value.items()))
+    return repr(value)
+
+
+def get_schema_key(cls: type[SchemaType],
+                   source: SourceArgType,
+                   settings: SchemaSettings) -> Optional[str]:
+    """
+    Returns a key for a schema source, the schema class and the settings,
+    `None` if the source is not a URL, a path or a string containing the schema.
+    Callable settings are keyed by identity, see :func:`get_setting_key`.
+    """
+    if isinstance(source, (str, bytes, Path)):
+        url = get_url(source)
+    else:
+        return None
+
+    if url is not None:
+        source_ref = normalize_url(url, settings.base_url)
+    elif isinstance(source, str):
+        source_ref = hashlib.sha256(source.encode()).hexdigest()
+    else:
+        source_ref = hashlib.sha256(cast(bytes, source)).hexdigest()
+
+    items: list[Any] = [f'{cls.__module__}.{cls.__qualname__}', cls.XSD_VERSION, source_ref]
+    items.extend(
+        (fld.name, get_setting_key(getattr(settings, fld.name)))
+        for fld in fields(settings) if fld.name not in EXCLUDED_SETTINGS
+    )
+    return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+def get_schema_fingerprints(schema: SchemaType) -> list[SourceFingerprint]:
+    """Returns the fingerprints of the local files loaded by a schema."""
+    return [get_fingerprint(s.source.filepath)
+            for s in schema.maps.owned_schemas if s.source.filepath is not None]
+
+
+class RegistryEntry(NamedTuple):
+    schema: SchemaType
+    fingerprints: list[SourceFingerprint]
+    settings: SchemaSettings  # keeps alive the callables keyed by identity
+
+    def is_changed(self) -> bool:
+        """Returns `True` if a local file loaded by the schema is changed."""
+        return not all(check_fingerprint(x) for x in self.fingerprints)
+
+
+class SchemaRegistry:
+    """
+    A thread-safe registry of built schemas, keyed by the schema class, the XSD
+    version, the normalized source URL (or the digest of a source provided as
+    a string) and the schema settings, including location hints. Registered
+    schemas are shared, so they should be used only for validation, decoding
+    and encoding, without loading further schemas into their global maps.
+    """
+    __slots__ = ('_entries', '_building', '_lock')
+
+    def __init__(self) -> None:
+        self._entries: dict[str, RegistryEntry] = {}
+        self._building: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '%s(%d schemas)' % (self.__class__.__name__, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, schema: object) -> bool:
+        return any(e.schema is schema for e in self._entries.values())
+
+    @property
+    def schemas(self) -> list[SchemaType]:
+        """A list of the registered schemas."""
+        with self._lock:
+            return [e.schema for e in self._entries.values()]
+
+    def get_key(self, cls: type[SchemaType],
+                source: SourceArgType,
+                settings: SchemaSettings) -> Optional[str]:
+        """
+        Returns the registry key for a schema source, `None` if the source
+        is not a URL, a path or a string containing the schema.
+        """
+        return get_schema_key(cls, source, settings)
+
+    def get_schema(self, source: SourceArgType,
+                   cls: Optional[type[SchemaType]] = None,
+                   **kwargs: Any) -> SchemaType:
+        """
+        Returns the registered schema for the source, the schema class and the
+        settings. If the schema is not registered yet, it's created, built and
+        registered. Schemas from sources that can't be keyed (e.g. file-like
+        objects or Element trees) are created without registering them.
+
+        :param source: the schema source, usually a URL or a file path.
+        :param cls: the schema class, for default is :class:`xmlschema.XMLSchema10`.
+        :param kwargs: schema settings options.
+        """
+        if cls is None:
+            from xmlschema.validators import XMLSchema10
+            cls = cast(type[SchemaType], XMLSchema10)
+
+        settings = cast(SchemaSettings, SchemaSettings.get_settings(**kwargs))
+        key = self.get_key(cls, source, settings)
+        if key is None:
+            return settings.get_schema(cls, source)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.schema
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        with build_lock:
+            # Another thread could have registered the schema in the meantime
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.schema
+
+            try:
+                schema = settings.get_schema(cls, source)
+                fingerprints = get_schema_fingerprints(schema)
+                with self._lock:
+                    self._entries[key] = RegistryEntry(schema, fingerprints, settings)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+        return schema
+
+    def evict(self, source: SourceArgType,
+              cls: Optional[type[SchemaType]] = None,
+              **kwargs: Any) -> bool:
+        """
+        Removes the schema registered for the source, the schema class and
+        the settings. Returns `True` if a schema is removed, `False` otherwise.
+        Arguments are the same of :meth:`get_schema`.
+        """
+        if cls is None:
+            from xmlschema.validators import XMLSchema10
+            cls = cast(type[SchemaType], XMLSchema10)
+
+        settings = cast(SchemaSettings, SchemaSettings.get_settings(**kwargs))
+        key = self.get_key(cls, source, settings)
+        if key is None:
+            return False
+
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate(self, url: Optional[str] = None) -> int:
+        """
+        Removes the registered schemas that have loaded a specific source, or,
+        if no URL is provided, the schemas that have loaded local files that
+        are changed after the registration. Returns the number of removed schemas.
+
+        :param url: an optional URL or file path of a schema source.
+        """
+        if url is not None:
+            url = normalize_url(url)
+
+        with self._lock:
+            if url is not None:
+                keys = [k for k, e in self._entries.items()
+                        if any(s.url == url for s in e.schema.maps.owned_schemas)]
+            else:
+                keys = [k for k, e in self._entries.items() if e.is_changed()]
+
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Removes all the registered schemas."""
+        with self._lock:
+            self._entries.clear()
+
+
+schema_registry = SchemaRegistry()
+"""The process-wide registry of built schemas."""
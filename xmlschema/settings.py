@@ -19,14 +19,16 @@ from xmlschema.exceptions import XMLSchemaTypeError, XMLResourceError, XMLSchema
 from xmlschema.translation import gettext as _
 from xmlschema.arguments import BooleanOption, BaseUrlOption, AllowOption, \
     DefuseOption, LazyOption, BlockOption, UriMapperOption, IterParseOption, \
-    SelectorOption, OpenerOption, PositiveIntOption, LocationsOption, \
-    ValidationOption, LogLevelOption
+    SelectorOption, OpenerOption, PositiveIntOption, NonNegIntOption, \
+    LocationsOption, ValidationOption, LogLevelOption, CacheDirOption, \
+    ModelCheckerOption
 from xmlschema.utils.decoding import raw_encode_value, raw_encode_attributes
 from xmlschema.utils.etree import is_etree_element, is_etree_document
 from xmlschema.resources import XMLResource
 from xmlschema.converters import XMLSchemaConverter, ConverterOption, ConverterType
 from xmlschema.loaders import SchemaLoader, LoaderClassOption
 from xmlschema.caching import SchemaCache
+from xmlschema.snapshots import SchemaSnapshots
 from xmlschema.xpath import ElementSelector
 
 
@@ -175,6 +177,13 @@ class SchemaSettings(ResourceSettings):
     to load well-known namespaces (e.g. xhtml).
     """
 
+    loader_workers: NonNegIntOption = NonNegIntOption(default=0)
+    """
+    The maximum number of threads used by the schema loader for fetching and parsing
+    imported and included sources concurrently. For default is 0, that means the
+    sources are fetched one at a time, while processing the declarations.
+    """
+
     use_xpath3: BooleanOption = BooleanOption(default=False)
     """
     If `True` an XSD 1.1 schema instance uses the XPath 3 processor for assertions.
@@ -194,6 +203,22 @@ class SchemaSettings(ResourceSettings):
     predefined meta-schemas.
     """
 
+    lazy_build: BooleanOption = BooleanOption(default=False)
+    """
+    If `True` the global components of the schemas are built on demand, at first
+    lookup, instead of being all built with the global maps. Use :meth:`build_all`
+    on the schema for building and checking all the components.
+    """
+
+    model_checker: ModelCheckerOption = ModelCheckerOption(default='paths')
+    """
+    The algorithm used for checking the Unique Particle Attribution and the Element
+    Declarations Consistent constraints on content models. For default is 'paths',
+    that compares the paths of the particles pairwise. Provide 'automaton' for using
+    the follow sets of the position automaton of each model, that scales better
+    on large or deeply nested models.
+    """
+
     loglevel: LogLevelOption = LogLevelOption(default=None)
     """
     Used for setting a different logging level for schema initialization and building.
@@ -202,6 +227,13 @@ class SchemaSettings(ResourceSettings):
     building, when exiting the initialization method.
     """
 
+    cache_dir: CacheDirOption = CacheDirOption(default=None)
+    """
+    An optional directory path for saving snapshots of built schemas. If provided
+    a schema is restored from its snapshot, instead of being loaded and built, when
+    the URL, the modification time and the content of every loaded source still match.
+    """
+
     _DEFAULT_SETTINGS = '_DEFAULT_SCHEMA_SETTINGS'
 
     def get_xml_resource(self, source: SourceArgType) -> XMLResource:
@@ -319,6 +351,15 @@ class SchemaSettings(ResourceSettings):
         """Returns a new :class:`SchemaCache` instance for schema settings."""
         return SchemaCache(self.use_cache)
 
+    def get_snapshots(self) -> Optional[SchemaSnapshots]:
+        """
+        Returns a :class:`SchemaSnapshots` instance for the cache directory option,
+        or `None` if the option is not set.
+        """
+        if self.cache_dir is None:
+            return None
+        return SchemaSnapshots(self.cache_dir)
+
     def get_schema(self, cls: type[SchemaType],
                    source: Union[SourceArgType, list[SourceArgType]],
                    **kwargs: Any) -> SchemaType:
@@ -0,0 +1,403 @@
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+"""
+Persistent on-disk snapshots of built schemas. A snapshot is the pickled state
+of a schema instance, including its global maps, saved after the build and
+restored by later initializations if the loaded sources are not changed.
+The module also provides the save/load functions for the pre-built snapshots
+of class meta-schemas, that are generated at package build time.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, cast, Optional, TYPE_CHECKING
+
+from xmlschema.aliases import SchemaType
+from xmlschema.locations import SCHEMAS_DIR
+
+if TYPE_CHECKING:
+    from xmlschema.settings import SchemaSettings
+
+logger = logging.getLogger('xmlschema')
+
+SNAPSHOT_FORMAT = 1
+
+# Settings that affect the build of a schema and are part of the snapshot key
+SNAPSHOT_SETTINGS = ('validation', 'locations', 'use_fallback', 'use_xpath3', 'use_meta',
+                     'use_cache', 'loader_class', 'base_url', 'allow', 'defuse', 'block',
+                     'uri_mapper', 'opener', 'timeout', 'lazy_build', 'model_checker')
+
+# Fixed protocol for meta-schema snapshots, that are shipped with the package
+META_SNAPSHOT_PROTOCOL = 5
+
+SourceFingerprint = tuple[str, int, int, str]
+
+
+def get_file_digest(filepath: str) -> str:
+    """Returns the SHA-256 hex digest of the content of a file."""
+    with open(filepath, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_modules_digest() -> Optional[str]:
+    """
+    Returns a digest of the Python modules of the package, that define the classes
+    of the pickled instances, or `None` for an installed distribution, where the
+    code is identified by the package version. In a source checkout, where the code
+    can change without a version bump, the digest is computed from the relative
+    paths, the modification times and the sizes of the modules.
+    """
+    package_dir = Path(__file__).parent
+    if not package_dir.parent.joinpath('pyproject.toml').is_file():
+        return None
+
+    hasher = hashlib.sha256()
+    for filepath in sorted(package_dir.rglob('*.py')):
+        stat = filepath.stat()
+        relpath = filepath.relative_to(package_dir).as_posix()
+        hasher.update(f'{relpath}:{stat.st_mtime_ns}:{stat.st_size}\n'.encode())
+    return hasher.hexdigest()
+
+
+def get_fingerprint(filepath: str) -> SourceFingerprint:
+    stat = os.stat(filepath)
+    return filepath, stat.st_mtime_ns, stat.st_size, get_file_digest(filepath)
+
+
+def check_fingerprint(fingerprint: SourceFingerprint) -> bool:
+    """
+    Returns `True` if the source file matches the fingerprint. The content
+    hash is compared only if the modification time or the size differ.
+    """
+    filepath, mtime_ns, size, digest = fingerprint
+    try:
+        stat = os.stat(filepath)
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            return True
+        return stat.st_size == size and get_file_digest(filepath) == digest
+    except OSError:
+        return False
+
+
+def get_setting_repr(value: Any) -> Optional[str]:
+    """
+    Returns a persistent representation of a setting value, `None` if the value
+    is a class or a callable that can't be identified by its module and qualified
+    name, e.g. a lambda, a nested function, a partial object or a bound method,
+    or if the value is an object without a representation, e.g. an opener.
+    """
+    if isinstance(value, type) or callable(value):
+        module = getattr(value, '__module__', None)
+        qualname = getattr(value, '__qualname__', None)
+        if not isinstance(module, str) or not isinstance(qualname, str) or '<' in qualname:
+            return None
+
+        obj = sys.modules.get(module)
+        for name in qualname.split('.'):
+            obj = getattr(obj, name, None)
+        return f"{module}.{qualname}" if obj is value else None
+
+    elif isinstance(value, dict):
+        items = [(k, get_setting_repr(v)) for k, v in value.items()]
+        if any(v is None for _, v in items):
+            return None
+        return repr(sorted(items))
+    elif getattr(type(value), '__repr__') is object.__repr__:
+        return None  # the default repr includes the address of the object
+    return repr(value)
+
+
+class _MetaSchemaIndex:
+    """
+    Maps the components of a built class meta-schema to persistent IDs,
+    so that a snapshot doesn't include a copy of the meta-schema.
+    """
+    __slots__ = ('objects', 'ids')
+
+    def __init__(self, meta_schema: SchemaType) -> None:
+        maps = meta_schema.maps
+        self.objects: dict[Any, Any] = {('maps',): maps}
+        for schema in maps.schemas:
+            self.objects[('schema', schema.url)] = schema
+
+        global_maps = cast(Iterable[Mapping[str, Any]], maps.global_maps)
+        for k, global_map in enumerate(global_maps):
+            for name, component in global_map.items():
+                self.objects[('global', k, name)] = component
+
+        self.ids = {id(v): k for k, v in self.objects.items()}
+
+
+class SchemaSnapshots:
+    """
+    A directory of schema snapshots. Each snapshot is stored in a file named
+    with a key computed from the schema class, the XSD version, the source and
+    the build related settings. A snapshot is reloaded only if the URL, the
+    modification time and the content hash of every loaded source still match.
+
+    :param cache_dir: the path of the directory where to save the snapshots.
+    """
+    __slots__ = ('cache_dir',)
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def __repr__(self) -> str:
+        return '%s(cache_dir=%r)' % (self.__class__.__name__, str(self.cache_dir))
+
+    def get_key(self, schema: SchemaType, settings: 'SchemaSettings') -> Optional[str]:
+        """
+        Returns the snapshot key for a schema instance that is not loaded yet,
+        `None` if the schema source or a setting is not suitable for a snapshot.
+        """
+        from xmlschema import __version__
+
+        if schema.source.filepath is not None:
+            source_ref = schema.source.url
+        elif schema.source.url is None:
+            source_ref = hashlib.sha256(schema.source.get_text().encode()).hexdigest()
+        else:
+            return None  # a remote source
+
+        cls = schema.__class__
+        items = [
+            __version__, get_modules_digest(), SNAPSHOT_FORMAT,
+            f'{cls.__module__}.{cls.__qualname__}', cls.XSD_VERSION, source_ref,
+            sys.version_info[:2],
+        ]
+        for name in SNAPSHOT_SETTINGS:
+            value_repr = get_setting_repr(getattr(settings, name))
+            if value_repr is None:
+                return None  # a setting that can't be identified between processes
+            items.append(value_repr)
+        return hashlib.sha256(repr(items).encode()).hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        return self.cache_dir.joinpath(f'{key}.pickle')
+
+    def load(self, schema: SchemaType, key: str) -> bool:
+        """
+        Restores the state of a schema instance from a snapshot. Returns `True`
+        if the snapshot is found and is valid, `False` otherwise.
+        """
+        path = self.get_path(key)
+        if not path.is_file():
+            return False
+
+        meta_index = None
+        if schema.meta_schema is not None:
+            schema.meta_schema.build()
+            meta_index = _MetaSchemaIndex(schema.meta_schema)
+
+        def persistent_load(pid: Any) -> Any:
+            if pid == 'validator':
+                return schema
+            elif meta_index is None:
+                raise pickle.UnpicklingError(f"unexpected persistent ID {pid!r}")
+            return meta_index.objects[pid]
+
+        try:
+            with path.open('rb') as fp:
+                unpickler = pickle.Unpickler(fp)
+                fingerprints = unpickler.load()
+                if not all(check_fingerprint(x) for x in fingerprints):
+                    logger.info("Schema snapshot %r is outdated", str(path))
+                    return False
+
+                unpickler.persistent_load = persistent_load  # type: ignore[method-assign]
+                state = unpickler.load()
+        except (OSError, EOFError, KeyError, AttributeError, ImportError,
+                TypeError, ValueError, pickle.UnpicklingError) as err:
+            logger.warning("Can't load schema snapshot %r: %s", str(path), err)
+            return False
+
+        schema.__setstate__(state)
+        logger.debug("Schema %r restored from snapshot %r", schema, str(path))
+        return True
+
+    def save(self, schema: SchemaType, key: str) -> bool:
+        """
+        Saves a snapshot of a built schema instance, that must be the main validator
+        of its global maps. Returns `True` if the snapshot is saved, `False` otherwise.
+        """
+        if schema.maps.validator is not schema or not schema.maps.built:
+            return False
+
+        fingerprints = []
+        for s in schema.maps.owned_schemas:
+            if s.source.filepath is not None:
+                fingerprints.append(get_fingerprint(s.source.filepath))
+            elif s is not schema:
+                return False  # A source not loaded from a file
+
+        meta_index = None
+        if schema.meta_schema is not None and schema.maps.parent is schema.meta_schema:
+            meta_index = _MetaSchemaIndex(schema.meta_schema)
+
+        def persistent_id(obj: Any) -> Any:
+            if obj is schema:
+                return 'validator'
+            elif meta_index is not None:
+                return meta_index.ids.get(id(obj))
+            return None
+
+        path = self.get_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    pickler = pickle.Pickler(fp, pickle.HIGHEST_PROTOCOL)
+                    pickler.dump(fingerprints)
+                    pickler.persistent_id = persistent_id  # type: ignore[method-assign]
+                    pickler.dump(schema.__getstate__())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, AttributeError, TypeError, pickle.PicklingError) as err:
+            logger.warning("Can't save schema snapshot %r: %s", str(path), err)
+            return False
+
+        logger.debug("Schema %r saved to snapshot %r", schema, str(path))
+        return True
+
+    def clear(self) -> None:
+        """Removes all the snapshots from the cache directory."""
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob('*.pickle'):
+                path.unlink()
+
+
+def _get_meta_snapshot_header(meta_schema: SchemaType) -> dict[str, Any]:
+    import elementpath
+    from xmlschema import __version__
+
+    sources = {}
+    for schema in meta_schema.maps.owned_schemas:
+        if schema.source.filepath is not None:
+            filepath = Path(schema.source.filepath)
+            relpath = filepath.relative_to(SCHEMAS_DIR).as_posix()
+            sources[relpath] = get_file_digest(str(filepath))
+
+    return {
+        'format': SNAPSHOT_FORMAT,
+        'xmlschema': __version__,
+        'elementpath': elementpath.__version__,
+        'modules': get_modules_digest(),
+        'sources': sources,
+    }
+
+
+def save_meta_snapshot(meta_schema: SchemaType, path: str) -> None:
+    """
+    Saves a snapshot of a built meta-schema. Paths and URLs that refer to
+    the package's schemas directory are stored relative to it, so the snapshot
+    doesn't depend on the installation path.
+
+    :param meta_schema: a built meta-schema instance.
+    :param path: the path of the snapshot file.
+    """
+    if not meta_schema.maps.built:
+        raise ValueError(f"{meta_schema!r} is not built")
+
+    header = _get_meta_snapshot_header(meta_schema)
+    prefixes = [('uri', SCHEMAS_DIR.as_uri() + '/'), ('path', str(SCHEMAS_DIR) + os.sep)]
+
+    def persistent_id(obj: Any) -> Any:
+        if isinstance(obj, str):
+            for kind, prefix in prefixes:
+                if obj.startswith(prefix):
+                    return kind, obj[len(prefix):]
+        return None
+
+    dirname = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            pickler = pickle.Pickler(fp, META_SNAPSHOT_PROTOCOL)
+            pickler.dump(header)
+            pickler.persistent_id = persistent_id  # type: ignore[method-assign]
+            pickler.dump(meta_schema)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_meta_snapshot(meta_schema_class: type[SchemaType], path: str) \
+        -> Optional[SchemaType]:
+    """
+    Loads a meta-schema from a snapshot. Returns `None` if the snapshot is
+    missing or if it doesn't match the package versions, the package modules
+    and the XSD sources.
+
+    :param meta_schema_class: the class of the meta-schema.
+    :param path: the path of the snapshot file.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    schemas_uri = SCHEMAS_DIR.as_uri() + '/'
+
+    def persistent_load(pid: Any) -> Any:
+        kind, relpath = pid
+        if kind == 'uri':
+            return schemas_uri + relpath
+        elif kind == 'path':
+            return str(SCHEMAS_DIR.joinpath(relpath))
+        raise pickle.UnpicklingError(f"unexpected persistent ID {pid!r}")
+
+    try:
+        with open(path, 'rb') as fp:
+            unpickler = pickle.Unpickler(fp)
+            header = unpickler.load()
+            if not isinstance(header, dict) or header.get('format') != SNAPSHOT_FORMAT:
+                logger.info("Meta-schema snapshot %r has a different format", path)
+                return None
+
+            import elementpath
+            from xmlschema import __version__
+
+            if header['xmlschema'] != __version__ or \
+                    header['elementpath'] != elementpath.__version__:
+                logger.info("Meta-schema snapshot %r has different versions", path)
+                return None
+
+            modules_digest = get_modules_digest()
+            if modules_digest is not None and header.get('modules') != modules_digest:
+                logger.info("Meta-schema snapshot %r was saved by different code", path)
+                return None
+
+            for relpath, digest in header['sources'].items():
+                if get_file_digest(str(SCHEMAS_DIR.joinpath(relpath))) != digest:
+                    logger.info("Meta-schema snapshot %r is outdated", path)
+                    return None
+
+            unpickler.persistent_load = persistent_load  # type: ignore[method-assign]
+            meta_schema = unpickler.load()
+    except (OSError, EOFError, KeyError, AttributeError, ImportError,
+            TypeError, ValueError, pickle.UnpicklingError) as err:
+        logger.warning("Can't load meta-schema snapshot %r: %s", path, err)
+        return None
+
+    if not isinstance(meta_schema, meta_schema_class) or not meta_schema.maps.built:
+        logger.warning("Meta-schema snapshot %r doesn't contain a built "
+                       "instance of %r", path, meta_schema_class)
+        return None
+
+    return meta_schema
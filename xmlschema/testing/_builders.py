@@ -474,6 +474,18 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
             self.assertEqual(lax_decoded_data[0], self.chunks[0], msg=xml_file)
             self.assertEqual(skip_decoded_data, self.chunks[0], msg=xml_file)
 
+        def check_decode_plans(self):
+            # Compare with the decoding performed with specialized decode plans
+            for kwargs in ({}, {'keep_empty': True}, {'decimal_type': str},
+                           {'converter': JsonMLConverter}):
+                decoded_data = self.schema.decode(xml_file, validation='lax', **kwargs)
+                plan_decoded_data = self.schema.decode(
+                    xml_file, validation='lax', use_decode_plans=True, **kwargs
+                )
+                self.assertEqual(plan_decoded_data[0], decoded_data[0], msg=xml_file)
+                self.assertListEqual([e.path for e in plan_decoded_data[1]],
+                                     [e.path for e in decoded_data[1]], msg=xml_file)
+
         def check_data_conversion_with_element_tree(self):
             root = ElementTree.parse(xml_file).getroot()
             namespaces = fetch_namespaces(xml_file)  # need a collapsed nsmap
@@ -630,6 +642,12 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
                 compare_error_reasons(e.reason, lazy_error.reason)
             self.assertEqual(len(errors), len(lazy_errors), msg=xml_file)
 
+            plan_errors = list(self.schema.iter_errors(xml_file, use_decode_plans=True))
+            for e, plan_error in zip(errors, plan_errors):
+                compare_error_reasons(e.reason, plan_error.reason)
+                self.assertEqual(e.path, plan_error.path, msg=xml_file)
+            self.assertEqual(len(errors), len(plan_errors), msg=xml_file)
+
             # TODO: Test also lazy validation with lazy=2.
             #  This needs two fixes in XPath:
             #   1) find has to retrieve also element substitutes
@@ -686,6 +704,7 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
         def test_xml_document_validation(self):
             if not validation_only:
                 self.check_decoding_with_element_tree()
+                self.check_decode_plans()
                 if not inspect and not no_pickle:
                     self.check_schema_serialization()
 
@@ -0,0 +1,243 @@
+#
+# Copyright (c), 2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+import pickle
+import sys
+from collections.abc import Hashable, Iterable, Iterator, MutableMapping
+from typing import Any, Optional, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+
+class DiskCounter(MutableMapping[K, int]):
+    """
+    A counter of hashable objects stored in a private temporary SQLite database,
+    that is deleted when the counter is closed or garbage collected. The objects
+    are stored pickled and indexed by their hash. Lookups compare the unpickled
+    objects of the hash bucket by equality, so they have the same results of the
+    lookups on an in-memory `Counter`. Like a `Counter` missing objects have a
+    zero count. The stored objects can be compared only within the same process,
+    because the hash of strings is randomized between processes.
+
+    :param items: an optional iterable of couples with the initial counts.
+    """
+    def __init__(self, items: Optional[Iterable[tuple[K, int]]] = None) -> None:
+        import sqlite3  # not imported with the package, it's used only on request
+
+        self._db = sqlite3.connect('')
+        self._db.execute('CREATE TABLE items (hash INTEGER, obj BLOB, count INTEGER)')
+        self._db.execute('CREATE INDEX items_hash ON items (hash)')
+        if items is not None:
+            self._db.executemany(
+                'INSERT INTO items VALUES (?, ?, ?)',
+                ((hash(k), pickle.dumps(k), v) for k, v in items)
+            )
+
+    def __repr__(self) -> str:
+        return '%s(<%d items>)' % (self.__class__.__name__, len(self))
+
+    def _find(self, obj: K) -> Optional[tuple[int, int]]:
+        """Returns the rowid and the count of an object, `None` if it's not found."""
+        for rowid, data, count in self._db.execute(
+                'SELECT rowid, obj, count FROM items WHERE hash = ?', (hash(obj),)):
+            if pickle.loads(data) == obj:
+                return rowid, count
+        return None
+
+    def __getitem__(self, obj: K) -> int:
+        row = self._find(obj)
+        return 0 if row is None else row[1]
+
+    def __setitem__(self, obj: K, count: int) -> None:
+        row = self._find(obj)
+        if row is None:
+            self._db.execute('INSERT INTO items VALUES (?, ?, ?)',
+                             (hash(obj), pickle.dumps(obj), count))
+        else:
+            self._db.execute('UPDATE items SET count = ? WHERE rowid = ?', (count, row[0]))
+
+    def __delitem__(self, obj: K) -> None:
+        row = self._find(obj)
+        if row is None:
+            raise KeyError(obj)
+        self._db.execute('DELETE FROM items WHERE rowid = ?', (row[0],))
+
+    def __contains__(self, obj: object) -> bool:
+        return isinstance(obj, Hashable) and self._find(obj) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[K]:
+        for data, in self._db.execute('SELECT obj FROM items'):
+            yield pickle.loads(data)
+
+    def __len__(self) -> int:
+        return int(self._db.execute('SELECT COUNT(*) FROM items').fetchone()[0])
+
+    def __getstate__(self) -> Any:
+        raise TypeError(f"can't pickle {self.__class__.__name__!r} instances")
+
+    def add(self, obj: K) -> int:
+        """Increments the count of an object, returning the new count."""
+        row = self._find(obj)
+        if row is None:
+            self._db.execute('INSERT INTO items VALUES (?, ?, 1)',
+                             (hash(obj), pickle.dumps(obj)))
+            return 1
+
+        self._db.execute('UPDATE items SET count = ? WHERE rowid = ?', (row[1] + 1, row[0]))
+        return row[1] + 1
+
+    def clear(self) -> None:
+        self._db.execute('DELETE FROM items')
+
+    def close(self) -> None:
+        """Closes the database, deleting the stored objects."""
+        self._db.close()
+
+
+class DiskIdRegistry:
+    """
+    A registry of identifiers and of unresolved references to identifiers, stored
+    in a private temporary SQLite database, that is deleted when the registry is
+    closed or garbage collected. A reference is dropped when its identifier is
+    registered, so only the references that are still unresolved are stored.
+
+    :param ids: an optional iterable with the initial identifiers.
+    :param refs: an optional iterable with the initial unresolved references.
+    """
+    def __init__(self, ids: Optional[Iterable[str]] = None,
+                 refs: Optional[Iterable[str]] = None) -> None:
+        import sqlite3
+
+        self._db = sqlite3.connect('')
+        self._db.execute('CREATE TABLE ids (value TEXT PRIMARY KEY) WITHOUT ROWID')
+        self._db.execute('CREATE TABLE refs (value TEXT UNIQUE)')
+        if ids is not None:
+            self._db.executemany('INSERT INTO ids VALUES (?)', ((v,) for v in ids))
+        if refs is not None:
+            self._db.executemany('INSERT INTO refs VALUES (?)', ((v,) for v in refs))
+
+    def __repr__(self) -> str:
+        return '%s(<%d items>)' % (self.__class__.__name__, len(self))
+
+    def __contains__(self, value: object) -> bool:
+        return self._db.execute(
+            'SELECT 1 FROM ids WHERE value = ?', (value,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return int(self._db.execute(
+            'SELECT (SELECT COUNT(*) FROM ids) + (SELECT COUNT(*) FROM refs)'
+        ).fetchone()[0])
+
+    def __getstate__(self) -> Any:
+        raise TypeError(f"can't pickle {self.__class__.__name__!r} instances")
+
+    def add_id(self, value: str) -> bool:
+        """Registers an identifier, returns `False` if it's already registered."""
+        if not self._db.execute('INSERT OR IGNORE INTO ids VALUES (?)', (value,)).rowcount:
+            return False
+        self._db.execute('DELETE FROM refs WHERE value = ?', (value,))
+        return True
+
+    def add_ref(self, value: str) -> None:
+        """Registers a reference, if its identifier is not registered yet."""
+        if value not in self:
+            self._db.execute('INSERT OR IGNORE INTO refs VALUES (?)', (value,))
+
+    def iter_unresolved(self) -> Iterator[str]:
+        """Iterates the unresolved references, in order of registration."""
+        for value, in self._db.execute('SELECT value FROM refs ORDER BY rowid'):
+            yield value
+
+    def clear(self) -> None:
+        self._db.execute('DELETE FROM ids')
+        self._db.execute('DELETE FROM refs')
+
+    def close(self) -> None:
+        """Closes the database, deleting the stored identifiers and references."""
+        self._db.close()
+
+
+class IdRegistry:
+    """
+    A registry of identifiers and of unresolved references to identifiers, kept
+    in memory with a set of interned identifiers and a dictionary of references.
+    A reference is dropped when its identifier is registered, so only the references
+    that are still unresolved are stored. Over the optional *limit* of stored values
+    the registry is moved to a :class:`DiskIdRegistry` instance.
+
+    :param limit: an optional limit for the number of values stored in memory.
+    """
+    disk: Optional[DiskIdRegistry]
+
+    __slots__ = ('ids', 'refs', 'limit', 'disk')
+
+    def __init__(self, limit: Optional[int] = None) -> None:
+        self.ids: set[str] = set()
+        self.refs: dict[str, None] = {}
+        self.limit = limit
+        self.disk = None
+
+    def __repr__(self) -> str:
+        return '%s(<%d items>)' % (self.__class__.__name__, len(self))
+
+    def __contains__(self, value: object) -> bool:
+        if self.disk is not None:
+            return value in self.disk
+        return value in self.ids
+
+    def __len__(self) -> int:
+        if self.disk is not None:
+            return len(self.disk)
+        return len(self.ids) + len(self.refs)
+
+    def _check_limit(self) -> None:
+        if self.limit is not None and len(self.ids) + len(self.refs) > self.limit:
+            self.disk = DiskIdRegistry(self.ids, self.refs)
+            self.ids.clear()
+            self.refs.clear()
+
+    def add_id(self, value: str) -> bool:
+        """Registers an identifier, returns `False` if it's already registered."""
+        if self.disk is not None:
+            return self.disk.add_id(value)
+        elif value in self.ids:
+            return False
+
+        self.ids.add(sys.intern(value))
+        if self.refs:
+            self.refs.pop(value, None)
+        self._check_limit()
+        return True
+
+    def add_ref(self, value: str) -> None:
+        """Registers a reference, if its identifier is not registered yet."""
+        if self.disk is not None:
+            self.disk.add_ref(value)
+        elif value not in self.ids and value not in self.refs:
+            self.refs[sys.intern(value)] = None
+            self._check_limit()
+
+    def iter_unresolved(self) -> Iterator[str]:
+        """Iterates the unresolved references, in order of registration."""
+        if self.disk is not None:
+            yield from self.disk.iter_unresolved()
+        else:
+            yield from self.refs
+
+    def clear(self) -> None:
+        self.close()
+        self.ids.clear()
+        self.refs.clear()
+
+    def close(self) -> None:
+        """Closes the disk registry, if any, switching back to in-memory storage."""
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
@@ -266,7 +266,10 @@ class XsdAttribute(XsdComponent, ValidationMixin[Optional[str], DecodedValueType
             context.validation_error(validation, self, msg, obj)
             return None
 
-        value = self.type.raw_decode(obj, validation, context)
+        if context.lexical_datetimes or context.float_decimals:
+            value = self.type.lexical_decode(obj, validation, context)
+        else:
+            value = self.type.raw_decode(obj, validation, context)
         if not isinstance(context, DecodeContext):
             return value
 
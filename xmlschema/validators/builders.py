@@ -8,9 +8,11 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import copy
+import threading
 from abc import abstractmethod
 from collections import Counter
-from collections.abc import Callable, ItemsView, Iterator, Mapping, ValuesView, Iterable
+from collections.abc import Callable, Container, ItemsView, Iterator, Mapping, \
+    ValuesView, Iterable
 from operator import attrgetter
 from types import MappingProxyType
 from typing import Any, cast, NamedTuple, Optional, Union, TypeVar
@@ -22,7 +24,7 @@ from xmlschema.aliases import BaseXsdType, ElementType, LoadedItemType, \
 from xmlschema.exceptions import XMLSchemaAttributeError, XMLSchemaKeyError, \
     XMLSchemaTypeError, XMLSchemaValueError
 from xmlschema.translation import gettext as _
-from xmlschema.utils.qnames import local_name, get_qname
+from xmlschema.utils.qnames import local_name, get_qname, get_namespace
 
 from .helpers import parse_xsd_derivation
 from .exceptions import XMLSchemaCircularityError, XMLSchemaModelDepthError
@@ -364,6 +366,79 @@ class XsdBuilders:
         return xsd_type
 
 
+class LazyBuild:
+    """
+    The state shared by the staged maps of global maps built in lazy mode. A global
+    built on demand is completed, building its model groups, when the outermost
+    parsing of globals is finished. Identities and assertions are built after, when
+    no other completion is in progress, because they need complete XPath nodes,
+    then the content models of the global are checked. The staged items of the
+    globals built by a lookup are recorded, for restoring them if the build fails.
+    """
+    __slots__ = ('depth', 'pending', 'deferred', 'completing', 'lock', 'built')
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.pending: list[XsdComponent] = []
+        self.deferred: list[XsdComponent] = []
+        self.completing = False
+        self.lock = threading.RLock()
+        self.built: list[tuple['StagedMap[Any]', str, StagedItemType, Any]] = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+
+    def complete(self) -> None:
+        """Completes the build of the pending global components."""
+        if self.completing:
+            # Identities and assertions are built by the outermost call
+            self._build_groups()
+            return
+
+        self.completing = True
+        try:
+            self._build_groups()
+            while self.deferred:
+                component = self.deferred.pop(0)
+                for obj in component.iter_components((XsdIdentity, XsdAssert)):
+                    obj.build()
+                self._build_groups()
+                component.maps.check_models(cast(SchemaGlobalType, component))
+        finally:
+            self.completing = False
+
+    def rollback(self, start: int) -> None:
+        """
+        Restores the staged items of the globals built after the given position
+        of the records, removing the failed or partially built components.
+        """
+        removed = set()
+        while len(self.built) > start:
+            staged_map, qname, item, previous = self.built.pop()
+            component = staged_map._store.pop(qname, None)
+            if component is not None:
+                removed.add(id(component))
+            if previous is not None:
+                staged_map._store[qname] = previous
+            staged_map._staging[qname] = item
+
+        self.pending = [x for x in self.pending if id(x) not in removed]
+        self.deferred = [x for x in self.deferred if id(x) not in removed]
+
+    def _build_groups(self) -> None:
+        while self.pending:
+            component = self.pending.pop(0)
+            for group in component.iter_components(XsdGroup):
+                try:
+                    group.build()
+                except XMLSchemaModelDepthError as e:
+                    component.schema.parse_error(error=e, elem=group.elem)
+            self.deferred.append(component)
+
+
 class StagedMap(Mapping[str, CT]):
     label = 'component'
 
@@ -371,28 +446,37 @@ class StagedMap(Mapping[str, CT]):
     def _factory_or_class(self, elem: ElementType, schema: SchemaType) -> CT:
         """Returns the builder class or method used to build the global map."""
 
-    __slots__ = ('_store', '_staging', '_builders')
+    __slots__ = ('_store', '_staging', '_builders', '_lazy')
 
-    def __init__(self, builders: XsdBuilders):
+    def __init__(self, builders: XsdBuilders, lazy: Optional[LazyBuild] = None):
         self._store: dict[str, CT] = {}
         self._staging: dict[str, StagedItemType] = {}
         self._builders = builders
+        self._lazy = lazy
 
     def __getitem__(self, qname: str) -> CT:
         try:
             return self._store[qname]
         except KeyError:
             if qname in self._staging:
+                if self._lazy is not None:
+                    return self._lazy_build_global(qname)
                 return self._build_global(qname)
 
             msg = _('global {} {!r} not found').format(self.label, qname)
             raise XMLSchemaKeyError(msg) from None
 
     def __iter__(self) -> Iterator[str]:
-        yield from self._store
+        if self._lazy is None:
+            yield from self._store
+        else:
+            # Staged names are included because are built on demand
+            yield from [*self._store, *(k for k in self._staging if k not in self._store)]
 
     def __len__(self) -> int:
-        return len(self._store)
+        if self._lazy is None:
+            return len(self._store)
+        return len(self._store) + sum(1 for k in self._staging if k not in self._store)
 
     def __repr__(self) -> str:
         return repr(self._store)
@@ -400,6 +484,7 @@ class StagedMap(Mapping[str, CT]):
     def __copy__(self) -> 'StagedMap[CT]':
         obj = object.__new__(self.__class__)
         obj._builders = self._builders
+        obj._lazy = self._lazy
         obj._staging = self._staging.copy()
         obj._store = self._store.copy()
         return obj
@@ -413,6 +498,13 @@ class StagedMap(Mapping[str, CT]):
     def update(self, other: 'StagedMap[CT]') -> None:
         self._store.update(other._store)
 
+    def clear_namespaces(self, namespaces: Container[str]) -> None:
+        """Removes the built and the staged globals that belong to the given namespaces."""
+        for qname in [k for k in self._store if get_namespace(k) in namespaces]:
+            del self._store[qname]
+        for qname in [k for k in self._staging if get_namespace(k) in namespaces]:
+            del self._staging[qname]
+
     @property
     def total_staged(self) -> int:
         return len(self._staging)
@@ -492,10 +584,46 @@ class StagedMap(Mapping[str, CT]):
 
         self._staging[qname] = elem, schema
 
+    @property
+    def lazy(self) -> bool:
+        """`True` if the staged components are built on demand."""
+        return self._lazy is not None
+
     def build(self) -> None:
         for name in [x for x in self._staging]:
             if name in self._staging:
-                self._build_global(name)
+                if self._lazy is not None:
+                    self._lazy_build_global(name)
+                else:
+                    self._build_global(name)
+
+    def _lazy_build_global(self, qname: str) -> CT:
+        lazy = cast(LazyBuild, self._lazy)
+        with lazy.lock:
+            if qname not in self._staging and qname in self._store:
+                return self._store[qname]  # built by another thread
+
+            start = len(lazy.built)
+            lazy.built.append((self, qname, self._staging[qname], self._store.get(qname)))
+            try:
+                lazy.depth += 1
+                try:
+                    component = self._build_global(qname)
+                finally:
+                    lazy.depth -= 1
+
+                lazy.pending.append(component)
+                if not lazy.depth:
+                    lazy.complete()
+            except Exception:
+                if not lazy.depth:
+                    lazy.rollback(start)
+                raise
+            else:
+                if not lazy.depth:
+                    del lazy.built[start:]
+
+        return component
 
     def _build_global(self, qname: str) -> CT:
         obj = self._staging[qname]
@@ -649,6 +777,17 @@ class GroupsMap(StagedMap[XsdGroup]):
         return self._builders.group_class(elem, schema)
 
 
+def _is_eager_global(item: StagedItemType) -> bool:
+    """Returns `True` if a staged global has to be built also in lazy mode."""
+    elem: ElementType
+    for elem, _schema in (item if isinstance(item, list) else (item,)):  # type: ignore
+        if elem.tag == nm.XSD_ELEMENT and 'substitutionGroup' in elem.attrib:
+            return True
+        elif any(e.tag in nm.IDENTITY_TAGS for e in elem.iter()):
+            return True
+    return False
+
+
 class GlobalMaps(NamedTuple):
     types: TypesMap
     notations: NotationsMap
@@ -658,16 +797,21 @@ class GlobalMaps(NamedTuple):
     groups: GroupsMap
 
     @classmethod
-    def from_builders(cls, builders: XsdBuilders) -> 'GlobalMaps':
+    def from_builders(cls, builders: XsdBuilders, lazy: bool = False) -> 'GlobalMaps':
+        lazy_build = LazyBuild() if lazy else None
         return cls(
-            TypesMap(builders),
-            NotationsMap(builders),
-            AttributesMap(builders),
-            AttributeGroupsMap(builders),
-            ElementsMap(builders),
-            GroupsMap(builders)
+            TypesMap(builders, lazy_build),
+            NotationsMap(builders, lazy_build),
+            AttributesMap(builders, lazy_build),
+            AttributeGroupsMap(builders, lazy_build),
+            ElementsMap(builders, lazy_build),
+            GroupsMap(builders, lazy_build)
         )
 
+    @property
+    def lazy(self) -> bool:
+        return self.types.lazy
+
     def clear(self) -> None:
         for item in self:
             item.clear()
@@ -676,12 +820,27 @@ class GlobalMaps(NamedTuple):
         for m1, m2 in zip(self, other):
             m1.update(m2)  # type: ignore[attr-defined]
 
+    def clear_namespaces(self, namespaces: Container[str]) -> None:
+        for item in self:
+            item.clear_namespaces(namespaces)
+
+    def restore(self, other: 'GlobalMaps') -> None:
+        """Restores the built and the staged globals from a copy of the maps."""
+        maps = cast(Iterable[tuple[StagedMap[Any], StagedMap[Any]]], zip(self, other))
+        for m1, m2 in maps:
+            m1.clear()
+            m1._store.update(m2._store)
+            m1._staging.update(m2._staging)
+
     def copy(self) -> 'GlobalMaps':
         return GlobalMaps(*[m.copy() for m in self])  # type: ignore[arg-type]
 
     def iter_globals(self) -> Iterator[SchemaGlobalType]:
         for item in self:
-            yield from item.values()
+            if item.lazy:
+                yield from [*item._store.values()]  # only the built components
+            else:
+                yield from item.values()
 
     def iter_staged(self) -> Iterator[StagedItemType]:
         for item in self:
@@ -783,10 +942,23 @@ class GlobalMaps(NamedTuple):
                 self[GLOBAL_MAP_INDEX[child.tag]].load_override(qname, child, schema)
 
     def build(self, schemas: Iterable[SchemaType]) -> None:
-        """Builds global XSD components for the given schemas."""
-        self.notations.build()
-        self.attributes.build()
-        self.attribute_groups.build()
+        """
+        Builds global XSD components for the given schemas. In lazy mode builds
+        only the globals that can't be resolved by a lookup, that are the elements
+        of substitution groups, the globals that declare identity constraints and
+        the globals that replace ancestors' components.
+        """
+        if self.lazy:
+            for staged_map in self:
+                for name, item in list(staged_map.staged_items):
+                    if name not in staged_map._staging:
+                        continue
+                    elif name in staged_map._store or _is_eager_global(item):
+                        staged_map._lazy_build_global(name)
+        else:
+            self.notations.build()
+            self.attributes.build()
+            self.attribute_groups.build()
 
         for schema in schemas:
             if not isinstance(schema.default_attributes, str):
@@ -802,7 +974,11 @@ class GlobalMaps(NamedTuple):
                     elem=schema.root
                 )
             else:
-                schema.default_attributes = attributes
+                if isinstance(schema.default_attributes, str):
+                    schema.default_attributes = attributes  # not set by the lookup
+
+        if self.lazy:
+            return  # globals built on demand are completed by the lookup
 
         self.types.build()
         self.elements.build()
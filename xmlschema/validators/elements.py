@@ -48,6 +48,7 @@ from .identities import XsdIdentity, XsdKeyref, KeyrefCounter, FieldValueSelecto
 from .simple_types import XsdSimpleType
 from .attributes import XsdAttribute
 from .wildcards import XsdAnyElement
+from .plans import DecodePlanType, compile_decode_plan
 
 if TYPE_CHECKING:
     from .attributes import XsdAttributeGroup  # noqa: F401
@@ -594,6 +595,20 @@ class XsdElement(XsdComponent, ParticleMixin,
             except OSError:
                 continue
 
+    def get_decode_plan(self, flags: int) -> DecodePlanType:
+        """
+        Returns the decode plan of the element for the provided context flags.
+        Returns the general decoding method if the global maps are not built
+        or don't cache component properties.
+        """
+        if not self.maps.built or not self.maps.cache.enabled:
+            return self.raw_decode
+        return self._get_cached_decode_plan(flags)
+
+    @schema_cache
+    def _get_cached_decode_plan(self, flags: int) -> DecodePlanType:
+        return compile_decode_plan(self, flags)
+
     def raw_decode(self, obj: ElementType, validation: str, context: ValidationContext) -> Any:
         """
         Decode an Element instance.
@@ -638,7 +653,7 @@ class XsdElement(XsdComponent, ParticleMixin,
             if identity in context.identities:
                 context.identities[identity].reset(obj)
             else:
-                context.identities[identity] = identity.get_counter(obj)
+                context.identities[identity] = identity.get_counter(obj, context.identity_limit)
 
         if not context.level:
             # Need to set converter context with the right object (the resource can be lazy)
@@ -789,7 +804,10 @@ class XsdElement(XsdComponent, ParticleMixin,
                     msg = _("missing enumeration facet in xs:NOTATION subtype")
                     context.validation_error(validation, self, msg, text)
 
-            result = content_decoder.raw_decode(text or '', validation, context)
+            if context.lexical_datetimes or context.float_decimals:
+                result = content_decoder.lexical_decode(text or '', validation, context)
+            else:
+                result = content_decoder.raw_decode(text or '', validation, context)
             if not isinstance(context, DecodeContext):
                 value = result
             else:
@@ -888,12 +906,15 @@ class XsdElement(XsdComponent, ParticleMixin,
 
             if counter.elements is None:
                 # Apply selector on Element ancestor for obtain the selected elements
-                root_node = context.source.get_xpath_node(counter.elem)
-                xpath_context = XPathContext(root_node)
                 assert identity.selector is not None
-                counter.elements = {
-                    x for x in identity.selector.token.select_results(xpath_context)
-                }
+                if identity.selector.steps is not None:
+                    counter.elements = set(identity.selector.select_elements(counter.elem))
+                else:
+                    root_node = context.source.get_xpath_node(counter.elem)
+                    xpath_context = XPathContext(root_node)
+                    counter.elements = {
+                        x for x in identity.selector.token.select_results(xpath_context)
+                    }
 
             if obj not in counter.elements:
                 continue
@@ -20,6 +20,7 @@ from xmlschema.aliases import ElementType, NsmapType, SchemaType, SchemaElementT
     ModelParticleType
 from xmlschema.translation import gettext as _
 from xmlschema.resources import XMLResource
+from xmlschema.utils.decoding import raw_encode_value
 from xmlschema.utils.etree import etree_getpath, is_etree_element
 from xmlschema.utils.qnames import get_prefixed_qname, local_name
 
@@ -44,6 +45,8 @@ class XMLSchemaValidatorError(XMLSchemaException):
     _root: Optional[ElementType] = None
     _path: Optional[str] = None
     _sourceline: Optional[int] = None
+    _elem: Optional[ElementType] = None
+    _source: Optional[Any] = None
 
     # Optional dump of the execution stack that can be set in collected
     # validator errors for debugging purposes.
@@ -91,35 +94,53 @@ class XMLSchemaValidatorError(XMLSchemaException):
     def msg(self, msg: str) -> None:
         return
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        if name == 'elem':
-            if value is None:
-                self._sourceline = None
-                self._path = None
-                super().__setattr__(name, value)
-                return
+    @property
+    def elem(self) -> Optional[ElementType]:
+        """
+        The element that contains the error. It's `None` for errors of lazy
+        resources, whose elements are pruned during the iteration.
+        """
+        return self._elem
+
+    @elem.setter
+    def elem(self, value: Optional[ElementType]) -> None:
+        if value is None:
+            self._sourceline = None
+            self._path = None
+            self._elem = None
+            return
 
-            if not is_etree_element(value):
-                msg = _("{!r} attribute requires an Element, not {!r}.")
-                raise XMLSchemaValueError(msg.format(name, value))
+        if not is_etree_element(value):
+            msg = _("{!r} attribute requires an Element, not {!r}.")
+            raise XMLSchemaValueError(msg.format('elem', value))
+        self._set_elem(value)
 
+    def _set_elem(self, value: ElementType) -> None:
+        self._path = None
+        if isinstance(self._source, XMLResource) and self._source.is_lazy():
+            # Don't save the element of a lazy resource but set the path
             self._sourceline = getattr(value, 'sourceline', self._sourceline)
-            self._path = None
-            if isinstance(self.source, XMLResource) and self.source.is_lazy():
-                # Don't save the element of a lazy resource but set the path
-                self._path = etree_getpath(
-                    elem=value,
-                    root=self.source.root,
-                    namespaces=self.namespaces,
-                    relative=False,
-                    add_position=True
-                )
-                value = None
-
-        elif name == 'source' and isinstance(value, XMLResource):
-            self._path = None
+            self._path = etree_getpath(
+                elem=value,
+                root=self._source.root,
+                namespaces=self.namespaces,
+                relative=False,
+                add_position=True
+            )
+            self._elem = None
+        else:
+            self._elem = value
 
-        super().__setattr__(name, value)
+    @property
+    def source(self) -> Optional[Any]:
+        """The XML resource or the decoded data that contains the error."""
+        return self._source
+
+    @source.setter
+    def source(self, value: Optional[Any]) -> None:
+        if isinstance(value, XMLResource):
+            self._path = None
+        self._source = value
 
     @property
     def sourceline(self) -> Optional[int]:
@@ -299,10 +320,53 @@ class XMLSchemaValidationError(XMLSchemaValidatorError, ValueError):
     :param namespaces: is an optional mapping from namespace prefix to URI.
     """
     _message = 'failed validating {} with'
+    _reason: Optional[str] = None
+    _attribute_name: Optional[str] = None
+
+    attribute: Optional[str] = None
+    """The name of the attribute related to the error, if any."""
+
+    occurrences: int = 1
+    """
+    The number of occurrences of the error. With aggregated validation errors it's
+    the size of the group for the first error of a group of similar errors.
+    """
 
     @property
     def message(self) -> str:
-        return f'{self._message} {self.validator!r}.'
+        obj = self.obj
+        if isinstance(obj, str):
+            obj_repr = repr(obj.encode('ascii', 'xmlcharrefreplace').decode('utf-8'))
+        else:
+            obj_repr = repr(obj)
+
+        if len(obj_repr) > 200:
+            obj_repr = f"{type(obj)} instance"
+
+        return f'{_(self._message).format(obj_repr)} {self.validator!r}.'
+
+    @property
+    def reason(self) -> Optional[str]:
+        """The detailed reason of failed validation."""
+        if self.attribute is not None and self._reason is not None \
+                and not self._reason.startswith('attribute '):
+            name = self._attribute_name or self.attribute
+            value = raw_encode_value(self.obj)
+            self._reason = _('attribute {0}={1!r}: {2}').format(name, value, self._reason)
+        return self._reason
+
+    @reason.setter
+    def reason(self, value: Optional[str]) -> None:
+        self._reason = value
+
+    def set_attribute(self, name: str, namespaces: Optional[NsmapType] = None) -> None:
+        """
+        Sets the attribute related to the error. The prefixed name is computed
+        now, because the namespace map of a validation context can lose local
+        declarations before the reason is read.
+        """
+        self.attribute = name
+        self._attribute_name = get_prefixed_qname(name, namespaces)
 
     # For compatibility with XMLSchemaChildrenValidationError
     invalid_tag: Optional[str] = None
@@ -319,24 +383,14 @@ class XMLSchemaValidationError(XMLSchemaValidatorError, ValueError):
                  reason: Optional[str] = None,
                  source: Optional[Any] = None,
                  namespaces: Optional[NsmapType] = None) -> None:
-
-        if isinstance(obj, str):
-            obj_repr = repr(obj.encode('ascii', 'xmlcharrefreplace').decode('utf-8'))
-        else:
-            obj_repr = repr(obj)
-
-        if len(obj_repr) > 200:
-            obj_repr = f"{type(obj)} instance"
-
-        super().__init__(
-            validator=validator,
-            message=_(self._message).format(obj_repr),
-            elem=obj if is_etree_element(obj) else None,
-            source=source,
-            namespaces=namespaces,
-        )
+        # The message and the string forms are built only on access
+        self.validator = validator
+        self.namespaces = namespaces
+        self.source = source
+        if is_etree_element(obj):
+            self._set_elem(obj)
         self.obj = obj
-        self.reason = reason
+        self._reason = reason
 
     def __repr__(self) -> str:
         return '%s(reason=%r)' % (self.__class__.__name__, self.reason)
@@ -367,6 +421,9 @@ class XMLSchemaValidationError(XMLSchemaValidatorError, ValueError):
         if self.path is not None:
             chunks.append("Path: %s\n" % self.path)
 
+        if self.occurrences > 1:
+            chunks.append("Occurrences: %d\n" % self.occurrences)
+
         return '\n'.join(chunks) if len(chunks) > 1 else chunks[0][:-2]
 
     def get_obj_as_string(self, indent: str = '', max_lines: Optional[int] = None) -> str:
@@ -470,12 +527,31 @@ class XMLSchemaChildrenValidationError(XMLSchemaValidationError):
 
         if index >= len(elem):
             self.invalid_tag = None
-            tag = get_prefixed_qname(elem.tag, namespaces, use_empty=False)
-            reason = _("The content of element %r is not complete.") % tag
+            self._prefixed_tag = get_prefixed_qname(elem.tag, namespaces, use_empty=False)
         else:
             self.invalid_tag = elem[index].tag
-            tag = get_prefixed_qname(self.invalid_tag, namespaces, use_empty=False)
-            reason = _("Unexpected child with tag %r at position %d.") % (tag, index + 1)
+            self._prefixed_tag = get_prefixed_qname(self.invalid_tag, namespaces, use_empty=False)
+
+        super().__init__(validator, elem, None, source, namespaces)
+
+    @property
+    def reason(self) -> Optional[str]:
+        """The detailed reason of failed validation, built at first access."""
+        if self._reason is None:
+            self._reason = self._get_children_reason()
+        return self._reason
+
+    @reason.setter
+    def reason(self, value: Optional[str]) -> None:
+        self._reason = value
+
+    def _get_children_reason(self) -> str:
+        particle, occurs, tag = self.particle, self.occurs, self._prefixed_tag
+
+        if self.invalid_tag is None:
+            reason = _("The content of element %r is not complete.") % tag
+        else:
+            reason = _("Unexpected child with tag %r at position %d.") % (tag, self.index + 1)
 
         if occurs and particle.min_occurs > occurs:
             reason += " The particle %r occurs %d times but the minimum is %d." % (
@@ -497,7 +573,7 @@ class XMLSchemaChildrenValidationError(XMLSchemaValidationError):
         else:
             reason += _(" Tag %r expected.") % expected_tags[0]
 
-        super().__init__(validator, elem, reason, source, namespaces)
+        return reason
 
     @property
     def expected_tags(self) -> list[str]:
@@ -537,6 +613,13 @@ class XMLSchemaStopValidation(XMLSchemaException):
     """Stops the validation process."""
 
 
+class XMLSchemaValidationFailure(XMLSchemaException):
+    """
+    A light sentinel raised by fail-fast validation contexts at the first
+    validation error, in place of building and collecting the error.
+    """
+
+
 class XMLSchemaIncludeWarning(XMLSchemaWarning):
     """A schema include fails."""
 
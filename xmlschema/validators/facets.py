@@ -11,10 +11,12 @@
 This module contains declarations and classes for XML Schema constraint facets.
 """
 import re
+import sys
 import math
 import operator
 from abc import abstractmethod
-from collections.abc import MutableSequence
+from collections.abc import Callable, MutableSequence
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any, cast, overload, Optional, Union
 from xml.etree.ElementTree import Element
 
@@ -37,6 +39,64 @@ if TYPE_CHECKING:
 
 LaxDecodeType = tuple[Any, list[XMLSchemaValidationError]]
 
+# A single XSD pattern piece made of a digit escape or a class of ASCII alphanumeric
+# characters and ranges, followed by an optional quantifier.
+TRIVIAL_PATTERN = re.compile(
+    r'(\\d|\[(?:[A-Za-z0-9](?:-[A-Za-z0-9])?)+\])(?:\{(\d+)(,(\d*))?\}|([?*+]))?\Z'
+)
+
+
+def get_pattern_predicate(regexp: str) -> Optional[Callable[[str], bool]]:
+    """
+    Returns a string predicate equivalent to a trivial XSD pattern, e.g. fixed-length
+    digits or codes of uppercase letters, that is faster than a regex match. Returns
+    `None` if the pattern is not trivial.
+
+    :param regexp: the XSD regular expression.
+    """
+    match = TRIVIAL_PATTERN.match(regexp)
+    if match is None:
+        return None
+
+    atom, min_occurs, comma, max_occurs, symbol = match.groups()
+    if min_occurs is None:
+        min_len, max_len = {
+            None: (1, 1), '?': (0, 1), '*': (0, sys.maxsize), '+': (1, sys.maxsize)
+        }[symbol]
+    elif comma is None:
+        min_len = max_len = int(min_occurs)
+    else:
+        min_len = int(min_occurs)
+        max_len = int(max_occurs) if max_occurs else sys.maxsize
+        if max_len < min_len:
+            return None
+
+    # The str methods are used unbound to raise TypeError for non-string values
+    if atom == '\\d':
+        isdecimal = str.isdecimal
+
+        def match_digits(text: str) -> bool:
+            return (isdecimal(text) or not text) and min_len <= len(text) <= max_len
+
+        return match_digits
+
+    chars = []
+    for start, end in re.findall(r'([A-Za-z0-9])(?:-([A-Za-z0-9]))?', atom[1:-1]):
+        if not end:
+            chars.append(start)
+        elif start > end:
+            return None
+        else:
+            chars.extend(chr(k) for k in range(ord(start), ord(end) + 1))
+
+    strip = str.strip
+    charset = ''.join(chars)
+
+    def match_chars(text: str) -> bool:
+        return not strip(text, charset) and min_len <= len(text) <= max_len
+
+    return match_chars
+
 
 class XsdFacet(XsdComponent):
     """
@@ -615,9 +675,15 @@ class XsdEnumerationFacets(XsdFacet, MutableSequence[ElementType]):
         </enumeration>
     """
     base_type: BaseXsdType
+    _hashed_values: Optional[set[Any]]
+    _other_values: list[Any]
+
     _ADMITTED_TAGS = nm.XSD_ENUMERATION,
 
-    __slots__ = ('_elements', 'enumeration')
+    # Types whose instances have hashes consistent with the equality between them
+    _hashable_types = (str, int, float, Decimal)
+
+    __slots__ = ('_elements', 'enumeration', '_hashed_values', '_other_values')
 
     def __init__(self, elem: ElementType,
                  schema: SchemaType,
@@ -629,6 +695,27 @@ class XsdEnumerationFacets(XsdFacet, MutableSequence[ElementType]):
     def _parse(self) -> None:
         self._elements = [self.elem]
         self.enumeration = [self._parse_value(self.elem)]
+        self._hashed_values = None
+        self._other_values = []
+
+    def _build_lookup(self) -> set[Any]:
+        """
+        Builds the lookup structure for checking the values, a set with the enumeration
+        values of hashable types plus a list with the others, that need a linear search.
+        The enumeration list is kept for ordering and for error reporting.
+        """
+        hashed_values: set[Any] = set()
+        other_values: list[Any] = []
+        for value in self.enumeration:
+            if isinstance(value, self._hashable_types):
+                hashed_values.add(value)
+            else:
+                other_values.append(value)
+
+        # Publish the set last, for concurrent checks that find it already built
+        self._other_values = other_values
+        self._hashed_values = hashed_values
+        return hashed_values
 
     def _parse_value(self, elem: ElementType) -> Optional[AtomicValueType]:
         self.schema.validation_context.clear()
@@ -672,10 +759,12 @@ class XsdEnumerationFacets(XsdFacet, MutableSequence[ElementType]):
             self.enumeration[i] = self._parse_value(o)
         else:
             self.enumeration[i] = [self._parse_value(e) for e in o]
+        self._hashed_values = None
 
     def __delitem__(self, i: Union[int, slice]) -> None:
         del self._elements[i]
         del self.enumeration[i]
+        self._hashed_values = None
 
     def __len__(self) -> int:
         return len(self._elements)
@@ -683,6 +772,7 @@ class XsdEnumerationFacets(XsdFacet, MutableSequence[ElementType]):
     def insert(self, i: int, elem: ElementType) -> None:
         self._elements.insert(i, elem)
         self.enumeration.insert(i, self._parse_value(elem))
+        self._hashed_values = None
 
     def __repr__(self) -> str:
         if len(self.enumeration) > 5:
@@ -693,7 +783,15 @@ class XsdEnumerationFacets(XsdFacet, MutableSequence[ElementType]):
             return '%s(%r)' % (self.__class__.__name__, self.enumeration)
 
     def __call__(self, value: Any) -> None:
-        if value in self.enumeration:
+        if isinstance(value, self._hashable_types):
+            hashed_values = self._hashed_values
+            if hashed_values is None:
+                hashed_values = self._build_lookup()
+            if value in hashed_values:
+                return
+            elif self._other_values and value in self._other_values:
+                return
+        elif value in self.enumeration:
             return
 
         try:
@@ -733,13 +831,14 @@ class XsdPatternFacets(XsdFacet, MutableSequence[ElementType]):
     """
     _ADMITTED_TAGS = nm.XSD_PATTERN,
     patterns: list[re.Pattern[str]]
+    _matcher: Optional[Callable[[str], Any]]
 
     # XSD pattern translation options
     back_references = False
     lazy_quantifiers = False
     anchors = False
 
-    __slots__ = ('_elements', 'patterns')
+    __slots__ = ('_elements', 'patterns', '_matcher')
 
     def __init__(self, elem: ElementType,
                  schema: SchemaType,
@@ -751,6 +850,34 @@ class XsdPatternFacets(XsdFacet, MutableSequence[ElementType]):
     def _parse(self) -> None:
         self._elements = [self.elem]
         self.patterns = [self._parse_value(self.elem)]
+        self._matcher = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state['_matcher'] = None  # the string predicates are local functions
+        return state
+
+    def _compile(self) -> Callable[[str], Any]:
+        """
+        Compiles the patterns into a single matcher, that returns a false value if the
+        text doesn't match any pattern. A single trivial pattern is checked with a string
+        predicate, multiple patterns are merged into a regex alternation. Each alternative
+        keeps the anchoring of its translated pattern.
+        """
+        matcher: Optional[Callable[[str], Any]]
+        if len(self.patterns) == 1:
+            matcher = get_pattern_predicate(self._elements[0].attrib.get('value', ''))
+            if matcher is None:
+                matcher = self.patterns[0].match
+        elif self.back_references or not self.patterns:
+            # Merging patterns with capturing groups would change the back-references
+            matcher = self.re_match
+        else:
+            regex = '|'.join(f'(?:{pattern.pattern})' for pattern in self.patterns)
+            matcher = re.compile(regex).match
+
+        self._matcher = matcher
+        return matcher
 
     def _parse_value(self, elem: ElementType) -> re.Pattern[str]:
         try:
@@ -786,10 +913,12 @@ class XsdPatternFacets(XsdFacet, MutableSequence[ElementType]):
             self.patterns[i] = self._parse_value(o)
         else:
             self.patterns[i] = [self._parse_value(e) for e in o]
+        self._matcher = None
 
     def __delitem__(self, i: Union[int, slice]) -> None:
         del self._elements[i]
         del self.patterns[i]
+        self._matcher = None
 
     def __len__(self) -> int:
         return len(self._elements)
@@ -797,6 +926,7 @@ class XsdPatternFacets(XsdFacet, MutableSequence[ElementType]):
     def insert(self, i: int, elem: ElementType) -> None:
         self._elements.insert(i, elem)
         self.patterns.insert(i, self._parse_value(elem))
+        self._matcher = None
 
     def __repr__(self) -> str:
         s = repr(self.regexps)
@@ -806,8 +936,12 @@ class XsdPatternFacets(XsdFacet, MutableSequence[ElementType]):
             return '%s(%s...\'])' % (self.__class__.__name__, s[:70])
 
     def __call__(self, value: Any) -> None:
+        matcher = self._matcher
+        if matcher is None:
+            matcher = self._compile()
+
         try:
-            if all(pattern.match(value) is None for pattern in self.patterns):
+            if not matcher(value):
                 reason = _("value doesn't match any pattern of {!r}").format(self.regexps)
                 raise XMLSchemaValidationError(self, value, reason)
         except TypeError as err:
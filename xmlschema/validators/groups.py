@@ -37,7 +37,7 @@ from .particles import ParticleMixin
 from .elements import XsdElement, XsdAlternative
 from .wildcards import XsdAnyElement, XsdOpenContent
 from .models import ModelVisitor, InterleavedModelVisitor, SuffixedModelVisitor, \
-    iter_unordered_content, iter_collapsed_content
+    ModelAutomaton, compile_model, iter_unordered_content, iter_collapsed_content
 
 if TYPE_CHECKING:
     from .complex_types import XsdComplexType  # noqa: F401
@@ -431,6 +431,26 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         else:
             return SuffixedModelVisitor(self, self.open_content.any_element)
 
+    @schema_cached_property
+    def automaton(self) -> Optional[ModelAutomaton]:
+        """
+        The deterministic automaton compiled from the model group, `None`
+        if the model group has an open content or can't be compiled.
+        """
+        if self.open_content is not None and self.open_content.mode != 'none' \
+                and self.open_content.any_element is not None:
+            return None
+        return compile_model(self)
+
+    def get_automaton(self) -> Optional[ModelAutomaton]:
+        """
+        Returns the compiled automaton of the model group, if any. Returns `None`
+        if the global maps are not built or don't cache component properties.
+        """
+        if not self.maps.built or not self.maps.cache.enabled:
+            return None
+        return self.automaton
+
     def overall_min_occurs(self, particle: ModelParticleType) -> int:
         """
         Returns the overall min occurs of a particle in the model group.
@@ -999,7 +1019,17 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         errors = []
         broken_model = False
         namespaces = context.namespaces
-        model = self.get_model_visitor()
+        model: Optional[ModelVisitor] = None
+        matches: Optional[Iterator[tuple[SchemaElementType, SchemaElementType]]] = None
+
+        # Match child elements with the compiled automaton, if any, otherwise or
+        # in case of a wrong content use the model visitor for reporting errors.
+        if (automaton := self.get_automaton()) is not None:
+            matched = automaton.match(c.tag for c in obj if not callable(c.tag))
+            if matched is not None:
+                matches = iter(matched)
+        if matches is None:
+            model = self.get_model_visitor()
 
         for index, child in enumerate(obj):
             if callable(child.tag):
@@ -1008,35 +1038,44 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
             context.converter.set_xmlns_context(child, context.level)
             name = context.converter.map_qname(child.tag)
 
-            while model.element is not None:
-                xsd_element = model.match_element(child.tag)
-                if xsd_element is None:
-                    for particle, occurs, expected in model.advance(False):
-                        errors.append((index, particle, occurs, expected))
-                        model.clear()
-                        broken_model = True  # the model is broken, continues with raw decoding.
-                        xsd_element = self.match_element(child.tag)
-                        break
-                    else:
-                        continue
-                    break
-
+            if matches is not None:
+                xsd_element, model_element = next(matches)
                 try:
-                    self.check_dynamic_context(child, xsd_element, model.element, namespaces)
+                    self.check_dynamic_context(child, xsd_element, model_element, namespaces)
                 except (XMLSchemaValidationError, TypeError) as err:
                     context.validation_error(validation, self, err, obj)
 
-                for particle, occurs, expected in model.advance(True):
-                    errors.append((index, particle, occurs, expected))
-                break
             else:
-                xsd_element = self.match_element(child.tag)
-                if xsd_element is None:
-                    errors.append((index, self, 0, None))
-                    broken_model = True
-                elif not broken_model:
-                    errors.append((index, xsd_element, 0, []))
-                    broken_model = True
+                assert model is not None
+                while model.element is not None:
+                    xsd_element = model.match_element(child.tag)
+                    if xsd_element is None:
+                        for particle, occurs, expected in model.advance(False):
+                            errors.append((index, particle, occurs, expected))
+                            model.clear()
+                            broken_model = True  # the model is broken, continues with raw decoding.
+                            xsd_element = self.match_element(child.tag)
+                            break
+                        else:
+                            continue
+                        break
+
+                    try:
+                        self.check_dynamic_context(child, xsd_element, model.element, namespaces)
+                    except (XMLSchemaValidationError, TypeError) as err:
+                        context.validation_error(validation, self, err, obj)
+
+                    for particle, occurs, expected in model.advance(True):
+                        errors.append((index, particle, occurs, expected))
+                    break
+                else:
+                    xsd_element = self.match_element(child.tag)
+                    if xsd_element is None:
+                        errors.append((index, self, 0, None))
+                        broken_model = True
+                    elif not broken_model:
+                        errors.append((index, xsd_element, 0, []))
+                        broken_model = True
 
             # Optional checks on matched XSD child
             if not isinstance(context, DecodeContext):
@@ -1055,7 +1094,12 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
                         result.append((name, func(xsd_element), xsd_element))
                 continue
 
-            result_item = xsd_element.raw_decode(child, validation, context)
+            if context.plan_flags is None or not isinstance(xsd_element, XsdElement):
+                result_item = xsd_element.raw_decode(child, validation, context)
+            else:
+                decode_plan = xsd_element.get_decode_plan(context.plan_flags)
+                result_item = decode_plan(child, validation, context)
+
             if result_item is Empty:
                 continue
             elif result is not None:
@@ -1074,7 +1118,7 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
                             result.append((cdata_index, tail, None))
                             cdata_index += 1
 
-        if model.element is not None:
+        if model is not None and model.element is not None:
             index = len(obj)
             for particle, occurs, expected in model.stop():
                 errors.append((index, particle, occurs, expected))
@@ -1116,7 +1160,8 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         index = cdata_index = 0
         wrong_content_type = False
         over_max_depth = context.max_depth is not None and context.max_depth <= context.level
-        model = self.get_model_visitor()
+        model: Optional[ModelVisitor] = None
+        matches: Optional[Iterator[tuple[SchemaElementType, SchemaElementType]]] = None
 
         content: Iterable[Any]
         if not obj.content:
@@ -1137,6 +1182,14 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         else:
             content = iter_collapsed_content(obj.content, self)
 
+        if (automaton := self.get_automaton()) is not None:
+            content = list(content)
+            matched = automaton.match(x[0] for x in content if not isinstance(x[0], int))
+            if matched is not None:
+                matches = iter(matched)
+        if matches is None:
+            model = self.get_model_visitor()
+
         for index, (name, value) in enumerate(content):
             if isinstance(name, int):
                 if not children:
@@ -1147,33 +1200,39 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
                 continue
 
             xsd_element: Optional[SchemaElementType]
-            while model.element is not None:
-                xsd_element = model.match_element(name)
-                if xsd_element is None:
-                    for particle, occurs, expected in model.advance():
-                        errors.append((index - cdata_index, particle, occurs, expected))
-                    continue
-                elif isinstance(xsd_element, XsdAnyElement):
-                    value = get_qname(default_namespace, name), value
-
-                for particle, occurs, expected in model.advance(True):
-                    errors.append((index - cdata_index, particle, occurs, expected))
-                break
-            else:
-                errors.append((index - cdata_index, self, 0, []))
-                xsd_element = self.match_element(name)
+            if matches is not None:
+                xsd_element = next(matches)[0]
                 if isinstance(xsd_element, XsdAnyElement):
                     value = get_qname(default_namespace, name), value
-                elif xsd_element is None:
-                    if name.startswith('{') or ':' not in name:
-                        reason = _('{!r} does not match any declared element '
-                                   'of the model group').format(name)
-                    else:
-                        reason = _('{0} has an unknown prefix {1!r}').format(
-                            name, name.split(':')[0]
-                        )
-                    context.validation_error(validation, self, reason, value)
-                    continue
+            else:
+                assert model is not None
+                while model.element is not None:
+                    xsd_element = model.match_element(name)
+                    if xsd_element is None:
+                        for particle, occurs, expected in model.advance():
+                            errors.append((index - cdata_index, particle, occurs, expected))
+                        continue
+                    elif isinstance(xsd_element, XsdAnyElement):
+                        value = get_qname(default_namespace, name), value
+
+                    for particle, occurs, expected in model.advance(True):
+                        errors.append((index - cdata_index, particle, occurs, expected))
+                    break
+                else:
+                    errors.append((index - cdata_index, self, 0, []))
+                    xsd_element = self.match_element(name)
+                    if isinstance(xsd_element, XsdAnyElement):
+                        value = get_qname(default_namespace, name), value
+                    elif xsd_element is None:
+                        if name.startswith('{') or ':' not in name:
+                            reason = _('{!r} does not match any declared element '
+                                       'of the model group').format(name)
+                        else:
+                            reason = _('{0} has an unknown prefix {1!r}').format(
+                                name, name.split(':')[0]
+                            )
+                        context.validation_error(validation, self, reason, value)
+                        continue
 
             if xsd_element.skip and not context.process_skipped:
                 continue
@@ -1184,7 +1243,7 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
             if children is not None and child is not None:
                 children.append(child)
 
-        if model.element is not None:
+        if model is not None and model.element is not None:
             for particle, occurs, expected in model.stop():
                 errors.append((index - cdata_index + 1, particle, occurs, expected))
                 break
@@ -7,6 +7,8 @@
 #
 # @author Davide Brunato <brunato@sissa.it>
 #
+import re
+from calendar import monthrange
 from decimal import Decimal
 from math import isinf, isnan
 from typing import Optional, SupportsInt, SupportsFloat, TYPE_CHECKING, Union
@@ -296,3 +298,91 @@ def python_to_float(value: Union[SupportsFloat, str]) -> str:
 
 def python_to_int(value: Union[SupportsInt, str]) -> str:
     return str(int(value))
+
+
+#
+# XSD date/time, duration and decimal lexical checkers
+
+def _datetime_pattern(regex: str) -> re.Pattern[str]:
+    regex = regex.format(
+        year=r'(?P<year>(?!0000)[0-9]{4})',
+        month=r'(?P<month>0[1-9]|1[0-2])',
+        day=r'(?P<day>0[1-9]|[12][0-9]|3[01])',
+        time=r'(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.[0-9]+)?',
+        tz=r'(?:Z|[+-](?:(?:0[0-9]|1[0-3]):[0-5][0-9]|14:00))?',
+        n=r'[0-9]{1,8}',
+    )
+    return re.compile(regex + r'\Z')
+
+
+# Lexical forms of decimal values and common lexical forms of date/time and duration
+# values, that are valid for both XSD versions: years of four digits from 0001, hours
+# before 24:00:00, components with at most eight digits. Texts that don't match have
+# to be checked with the datatype.
+LEXICAL_PATTERNS = {
+    nm.XSD_DECIMAL: re.compile(r'[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)\Z'),
+    nm.XSD_DATETIME: _datetime_pattern('{year}-{month}-{day}T{time}{tz}'),
+    nm.XSD_DATE: _datetime_pattern('{year}-{month}-{day}{tz}'),
+    nm.XSD_TIME: _datetime_pattern('{time}{tz}'),
+    nm.XSD_GYEAR_MONTH: _datetime_pattern('{year}-{month}{tz}'),
+    nm.XSD_GYEAR: _datetime_pattern('{year}{tz}'),
+    nm.XSD_GMONTH_DAY: _datetime_pattern('--{month}-{day}{tz}'),
+    nm.XSD_GMONTH: _datetime_pattern('--{month}{tz}'),
+    nm.XSD_GDAY: _datetime_pattern('---{day}{tz}'),
+    nm.XSD_DURATION: _datetime_pattern(
+        '-?P(?=[0-9]|T[0-9])(?:{n}Y)?(?:{n}M)?(?:{n}D)?'
+        '(?:T(?=[0-9])(?:{n}H)?(?:{n}M)?(?:{n}(?:\\.{n})?S)?)?'
+    ),
+    nm.XSD_DAY_TIME_DURATION: _datetime_pattern(
+        '-?P(?=[0-9]|T[0-9])(?:{n}D)?(?:T(?=[0-9])(?:{n}H)?(?:{n}M)?(?:{n}(?:\\.{n})?S)?)?'
+    ),
+    nm.XSD_YEAR_MONTH_DURATION: _datetime_pattern('-?P(?=[0-9])(?:{n}Y)?(?:{n}M)?'),
+}
+
+
+class LexicalChecker:
+    """
+    A checker of the lexical form of date/time, duration or decimal texts, that
+    doesn't build the value. Returns `True` if the text is valid, `False` if the text
+    has to be checked by the datatype.
+
+    :param name: the qualified name of the XSD builtin type.
+    """
+    __slots__ = ('name', 'pattern', 'check_day')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.pattern = LEXICAL_PATTERNS[name]
+        self.check_day = name in (nm.XSD_DATETIME, nm.XSD_DATE, nm.XSD_GMONTH_DAY)
+
+    def __repr__(self) -> str:
+        return '%s(name=%r)' % (self.__class__.__name__, self.name)
+
+    def __call__(self, text: str) -> bool:
+        if (m := self.pattern.match(text)) is None:
+            return False
+        elif not self.check_day or (day := int(m['day'])) < 29:
+            return True
+        year = int(m['year']) if self.name != nm.XSD_GMONTH_DAY else 2000  # a leap year
+        return day <= monthrange(year, int(m['month']))[1]
+
+
+def get_lexical_checker(name: str) -> Optional[LexicalChecker]:
+    """
+    Returns a lexical checker for a date/time, duration or decimal builtin
+    type, `None` if the type has no lexical checker.
+
+    :param name: the qualified name of the XSD builtin type.
+    """
+    if name not in LEXICAL_PATTERNS:
+        return None
+    return LexicalChecker(name)
+
+
+def count_lexical_digits(text: str) -> tuple[int, int]:
+    """
+    Counts the digits of the integer and of the fractional part of a text
+    that matches the lexical form of xs:decimal, like `count_digits()`.
+    """
+    integer_part, _, fraction_part = text.lstrip('+-').partition('.')
+    return len(integer_part.lstrip('0')), len(fraction_part.rstrip('0'))
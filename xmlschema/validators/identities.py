@@ -14,17 +14,20 @@ import copy
 import re
 import math
 from collections import Counter
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, cast, Any, Optional, Union
 
 from elementpath import ElementPathError, XPathContext, \
     ElementNode, translate_pattern, AttributeNode
-from elementpath.datatypes import UntypedAtomic
+from elementpath.datatypes import AbstractDateTime, Duration, UntypedAtomic
+from elementpath.decoder import get_atomic_sequence, iter_atomic_values
+from elementpath.etree import etree_iter_strings
 from elementpath.xpath_nodes import EtreeElementNode
 
 import xmlschema.names as nm
 from xmlschema.exceptions import XMLSchemaTypeError, XMLSchemaValueError
 from xmlschema.translation import gettext as _
+from xmlschema.utils.counters import DiskCounter
 from xmlschema.utils.qnames import get_qname, get_extended_qname
 from xmlschema.aliases import ElementType, SchemaType, NsmapType, AtomicValueType, \
     BaseXsdType, SchemaElementType, SchemaAttributeType
@@ -53,6 +56,23 @@ IdentityMapType = dict[Union['XsdKey', 'XsdKeyref', str, None],
 IdentityNodeType = Union[ElementNode, AttributeNode]
 FieldDecoderType = Union[SchemaElementType, SchemaAttributeType]
 
+# Compiled paths: a list of alternatives, each one with a flag for a leading
+# descendant step ('.//') and the expanded names of the child steps. The last
+# step of a field path can be an attribute name prefixed by '@'.
+CompiledPathType = list[tuple[bool, tuple[str, ...]]]
+
+_XSD_SPECIAL_TYPES = frozenset((nm.XSD_ANY_TYPE, nm.XSD_ANY_SIMPLE_TYPE,
+                                nm.XSD_ANY_ATOMIC_TYPE))
+
+
+def match_step(tag: Any, name: str) -> bool:
+    """Matches an element tag with a name test of a compiled path."""
+    if name == '*':
+        return isinstance(tag, str)
+    elif name[-1] == '*':
+        return isinstance(tag, str) and tag.startswith(name[:-1])
+    return bool(tag == name)
+
 
 class XsdSelector(XsdComponent):
     """Class for defining an XPath selector for an XSD identity constraint."""
@@ -64,6 +84,7 @@ class XsdSelector(XsdComponent):
     )
     pattern: Optional[re.Pattern[str]] = None
     xpath_default_namespace = ''
+    steps: Optional[CompiledPathType] = None
 
     def __init__(self, elem: ElementType, schema: SchemaType,
                  parent: Optional['XsdIdentity']) -> None:
@@ -75,6 +96,7 @@ class XsdSelector(XsdComponent):
         except KeyError:
             self.parse_error(_("'xpath' attribute required"))
             self.path = '*'
+            path = ''
         else:
             path = self.path.replace(' ', '')
             if self.pattern is None:
@@ -90,6 +112,7 @@ class XsdSelector(XsdComponent):
             if not self.pattern.match(path):
                 msg = _("invalid XPath expression for an {}")
                 self.parse_error(msg.format(self.__class__.__name__))
+                path = ''
 
         # XSD 1.1 xpathDefaultNamespace attribute
         if self.schema.XSD_VERSION > '1.0':
@@ -110,10 +133,67 @@ class XsdSelector(XsdComponent):
         except ElementPathError as err:
             self.token = self.parser.parse('*')
             self.parse_error(err)
+        else:
+            if path:
+                self.steps = self.compile_path(path)
 
     def __repr__(self) -> str:
         return '%s(path=%r)' % (self.__class__.__name__, self.path)
 
+    def compile_path(self, path: str) -> Optional[CompiledPathType]:
+        """
+        Compiles a path of the restricted XPath subset of identity constraints
+        into child steps with expanded names. Returns `None` if a prefix is
+        not mapped to a namespace.
+        """
+        steps: CompiledPathType = []
+        for expr in path.split('|'):
+            descendant = expr.startswith('.//')
+            if descendant:
+                expr = expr[3:]
+
+            names = []
+            for step in expr.split('/'):
+                if step == '.':
+                    continue
+                elif step.startswith('child::'):
+                    step = step[7:]
+
+                attribute = step.startswith(('@', 'attribute::'))
+                if attribute:
+                    step = step[1:] if step[0] == '@' else step[11:]
+
+                prefix, _sep, local_name = step.rpartition(':')
+                if prefix:
+                    try:
+                        namespace = self.schema.namespaces[prefix]
+                    except KeyError:
+                        return None
+                elif attribute or local_name == '*':
+                    namespace = ''
+                else:
+                    namespace = self.xpath_default_namespace
+
+                name = f'{{{namespace}}}{local_name}' if namespace else local_name
+                names.append(f'@{name}' if attribute else name)
+
+            steps.append((descendant, tuple(names)))
+
+        return steps
+
+    def select_elements(self, elem: ElementType) -> Iterator[ElementType]:
+        """
+        Selects the elements of a compiled path. Can be used only if the
+        selector path is compiled.
+        """
+        assert self.steps is not None
+        for descendant, names in self.steps:
+            context: Iterable[ElementType] = elem.iter() if descendant else (elem,)
+            for name in names:
+                context = [child for e in context for child in e
+                           if match_step(child.tag, name)]
+            yield from context
+
 
 class XsdFieldSelector(XsdSelector):
     """Class for defining an XPath field selector for an XSD identity constraint."""
@@ -245,8 +325,9 @@ class XsdIdentity(XsdComponent):
                     self.elements[e] = [FieldValueSelector(f, e) for f in self.fields]
                     e.selected_by.add(self)
 
-    def get_counter(self, elem: ElementType) -> 'IdentityCounter':
-        return IdentityCounter(self, elem)
+    def get_counter(self, elem: ElementType, limit: Optional[int] = None) \
+            -> 'IdentityCounter':
+        return IdentityCounter(self, elem, limit)
 
 
 class XsdUnique(XsdIdentity):
@@ -333,8 +414,9 @@ class XsdKeyref(XsdIdentity):
 
             self.refer_path = refer_path
 
-    def get_counter(self, elem: ElementType) -> 'KeyrefCounter':
-        return KeyrefCounter(self, elem)
+    def get_counter(self, elem: ElementType, limit: Optional[int] = None) \
+            -> 'KeyrefCounter':
+        return KeyrefCounter(self, elem, limit)
 
 
 class Xsd11Unique(XsdUnique):
@@ -362,29 +444,60 @@ class Xsd11Keyref(XsdKeyref):
 
 
 class IdentityCounter:
+    """
+    A counter of the field values collected for an identity constraint. Over
+    the optional *limit* the values are moved to a temporary on-disk database,
+    bounding the memory used by identities with a large number of values.
+    """
+    counter: Union[Counter[IdentityCounterType], DiskCounter[IdentityCounterType]]
     elements: Optional[set[Any]]  # don't need to check, should be only etree elements anyway
 
-    __slots__ = ('elements', 'counter', 'identity', 'elem', 'enabled')
+    __slots__ = ('elements', 'counter', 'identity', 'elem', 'enabled', 'limit')
 
-    def __init__(self, identity: XsdIdentity, elem: ElementType) -> None:
-        self.counter: Counter[IdentityCounterType] = Counter[IdentityCounterType]()
+    def __init__(self, identity: XsdIdentity, elem: ElementType,
+                 limit: Optional[int] = None) -> None:
+        self.counter = Counter[IdentityCounterType]()
         self.identity = identity
         self.elem = elem
         self.enabled = True
         self.elements = None
+        self.limit = limit
 
     def __repr__(self) -> str:
         return "%s%r" % (self.__class__.__name__[:-7], self.counter)
 
     def reset(self, elem: ElementType) -> None:
-        self.counter.clear()
+        if isinstance(self.counter, DiskCounter):
+            self.counter.close()
+            self.counter = Counter[IdentityCounterType]()
+        else:
+            self.counter.clear()
         self.elem = elem
         self.enabled = True
         self.elements = None
 
-    def increase(self, fields: IdentityCounterType) -> None:
+    def add(self, fields: IdentityCounterType) -> int:
+        """Adds a tuple of field values, returning its count."""
+        if isinstance(self.counter, DiskCounter):
+            return self.counter.add(fields)
+
         self.counter[fields] += 1
-        if self.counter[fields] == 2:
+        if self.limit is not None and len(self.counter) > self.limit:
+            count = self.counter[fields]
+            self.counter = DiskCounter(self.counter.items())
+            return count
+        return self.counter[fields]
+
+    def update(self, other: 'IdentityCounter') -> None:
+        """Adds the counts of another identity counter, like `Counter.update()`."""
+        for fields, count in other.counter.items():
+            self.counter[fields] += count
+            if self.limit is not None and isinstance(self.counter, Counter) \
+                    and len(self.counter) > self.limit:
+                self.counter = DiskCounter(self.counter.items())
+
+    def increase(self, fields: IdentityCounterType) -> None:
+        if self.add(fields) == 2:
             msg = _("duplicated value {0!r} for {1!r}")
             raise XMLSchemaValueError(msg.format(fields, self.identity))
 
@@ -392,13 +505,14 @@ class IdentityCounter:
 class KeyrefCounter(IdentityCounter):
     identity: XsdKeyref
 
-    def __init__(self, identity: XsdIdentity, elem: ElementType) -> None:
-        super().__init__(identity, elem)
+    def __init__(self, identity: XsdIdentity, elem: ElementType,
+                 limit: Optional[int] = None) -> None:
+        super().__init__(identity, elem, limit)
         if isinstance(self.identity.refer, (XsdKey, XsdUnique)):
             self.refer = self.identity.refer
 
     def increase(self, fields: IdentityCounterType) -> None:
-        self.counter[fields] += 1
+        self.add(fields)
 
     def iter_errors(self, identities: dict[XsdIdentity, IdentityCounter]) \
             -> Iterator[XMLSchemaValueError]:
@@ -421,7 +535,8 @@ class KeyrefCounter(IdentityCounter):
 class FieldValueSelector:
 
     __slots__ = ('field', 'xsd_element', 'xpath_proxy', 'value_constraints',
-                 'token', 'decoders', 'skip_wildcard')
+                 'token', 'decoders', 'skip_wildcard', 'steps', 'value_kind',
+                 'atomic_value')
 
     def __init__(self, field: XsdFieldSelector, xsd_element: 'XsdElement') -> None:
         if field.token is None:
@@ -458,6 +573,43 @@ class FieldValueSelector:
         if len(self.decoders) > 1 and None in self.value_constraints:
             self.value_constraints.pop(None)
 
+        # A field path with only named child steps, that selects a single
+        # atomic valued component, is evaluated directly on the elements.
+        self.steps: Optional[tuple[str, ...]] = None
+        self.value_kind: Optional[str] = None
+        self.atomic_value: Any = None
+
+        if field.steps is None or len(field.steps) != 1 or len(self.decoders) != 1:
+            return
+
+        descendant, names = field.steps[0]
+        comp = self.decoders[0]
+        if descendant or any(x[-1] == '*' for x in names) or isinstance(comp, XsdWildcard):
+            return
+        elif names and names[-1][0] == '@':
+            if not isinstance(comp, XsdAttribute) or \
+                    names[-1].startswith(f'@{{{nm.XSI_NAMESPACE}}}'):
+                return
+        elif not isinstance(comp, elements_module.XsdElement):
+            return
+
+        xsd_type = comp.type
+        if xsd_type.name in _XSD_SPECIAL_TYPES or \
+                xsd_type.content_type_label != 'simple' or \
+                xsd_type.simple_type is None or \
+                not xsd_type.simple_type.is_atomic() or \
+                xsd_type.simple_type.is_list() or \
+                xsd_type.is_notation():
+            return
+
+        self.steps = names
+        if xsd_type.is_qname():
+            self.value_kind = 'qname'
+        elif xsd_type.is_boolean():
+            self.value_kind = 'boolean'
+        else:
+            self.atomic_value = next(iter_atomic_values(xsd_type), None)
+
     def get_value(self, element_node: EtreeElementNode,
                   namespaces: Optional[NsmapType] = None) -> IdentityFieldItemType:
         """
@@ -466,6 +618,46 @@ class FieldValueSelector:
         :param element_node: a no Element
         :param namespaces: is an optional mapping from namespace prefix to URI.
         """
+        value: Union[AtomicValueType, list[Optional[AtomicValueType]], None]
+        if self.steps is None or not self.xpath_proxy.is_fully_valid() or \
+                (nodes := self.select_nodes(element_node.obj)) is None:
+            value = self.select_value(element_node, namespaces)
+        elif len(nodes) > 1:
+            msg = _("%r field selects multiple values!")
+            raise XMLSchemaValueError(msg % self.field)
+        elif nodes:
+            value = self.decode_node(nodes[0], namespaces)
+        else:
+            value = self.value_constraints.get(None)
+
+        match value:
+            case None:
+                if not isinstance(self.field.parent, XsdKey) or \
+                        'ref' in element_node.obj.attrib and \
+                        self.field.schema.meta_schema is None and \
+                        self.field.schema.XSD_VERSION != '1.0':
+                    return None
+                else:
+                    msg = _("missing key field {0!r} for {1!r}")
+                    raise XMLSchemaValueError(msg.format(self.field.path, self))
+            case list():
+                return tuple(value)
+            case UntypedAtomic():
+                return str(value)
+            case bool():
+                return value, bool
+            case float():
+                if math.isnan(value):
+                    return 'nan', float
+                else:
+                    return value, float
+            case _:
+                return value
+
+    def select_value(self, element_node: EtreeElementNode,
+                     namespaces: Optional[NsmapType] = None) \
+            -> Union[AtomicValueType, list[Optional[AtomicValueType]], None]:
+        """Selects and decodes the field value using the XPath token of the field."""
         value: Union[AtomicValueType, list[Optional[AtomicValueType]], None] = None
         element_node.schema = None  # type: ignore[assignment]
         context = XPathContext(
@@ -519,26 +711,84 @@ class FieldValueSelector:
             if empty:
                 value = self.value_constraints.get(None)
 
-        match value:
-            case None:
-                if not isinstance(self.field.parent, XsdKey) or \
-                        'ref' in element_node.obj.attrib and \
-                        self.field.schema.meta_schema is None and \
-                        self.field.schema.XSD_VERSION != '1.0':
-                    return None
-                else:
-                    msg = _("missing key field {0!r} for {1!r}")
-                    raise XMLSchemaValueError(msg.format(self.field.path, self))
-            case list():
-                return tuple(value)
-            case UntypedAtomic():
-                return str(value)
-            case bool():
-                return value, bool
-            case float():
-                if math.isnan(value):
-                    return 'nan', float
+        return value
+
+    def select_nodes(self, elem: ElementType) -> Optional[list[Union[ElementType, str]]]:
+        """
+        Selects the nodes of a compiled field path, returning a list of elements
+        or of attribute values. Returns `None` if the path crosses an element
+        with an `xsi:type` attribute, whose types are resolved only by XPath.
+        """
+        assert self.steps is not None
+        nodes: list[ElementType] = [elem]
+        for name in self.steps:
+            if name[0] == '@':
+                default = cast(XsdAttribute, self.decoders[0]).value_constraint
+                values = [e.get(name[1:], default) for e in nodes]
+                return [x for x in values if x is not None]
+
+            nodes = [child for e in nodes for child in e if child.tag == name]
+            if any(nm.XSI_TYPE in child.attrib for child in nodes):
+                return None
+
+        return cast(list[Union[ElementType, str]], nodes)
+
+    def decode_node(self, node: Union[ElementType, str],
+                    namespaces: Optional[NsmapType] = None) \
+            -> Union[AtomicValueType, list[Optional[AtomicValueType]], None]:
+        """
+        Decodes an element or an attribute value selected by a compiled field
+        path, with the same results of the evaluation of the XPath token.
+        """
+        comp = cast(Union['XsdElement', XsdAttribute], self.decoders[0])
+        xsd_type = comp.type
+        value: Any
+
+        if isinstance(node, str):
+            string_value = node
+        elif self.value_kind is not None:
+            string_value = ''.join(etree_iter_strings(node))
+
+        if self.value_kind == 'qname':
+            value = get_extended_qname(string_value.strip(), namespaces)
+        elif self.value_kind == 'boolean':
+            value = xsd_type.text_decode(string_value.strip())
+        else:
+            try:
+                if isinstance(node, str):
+                    value = self.get_atomic_sequence(node)
+                elif node.get(nm.XSI_NIL) and getattr(xsd_type.parent, 'nillable', None):
+                    value = []
+                elif node.text is not None:
+                    value = self.get_atomic_sequence(node.text)
+                elif node.get(nm.XSI_NIL) in ('1', 'true'):
+                    value = ['']
                 else:
-                    return value, float
-            case _:
-                return value
+                    value = self.get_atomic_sequence(comp.value_constraint or '')
+            except (KeyError, ValueError):
+                if not isinstance(node, str):
+                    string_value = ''.join(etree_iter_strings(node))
+                value = xsd_type.text_decode(string_value)
+            else:
+                if len(value) == 1:
+                    value = value[0]
+
+        if value is None:
+            value = self.value_constraints.get(comp.name)
+        return cast(Union[AtomicValueType, list[Optional[AtomicValueType]], None], value)
+
+    def get_atomic_sequence(self, text: str) -> list[Any]:
+        """
+        Decodes a text to the typed value of the compiled field component. Uses
+        the atomic value related to the type, falling back to elementpath for
+        invalid texts, so errors are the same of the XPath evaluation.
+        """
+        value = self.atomic_value
+        if value is not None:
+            try:
+                if isinstance(value, (AbstractDateTime, Duration)):
+                    return [value.fromstring(text)]
+                return [value.__class__(text)]
+            except (ArithmeticError, ValueError):
+                pass
+        return list(get_atomic_sequence(self.decoders[0].type, text))
@@ -31,6 +31,7 @@ AdvanceYieldedType = tuple[ModelParticleType, int, list[SchemaElementType]]
 ContentItemType = tuple[Union[int, str], Any]
 EncodedContentType = Union[MutableMapping[Union[int, str], Any], Iterable[ContentItemType]]
 StepType = Union[str, SchemaElementType, tuple[Union[str, SchemaElementType], int]]
+AutomatonMatchType = Optional[tuple[SchemaElementType, SchemaElementType, int]]
 
 
 def distinguishable_paths(path1: list[ModelParticleType], path2: list[ModelParticleType]) -> bool:
@@ -174,6 +175,257 @@ def check_model(group: ModelGroupType) -> None:
         paths[e.name] = e, current_path[:]
 
 
+def check_model_automaton(group: ModelGroupType) -> None:
+    """
+    Checks if the model group is deterministic, like :func:`check_model` but using
+    the follow sets of the position automaton (Glushkov automaton) of the model,
+    instead of comparing the paths of the particles pairwise. Follow sets are
+    restricted to the positions that overlap with other positions, so the check
+    scales about linearly with the size of the model, and it's not bounded by
+    the model depth limit.
+
+    If a violation is found the model is checked again with :func:`check_model`,
+    so the error is the same if both checkers reject the model. The results can
+    still differ, because :func:`check_model` compares the paths of the particles
+    with an heuristic:
+
+    * this checker detects UPA violations that :func:`check_model` misses;
+    * this checker accepts some deterministic models that :func:`check_model`
+      rejects, and it ignores particles with maxOccurs=0.
+
+    :param group: the model group to check.
+    :raises: an `XMLSchemaModelError` at first violated constraint.
+    """
+    try:
+        _check_follow_sets(group)
+    except XMLSchemaModelError as err:
+        try:
+            check_model(group)
+        except XMLSchemaModelDepthError:
+            raise err from None
+        raise
+
+
+def _check_follow_sets(group: ModelGroupType) -> None:
+    empty: frozenset[int] = frozenset()
+
+    # Tree of the particles, in document order, with nodes identified by index
+    # because a particle can be repeated in the model by group references.
+    particles: list[ModelParticleType] = []
+    children: list[list[int]] = []
+    stack: list[tuple[ModelParticleType, int]] = [(group, -1)]
+    while stack:
+        particle, parent = stack.pop()
+        if parent >= 0:
+            children[parent].append(len(particles))
+        children.append([])
+        particles.append(particle)
+        if isinstance(particle, groups.XsdGroup):
+            stack.extend((item, len(particles) - 1) for item in reversed(particle))
+
+    positions = [k for k, p in enumerate(particles) if not isinstance(p, groups.XsdGroup)]
+    elements: dict[int, SchemaElementType] = {k: particles[k] for k in positions}  # type: ignore
+
+    # Keys of names for finding candidates overlaps and EDC violations
+    def get_keys(xsd_element: SchemaElementType) -> set[Optional[str]]:
+        if isinstance(xsd_element, XsdAnyElement):
+            return {None}
+        keys: set[Optional[str]] = {xsd_element.name}
+        if xsd_element.substitution_group is not None:
+            keys.add(xsd_element.substitution_group)
+        keys.update(e.name for e in xsd_element.iter_substitutes())
+        return keys
+
+    keys_map: dict[int, set[Optional[str]]] = {}
+    buckets: dict[Optional[str], list[int]] = defaultdict(list)
+    wildcards: list[int] = []
+    for k, e in elements.items():
+        keys_map[k] = get_keys(e)
+        if isinstance(e, XsdAnyElement):
+            wildcards.append(k)
+        else:
+            for key in keys_map[k]:
+                buckets[key].append(k)
+
+    def is_overlap(k1: int, k2: int) -> bool:
+        e1, e2 = elements[k1], elements[k2]
+        if e1 is e2 or e1.max_occurs == 0 or e2.max_occurs == 0:
+            return False
+        return e1.is_overlap(e2) if k1 < k2 else e2.is_overlap(e1)
+
+    # Restricts the follow sets to the positions that can overlap with other positions
+    relevant: set[int] = set()
+    for bucket in buckets.values():
+        if len(bucket) > 1 and any(elements[k] is not elements[bucket[0]] for k in bucket):
+            relevant.update(bucket)
+    for k1 in wildcards:
+        for k2 in positions:
+            if k1 != k2 and is_overlap(k1, k2):
+                relevant.update((k1, k2))
+
+    # Nullable flags and first sets, computed bottom-up
+    nullable = [False] * len(particles)
+    content_nullable = [False] * len(particles)
+    first: list[frozenset[int]] = [empty] * len(particles)
+
+    for k in range(len(particles) - 1, -1, -1):
+        particle = particles[k]
+        if particle.max_occurs == 0:
+            nullable[k] = True
+            continue
+        elif not isinstance(particle, groups.XsdGroup):
+            if k in relevant:
+                first[k] = frozenset((k,))
+        elif not children[k]:
+            content_nullable[k] = True
+        elif particle.model == 'sequence':
+            items = []
+            for child in children[k]:
+                items.append(first[child])
+                if not nullable[child]:
+                    break
+            else:
+                content_nullable[k] = True
+            first[k] = empty.union(*items)
+        else:
+            content_nullable[k] = (any if particle.model == 'choice' else all)(
+                nullable[child] for child in children[k]
+            )
+            first[k] = empty.union(*(first[child] for child in children[k]))
+
+        nullable[k] = content_nullable[k] or particle.min_occurs == 0
+
+    # Follow sets, computed top-down as tuples of exclusive alternatives
+    def repeat(k: int, follows: tuple[frozenset[int], ...]) -> tuple[frozenset[int], ...]:
+        particle = particles[k]
+        if particle.max_occurs is not None and particle.max_occurs <= 1 or not first[k]:
+            return follows
+        elif particle.min_occurs == particle.max_occurs and not content_nullable[k]:
+            # A fixed number of not empty occurrences: repeat or exit is univocal
+            return tuple(dict.fromkeys(follows + (first[k],)))
+        else:
+            return tuple(dict.fromkeys(x | first[k] for x in follows))
+
+    follow: list[tuple[frozenset[int], ...]] = [()] * len(particles)
+    follow[0] = repeat(0, (empty,))
+
+    for k, particle in enumerate(particles):
+        if not children[k] or particle.max_occurs == 0:
+            continue
+        elif particle.model == 'sequence':  # type: ignore[union-attr]
+            suffix = empty
+            tail_nullable = True
+            for child in reversed(children[k]):
+                if tail_nullable:
+                    follows = tuple(dict.fromkeys(suffix | x for x in follow[k]))
+                else:
+                    follows = (suffix,)
+                follow[child] = repeat(child, follows)
+
+                if nullable[child]:
+                    suffix |= first[child]
+                else:
+                    suffix = first[child]
+                    tail_nullable = False
+
+        elif particle.model == 'choice':  # type: ignore[union-attr]
+            for child in children[k]:
+                follow[child] = repeat(child, follow[k])
+        else:
+            others = empty.union(*(first[child] for child in children[k]))
+            for child in children[k]:
+                follows = tuple(dict.fromkeys((others - first[child]) | x for x in follow[k]))
+                follow[child] = repeat(child, follows)
+
+    # Find the couples of competing positions
+    conflicts: dict[int, set[int]] = defaultdict(set)
+    checked: set[frozenset[int]] = set()
+
+    def check_follows(follows: frozenset[int]) -> None:
+        if len(follows) < 2 or follows in checked:
+            return
+        checked.add(follows)
+
+        members: dict[Optional[str], list[int]] = defaultdict(list)
+        for k in sorted(follows):
+            for key in keys_map[k]:
+                members[key].append(k)
+
+        for key, items in members.items():
+            if key is None:
+                items = sorted(follows)  # wildcards are compared with all the others
+            for k1 in members[key]:
+                for k2 in items:
+                    if (k1 < k2 or key is None and k1 != k2) and is_overlap(k1, k2):
+                        conflicts[max(k1, k2)].add(min(k1, k2))
+
+    check_follows(first[0])
+    for k in positions:
+        for x in follow[k]:
+            check_follows(x)
+
+    # Emulates the order of the constraint checks of check_model()
+    try:
+        any_element = group.parent.open_content.any_element  # type: ignore[union-attr]
+    except AttributeError:
+        any_element = None
+
+    paths: dict[Optional[str], int] = {}
+    ranks: dict[Optional[str], int] = {}
+    names_map: dict[Optional[str], set[Optional[str]]] = defaultdict(set)
+    inconsistent: set[Optional[str]] = set()
+
+    for k in positions:
+        e = elements[k]
+
+        candidates: set[Optional[str]]
+        if isinstance(e, XsdAnyElement) or any_element is not None and inconsistent:
+            candidates = set(paths)
+        else:
+            candidates = {None}
+            for key in keys_map[k]:
+                candidates.update(names_map[key])
+            candidates = {name for name in candidates if name in paths}
+
+        # Violations sorted by order of names and EDC before UPA, with the
+        # latest competing particle first, as it replaces the others in paths.
+        violations: list[tuple[int, int, int, int]] = [
+            (ranks[name], 0, 0, paths[name]) for name in candidates
+            if not e.is_consistent(elements[paths[name]]) or any_element
+            and not any_element.is_consistent(elements[paths[name]])
+        ]
+        violations.extend((ranks[elements[pk].name], 1, -pk, pk) for pk in conflicts.get(k, ()))
+
+        for _rank, upa, _order, pk in sorted(violations):
+            pe = elements[pk]
+            if not upa:
+                msg = _("Element Declarations Consistent violation between {0!r} and {1!r}"
+                        ": match the same name but with different types").format(e, pe)
+                raise XMLSchemaModelError(group, msg)
+            elif isinstance(pe, Xsd11AnyElement) and not isinstance(e, XsdAnyElement):
+                pe.add_precedence(e, group)
+            elif isinstance(e, Xsd11AnyElement) and not isinstance(pe, XsdAnyElement):
+                e.add_precedence(pe, group)
+            elif pe.parent is e.parent and pe.parent is not None \
+                    and pe.parent.model in ('all', 'choice'):
+                msg = _("{0!r} and {1!r} overlap and are in the same {2!r} group")
+                raise XMLSchemaModelError(group, msg.format(pe, e, pe.parent.model))
+            else:
+                msg = _("Unique Particle Attribution violation between {0!r} and {1!r}")
+                raise XMLSchemaModelError(group, msg.format(pe, e))
+
+        if e.name not in ranks:
+            ranks[e.name] = len(ranks)
+        for key in keys_map[k]:
+            names_map[key].add(e.name)
+        paths[e.name] = k
+        if any_element is not None:
+            if any_element.is_consistent(e):
+                inconsistent.discard(e.name)
+            else:
+                inconsistent.add(e.name)
+
+
 class ModelVisitor:
     """
     A visitor design pattern class that can be used for validating XML data related to an XSD
@@ -813,6 +1065,208 @@ class SuffixedModelVisitor(ModelVisitor):
             self.element = None
 
 
+class _NotCompilable(Exception):
+    """Raised when a model group can't be compiled into an automaton."""
+
+
+class ModelAutomaton:
+    """
+    A deterministic automaton compiled from a model group, with transitions keyed
+    by the particles of the model. Occurrences are unrolled into states, so the
+    automaton matches a sequence of child tags without counting occurrences.
+    The matches of child tags are memoized by state. Used for a fast validation
+    of child elements, falling back to :class:`ModelVisitor` for reporting errors.
+
+    :param root: the root model group.
+    :param transitions: a list with the transitions of each state, the initial \
+    state is the first.
+    :param finals: the set of accepting states.
+    """
+    __slots__ = ('root', 'transitions', 'finals', '_matches')
+
+    def __init__(self, root: ModelGroupType,
+                 transitions: list[dict[SchemaElementType, int]],
+                 finals: set[int]) -> None:
+        self.root = root
+        self.transitions = transitions
+        self.finals = finals
+        self._matches: list[dict[str, AutomatonMatchType]] = [{} for _ in transitions]
+
+    def __repr__(self) -> str:
+        return '%s(root=%r, states=%d)' % (
+            self.__class__.__name__, self.root, len(self.transitions)
+        )
+
+    def _match(self, state: int, tag: str) -> AutomatonMatchType:
+        match = None
+        for particle, target in self.transitions[state].items():
+            xsd_element = particle.match(tag)
+            if xsd_element is not None:
+                if match is not None:
+                    return None  # Not deterministic: fallback to the model visitor
+                match = xsd_element, particle, target
+        return match
+
+    def match(self, tags: Iterable[str]) \
+            -> Optional[list[tuple[SchemaElementType, SchemaElementType]]]:
+        """
+        Matches a sequence of child tags, returning a list of couples with the
+        matched XSD element and the model particle, or `None` if the sequence
+        is not accepted by the automaton.
+        """
+        state = 0
+        matches = self._matches
+        result = []
+        for tag in tags:
+            try:
+                match = matches[state][tag]
+            except KeyError:
+                match = matches[state][tag] = self._match(state, tag)
+
+            if match is None:
+                return None
+            result.append((match[0], match[1]))
+            state = match[2]
+
+        return result if state in self.finals else None
+
+
+def compile_model(group: ModelGroupType) -> Optional[ModelAutomaton]:
+    """
+    Compiles a model group into a :class:`ModelAutomaton`. Returns `None` if the
+    model includes 'all' groups or XSD 1.1 wildcards, if more occurrences of a
+    particle can match the same child or if the number of states exceeds the
+    limit `MAX_MODEL_STATES`.
+
+    :param group: the model group to compile.
+    """
+    max_states = _limits.MAX_MODEL_STATES
+    epsilons: list[list[int]] = []
+    moves: list[list[tuple[SchemaElementType, int]]] = []
+
+    def new_state() -> int:
+        if len(epsilons) > max_states * 4:
+            raise _NotCompilable()
+        epsilons.append([])
+        moves.append([])
+        return len(epsilons) - 1
+
+    def particle_fragment(particle: ModelParticleType, depth: int = 0) -> tuple[int, int]:
+        start = end = new_state()
+        min_occurs, max_occurs = particle.min_occurs, particle.max_occurs
+
+        if min_occurs > 1 and isinstance(particle, groups.XsdGroup):
+            # The model visitor doesn't count empty iterations of a group
+            if not particle or (any if particle.model == 'choice' else all)(
+                    item.is_emptiable() for item in particle):
+                raise _NotCompilable()
+
+        for _k in range(min_occurs):
+            s, e = item_fragment(particle, depth)
+            epsilons[end].append(s)
+            end = e
+
+        if max_occurs is None:
+            s, e = item_fragment(particle, depth)
+            loop = new_state()
+            epsilons[end].append(loop)
+            epsilons[loop].append(s)
+            epsilons[e].append(loop)
+            end = loop
+        else:
+            exit_state = new_state()
+            for _k in range(max_occurs - min_occurs):
+                s, e = item_fragment(particle, depth)
+                epsilons[end].extend((s, exit_state))
+                end = e
+            epsilons[end].append(exit_state)
+            end = exit_state
+
+        return start, end
+
+    def item_fragment(particle: ModelParticleType, depth: int) -> tuple[int, int]:
+        start = new_state()
+        end = new_state()
+
+        if not isinstance(particle, groups.XsdGroup):
+            if isinstance(particle, Xsd11AnyElement):
+                raise _NotCompilable()
+            moves[start].append((particle, end))
+        elif particle.model == 'all' or depth > _limits.MAX_MODEL_DEPTH:
+            raise _NotCompilable()
+        elif particle.model == 'choice':
+            if not particle.content:
+                return start, end  # an empty choice doesn't match anything
+            for item in particle.content:
+                s, e = particle_fragment(item, depth + 1)
+                epsilons[start].append(s)
+                epsilons[e].append(end)
+        else:
+            current = start
+            for item in particle.content:
+                s, e = particle_fragment(item, depth + 1)
+                epsilons[current].append(s)
+                current = e
+            epsilons[current].append(end)
+
+        return start, end
+
+    def closure(states: Iterable[int]) -> frozenset[int]:
+        stack = list(states)
+        result = set(stack)
+        while stack:
+            for k in epsilons[stack.pop()]:
+                if k not in result:
+                    result.add(k)
+                    stack.append(k)
+        return frozenset(result)
+
+    if not max_states:
+        return None
+
+    try:
+        start, end = particle_fragment(group)
+    except _NotCompilable:
+        return None
+
+    # Subset construction of the deterministic automaton
+    initial = closure((start,))
+    dfa_states = {initial: 0}
+    transitions: list[dict[SchemaElementType, int]] = []
+    finals: set[int] = set()
+    pending = deque([initial])
+
+    while pending:
+        nfa_states = pending.popleft()
+        targets: dict[SchemaElementType, list[int]] = {}
+        for k in nfa_states:
+            for particle, target in moves[k]:
+                if particle.max_occurs != 0:
+                    targets.setdefault(particle, []).append(target)
+
+        if end in nfa_states:
+            finals.add(len(transitions))
+
+        state_transitions: dict[SchemaElementType, int] = {}
+        for particle, nfa_targets in targets.items():
+            if len(nfa_targets) > 1:
+                # More occurrences of the particle compete for a child: the model
+                # visitor counts them greedily, that can't be represented by states.
+                return None
+
+            dfa_state = closure(nfa_targets)
+            if dfa_state not in dfa_states:
+                if len(dfa_states) >= max_states:
+                    return None
+                dfa_states[dfa_state] = len(dfa_states)
+                pending.append(dfa_state)
+            state_transitions[particle] = dfa_states[dfa_state]
+
+        transitions.append(state_transitions)
+
+    return ModelAutomaton(group, transitions, finals)
+
+
 #
 # Functions for manipulating encoded content
 
@@ -0,0 +1,160 @@
+#
+# Copyright (c), 2016-2026, SISSA (International School for Advanced Studies).
+# All rights reserved.
+# This file is distributed under the terms of the MIT License.
+# See the file 'LICENSE' in the root directory of the present
+# distribution, or http://opensource.org/licenses/MIT.
+#
+# @author Davide Brunato <brunato@sissa.it>
+#
+"""
+This module contains a compiler of decode plans, callables specialized for
+decoding the instances of an XSD element with a given kind of context.
+"""
+from collections.abc import Callable
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Optional
+
+from elementpath.datatypes import AbstractDateTime, Duration
+
+from xmlschema.aliases import ElementType
+from xmlschema.converters import ElementData
+from xmlschema.translation import gettext as _
+from xmlschema.utils.decoding import strictly_equal
+
+from .validation import PLAN_DECODING, PLAN_HOOKS, PLAN_LEXICAL, \
+    ValidationContext, DecodeContext
+from .simple_types import XsdSimpleType
+
+if TYPE_CHECKING:
+    from .elements import XsdElement  # noqa: F401
+
+DecodePlanType = Callable[[ElementType, str, ValidationContext], Any]
+TextGetterType = Callable[[ElementType, str, ValidationContext], Optional[str]]
+
+
+def is_leaf_element(xsd_element: 'XsdElement') -> bool:
+    """
+    Returns `True` if the XSD element has a simple type and none of the features
+    that need the general decoding path: abstract elements and types, identities,
+    type alternatives, inheritable attributes, empty or notation types.
+    """
+    xsd_type = xsd_element.type
+    return isinstance(xsd_type, XsdSimpleType) \
+        and not xsd_element.abstract \
+        and not xsd_element.identities \
+        and not xsd_element.selected_by \
+        and not xsd_element.alternatives \
+        and not xsd_element.inheritable \
+        and not xsd_element.attributes \
+        and not xsd_type.abstract \
+        and not xsd_type.is_empty() \
+        and not xsd_type.is_notation()
+
+
+def compile_decode_plan(xsd_element: 'XsdElement', flags: int) -> DecodePlanType:
+    """
+    Compiles a decode plan for an XSD element. A decode plan is a callable with the
+    same arguments of :meth:`XsdElement.raw_decode`, where the branches that don't
+    apply to the XSD element and to the context flags are left out. The plans of
+    leaf elements decode on a short path the child instances that have no attributes
+    and no children, otherwise they fall back to the general decoding method.
+    If no specialization is possible the bound method `raw_decode` is returned.
+
+    :param xsd_element: the XSD element to compile.
+    :param flags: the context flags, as computed by `ValidationContext.get_plan_flags()`.
+    """
+    raw_decode = xsd_element.raw_decode
+    if flags & PLAN_HOOKS or not is_leaf_element(xsd_element):
+        return raw_decode
+
+    xsd_type = xsd_element.type
+    assert isinstance(xsd_type, XsdSimpleType)
+    if flags & PLAN_LEXICAL:
+        type_decode = xsd_type.lexical_decode
+    else:
+        type_decode = xsd_type.raw_decode
+    fixed = xsd_element.fixed
+    default = xsd_element.default
+    get_text: Optional[TextGetterType] = None
+
+    if fixed is not None:
+        fixed_value = xsd_type.text_decode(fixed)
+
+        def get_fixed_text(obj: ElementType, validation: str,
+                           context: ValidationContext) -> Optional[str]:
+            text = obj.text
+            if not text:
+                return fixed
+            elif text != fixed and not strictly_equal(
+                    xsd_type.text_decode(text, context=context), fixed_value):
+                reason = _("must have the fixed value %r") % fixed
+                context.validation_error(validation, xsd_element, reason, obj)
+            return text
+
+        get_text = get_fixed_text
+
+    elif default is not None:
+        def get_default_text(obj: ElementType, validation: str,
+                             context: ValidationContext) -> Optional[str]:
+            text = obj.text
+            if not text and context.use_defaults:
+                return default
+            return text
+
+        get_text = get_default_text
+
+    if not flags & PLAN_DECODING:
+        def validate_leaf(obj: ElementType, validation: str,
+                          context: ValidationContext) -> Any:
+            if obj.attrib or len(obj) or not context.level:
+                return raw_decode(obj, validation, context)
+
+            context.elem = obj
+            text = obj.text if get_text is None else get_text(obj, validation, context)
+            type_decode(text or '', validation, context)
+            context.converter.set_xmlns_context(obj, context.level)
+            return None
+
+        return validate_leaf
+
+    is_qname = xsd_type.is_qname()
+
+    def decode_leaf(obj: ElementType, validation: str, context: ValidationContext) -> Any:
+        if obj.attrib or len(obj) or not context.level:
+            return raw_decode(obj, validation, context)
+
+        assert isinstance(context, DecodeContext)
+        context.elem = obj
+        text = obj.text if get_text is None else get_text(obj, validation, context)
+
+        value = type_decode(text or '', validation, context)
+        if value is None and context.filler is not None:
+            value = context.filler(xsd_element)
+        elif not text and not context.keep_empty:
+            value = None
+
+        if isinstance(value, context.keep_datatypes) or value is None:
+            pass
+        elif isinstance(value, str):
+            if is_qname and value[:1] == '{':
+                value = text
+        elif isinstance(value, Decimal):
+            if context.decimal_type is not None:
+                value = context.decimal_type(value)
+        elif isinstance(value, (AbstractDateTime, Duration)):
+            value = str(value) if text is None else text.strip()
+        else:
+            value = str(value)
+
+        xmlns = context.converter.set_xmlns_context(obj, context.level)
+        element_data = ElementData(obj.tag, value, None, [], xmlns)
+        try:
+            return context.converter.element_decode(
+                element_data, xsd_element, xsd_type, context.level
+            )
+        except (ValueError, TypeError) as err:
+            context.validation_error(validation, xsd_element, err, obj)
+            return None
+
+    return decode_leaf
@@ -15,9 +15,11 @@ XMLSchema11 for XSD 1.1. The latter class parses also XSD 1.0 schemas, as prescr
 the standard.
 """
 from abc import ABCMeta
+import inspect
 import logging
 import re
 import sys
+import threading
 from collections.abc import Callable, Iterator
 from functools import cached_property
 from operator import attrgetter
@@ -45,6 +47,7 @@ from xmlschema.utils.etree import prune_etree, is_etree_element, \
 from xmlschema.utils.qnames import get_namespace_ext
 from xmlschema.resources import XMLResource
 from xmlschema.arguments import check_validation_mode
+from xmlschema.caching import schema_lru_cache
 from xmlschema.converters import XMLSchemaConverter, ConverterType
 from xmlschema.xpath import XMLSchemaProxy, ElementPathMixin
 from xmlschema.namespaces import NamespaceView, NamespaceMapper
@@ -52,10 +55,11 @@ from xmlschema.locations import SCHEMAS_DIR
 from xmlschema.loaders import SchemaLoader
 from xmlschema.exports import export_schema
 from xmlschema.settings import SchemaSettings, ResourceSettings
+from xmlschema.snapshots import load_meta_snapshot
 from xmlschema import dataobjects
 
 from .exceptions import XMLSchemaValidationError, XMLSchemaEncodeError, \
-    XMLSchemaStopValidation
+    XMLSchemaStopValidation, XMLSchemaValidationFailure
 from .validation import ValidationContext, DecodeContext, EncodeContext
 from .helpers import parse_xsd_derivation, get_schema_annotations, qname_validator, \
     parse_xpath_default_namespace, parse_target_namespace
@@ -81,6 +85,55 @@ XSD_VERSION_PATTERN = re.compile(r'^\d+\.\d+$')
 _meta_registry: set['XMLSchemaBase'] = set()
 
 
+class MetaSchemaDescriptor:
+    """
+    A class-level descriptor that creates the meta-schema of a schema class
+    at first access and then replaces itself with the meta-schema instance.
+    The creation is protected by a lock, so it's safe to access the meta-schema
+    of a class concurrently from different threads.
+
+    :param meta_schema_class: the meta-schema class.
+    :param source: location of the XSD meta-schema file/resource.
+    :param base_schemas: a dictionary that contains namespace URIs and locations \
+    of base schemas.
+    :param snapshot: optional path of a pre-built meta-schema snapshot. If the \
+    snapshot is missing or not usable the meta-schema is created from sources.
+    """
+    __slots__ = ('meta_schema_class', 'source', 'base_schemas', 'snapshot', '_owner', '_lock')
+
+    _owner: type['XMLSchemaBase']
+
+    def __init__(self, meta_schema_class: type[SchemaType],
+                 source: str, base_schemas: dict[str, str],
+                 snapshot: Optional[str] = None) -> None:
+        self.meta_schema_class = meta_schema_class
+        self.source = source
+        self.base_schemas = base_schemas
+        self.snapshot = snapshot
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type['XMLSchemaBase'], name: str) -> None:
+        self._owner = owner
+
+    def __get__(self, instance: Optional['XMLSchemaBase'],
+                owner: type['XMLSchemaBase']) -> SchemaType:
+        with self._lock:
+            meta_schema = self._owner.__dict__['meta_schema']
+            if meta_schema is self:
+                if self.snapshot is not None:
+                    meta_schema = load_meta_snapshot(self.meta_schema_class, self.snapshot)
+                if meta_schema is self or meta_schema is None:
+                    meta_schema = self.create()
+                _meta_registry.add(meta_schema)
+                setattr(self._owner, 'meta_schema', meta_schema)
+
+        return cast(SchemaType, meta_schema)
+
+    def create(self) -> SchemaType:
+        """Creates a new meta-schema instance from the XSD sources."""
+        return self.meta_schema_class.create_meta_schema(self.source, self.base_schemas)
+
+
 class XMLSchemaMeta(ABCMeta):
     XSD_VERSION: str
     BASE_SCHEMAS: dict[str, str]
@@ -117,15 +170,14 @@ class XMLSchemaMeta(ABCMeta):
             # Build the meta-schema class and register it into module's globals
             meta_schema_class_name = 'Meta' + name
 
-            meta_schema: Optional[SchemaType]
-            meta_schema = getattr(base_class, 'meta_schema', None)
-            if meta_schema is None:
-                meta_bases = bases
-            else:
+            base_meta_schema = inspect.getattr_static(base_class, 'meta_schema', None)
+            if isinstance(base_meta_schema, MetaSchemaDescriptor):
                 # Use base's meta_schema class as base for the new meta-schema
-                meta_bases = (meta_schema.__class__,)
-                if len(bases) > 1:
-                    meta_bases += bases[1:]
+                meta_bases = (base_meta_schema.meta_schema_class,) + bases[1:]
+            elif base_meta_schema is not None:
+                meta_bases = (base_meta_schema.__class__,) + bases[1:]
+            else:
+                meta_bases = bases
 
             meta_schema_class = cast(
                 type[SchemaType],
@@ -135,9 +187,10 @@ class XMLSchemaMeta(ABCMeta):
             module = sys.modules[dict_['__module__']]
             setattr(module, meta_schema_class_name, meta_schema_class)
 
-            meta_schema = meta_schema_class.create_meta_schema(meta_schema_file, base_schemas)
-            dict_['meta_schema'] = meta_schema
-            _meta_registry.add(meta_schema)
+            # The meta-schema instance is created at first access
+            dict_['meta_schema'] = MetaSchemaDescriptor(
+                meta_schema_class, meta_schema_file, base_schemas, dict_.get('META_SNAPSHOT')
+            )
 
         # Create the class and check some basic attributes
         cls = super().__new__(mcs, name, bases, dict_)
@@ -196,6 +249,8 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
 
     :cvar XSD_VERSION: store the XSD version (1.0 or 1.1).
     :cvar BASE_SCHEMAS: a dictionary from namespace to schema resource for meta-schema bases.
+    :cvar META_SNAPSHOT: an optional path to a pre-built snapshot of the meta-schema, \
+    that is used instead of building the meta-schema from XSD sources.
     :cvar meta_schema: the XSD meta-schema instance.
     :cvar attribute_form_default: the schema's *attributeFormDefault* attribute. \
     Default is 'unqualified'.
@@ -225,6 +280,7 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
     XSD_VERSION: str = '1.0'
     META_SCHEMA: str
     BASE_SCHEMAS: dict[str, str] = {}
+    META_SNAPSHOT: Optional[str] = None
 
     builders: XsdBuilders
     meta_schema: Optional[SchemaType] = None
@@ -326,6 +382,19 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
         logger.debug("Load schema from %r", source)
         self.source = settings.get_schema_resource(source, base_url)
 
+        # Restore the schema from a snapshot, if available and not outdated
+        snapshots = snapshot_key = None
+        if global_maps is None and parent is None and use_meta and build \
+                and not partial and not other_sources and self.meta_schema is not None:
+            snapshots = settings.get_snapshots()
+            if snapshots is not None:
+                snapshot_key = snapshots.get_key(self, settings)
+                if snapshot_key is not None and snapshots.load(self, snapshot_key):
+                    self.maps.settings = settings
+                    if loglevel is not None:
+                        logger.setLevel(logging.WARNING)
+                    return
+
         self.name = self.source.name
         root = self.source.root
 
@@ -424,6 +493,8 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
         try:
             if build:
                 self.maps.build()
+                if snapshots is not None and snapshot_key is not None:
+                    snapshots.save(self, snapshot_key)
         finally:
             if loglevel is not None:
                 logger.setLevel(logging.WARNING)  # Restore default logging
@@ -844,14 +915,28 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
         """Builds the schema's XSD global maps."""
         self.maps.build()
 
+    def build_all(self) -> None:
+        """
+        Builds the schema's XSD global maps, including the global components
+        not looked up yet when the schema is built in lazy mode.
+        """
+        self.maps.build_all()
+
     @property
     def built(self) -> bool:
         return self.maps.built
 
+    @property
+    def lazy_build(self) -> bool:
+        """`True` if the global components are built on demand."""
+        return self.maps.lazy_build
+
     @cached_property
     def validation_attempted(self) -> str:
-        if any(isinstance(t, tuple) and t[-1] is self
-               for x in self.maps.global_maps.iter_staged() for t in x):
+        if self.maps.global_maps.lazy and any(True for _ in self.iter_staged()):
+            return 'partial'  # staged globals are built on demand
+        elif any(isinstance(t, tuple) and t[-1] is self
+                 for x in self.maps.global_maps.iter_staged() for t in x):
             return 'partial'
         elif any(c.schema is self and not c.built
                  for c in self.maps.global_maps.iter_globals()):
@@ -947,14 +1032,28 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                     namespaces: Optional[NsmapType] = None) -> Optional[XsdElement]:
         if not path or path == tag or path == f'/{tag}':
             return self.maps.elements.get(tag)
-        elif path[-1] == '*':
-            xsd_element = self.find(path[:-1] + tag, namespaces)
+        elif namespaces is None:
+            return self._get_path_element(tag, path, None)
+        else:
+            return self._get_path_element(tag, path, tuple(namespaces.items()))
+
+    @schema_lru_cache(maxsize=1024)
+    def _get_path_element(self, tag: str, path: str,
+                          namespaces: Optional[tuple[tuple[str, str], ...]]) \
+            -> Optional[XsdElement]:
+        """
+        Resolves the XSD element of a tag from a schema path. Called through the
+        cache of the global maps, so the namespaces are provided as a tuple of items.
+        """
+        nsmap = None if namespaces is None else dict(namespaces)
+        if path[-1] == '*':
+            xsd_element = self.find(path[:-1] + tag, nsmap)
             if isinstance(xsd_element, XsdElement):
                 return xsd_element
             else:
                 return self.maps.elements.get(tag)
         else:
-            xsd_element = self.find(path, namespaces)
+            xsd_element = self.find(path, nsmap)
             if not isinstance(xsd_element, XsdElement):
                 return None
             elif xsd_element.name != tag:
@@ -1220,7 +1319,10 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                  extra_validator: Optional[ExtraValidatorType] = None,
                  validation_hook: Optional[ValidationHookType] = None,
                  allow_empty: bool = True,
-                 use_location_hints: bool = False) -> None:
+                 use_location_hints: bool = False,
+                 use_decode_plans: bool = False,
+                 use_value_cache: bool = False,
+                 identity_limit: Optional[int] = None) -> None:
         """
         Validates an XML data against the XSD schema/component instance.
 
@@ -1255,12 +1357,26 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
         :param use_location_hints: for default schema locations hints provided within \
         XML data are ignored in order to avoid the change of schema instance. Set this \
         option to `True` to activate dynamic schema loading using schema location hints.
+        :param use_decode_plans: if set to `True` the child elements are validated using \
+        decode plans, callables specialized for each XSD element that skip the checks \
+        not applicable to the XSD element and to the provided options.
+        :param use_value_cache: if set to `True` the values of atomic types are decoded \
+        using an LRU cache of the schema, useful for XML data that repeats the same \
+        values many times. Types whose decoding depends on the context, like QNames \
+        or IDs, are not cached.
+        :param identity_limit: an optional limit for the number of values that each \
+        identity constraint, or the registry of xs:ID and xs:IDREF values, keeps in \
+        memory. Over the limit the values are moved to a temporary on-disk database, \
+        useful for validating huge XML data with keys that have a document-wide scope.
         :raises: :exc:`XMLSchemaValidationError` if the XML data instance is invalid.
         """
         for error in self.iter_errors(source, path, schema_path, use_defaults,
                                       namespaces, max_depth, extra_validator,
                                       validation_hook, allow_empty, use_location_hints,
-                                      validation='strict'):
+                                      validation='strict',
+                                      use_decode_plans=use_decode_plans,
+                                      use_value_cache=use_value_cache,
+                                      identity_limit=identity_limit):
             raise error
 
     def is_valid(self, source: Union[XMLSourceType, XMLResource],
@@ -1272,15 +1388,39 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                  extra_validator: Optional[ExtraValidatorType] = None,
                  validation_hook: Optional[ValidationHookType] = None,
                  allow_empty: bool = True,
-                 use_location_hints: bool = False) -> bool:
+                 use_location_hints: bool = False,
+                 use_decode_plans: bool = False,
+                 use_value_cache: bool = False,
+                 identity_limit: Optional[int] = None) -> bool:
         """
         Like :meth:`validate` except that does not raise an exception but returns
         ``True`` if the XML data instance is valid, ``False`` if it is invalid.
+        The validation stops at the first error, without building error instances:
+        use :meth:`iter_errors` for getting the details of an invalid XML data.
         """
-        error = next(self.iter_errors(source, path, schema_path, use_defaults,
-                                      namespaces, max_depth, extra_validator,
-                                      validation_hook, allow_empty, use_location_hints), None)
-        return error is None
+        self.check_validator(validation='lax')
+        resource = self.maps.settings.get_xml_resource(source)
+        context = ValidationContext(
+            source=resource,
+            converter=NamespaceMapper(namespaces, source=resource),
+            level=resource.lazy_depth or bool(path),
+            check_identities=True,
+            use_defaults=use_defaults,
+            use_location_hints=use_location_hints,
+            use_decode_plans=use_decode_plans,
+            value_cache=self.maps.cache if use_value_cache else None,
+            identity_limit=identity_limit,
+            fail_fast=True,
+            max_depth=max_depth,
+            extra_validator=extra_validator,
+            validation_hook=validation_hook,
+        )
+        try:
+            for _error in self._iter_errors(context, path, schema_path, allow_empty):
+                return False
+        except XMLSchemaValidationFailure:
+            return False
+        return True
 
     def iter_errors(self, source: Union[XMLSourceType, XMLResource],
                     path: Optional[str] = None,
@@ -1292,11 +1432,26 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                     validation_hook: Optional[ValidationHookType] = None,
                     allow_empty: bool = True,
                     use_location_hints: bool = False,
-                    validation: str = 'lax') \
+                    validation: str = 'lax',
+                    use_decode_plans: bool = False,
+                    max_errors: Optional[int] = None,
+                    aggregate_errors: Optional[int] = None,
+                    use_value_cache: bool = False,
+                    identity_limit: Optional[int] = None) \
             -> Iterator[XMLSchemaValidationError]:
         """
         Creates an iterator for the errors generated by the validation of an XML data against
-        the XSD schema/component instance. Accepts the same arguments of :meth:`validate`.
+        the XSD schema/component instance. Accepts the same arguments of :meth:`validate`,
+        plus the following:
+
+        :param max_errors: an optional limit for the number of validation errors. \
+        The validation stops cleanly at the first error that exceeds the limit, so \
+        if the iterator yields *max_errors* errors the XML data can have other errors.
+        :param aggregate_errors: if provided, the validation errors are grouped by \
+        their class, XSD validator, model particle or attribute and XML element tag, \
+        and only the first *aggregate_errors* errors of each group are yielded. \
+        The other errors are only counted by the `occurrences` attribute of the \
+        first error of the group, that is final when the iteration ends.
         """
         self.check_validator(validation='lax')
         resource = self.maps.settings.get_xml_resource(source)
@@ -1307,15 +1462,33 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
             check_identities=True,
             use_defaults=use_defaults,
             use_location_hints=use_location_hints,
+            use_decode_plans=use_decode_plans,
+            value_cache=self.maps.cache if use_value_cache else None,
+            identity_limit=identity_limit,
+            max_errors=max_errors,
+            aggregate_errors=aggregate_errors,
             max_depth=max_depth,
             extra_validator=extra_validator,
             validation_hook=validation_hook,
         )
-
+        try:
+            yield from self._iter_errors(context, path, schema_path, allow_empty, validation)
+        except XMLSchemaStopValidation:
+            if not context.max_errors_exceeded:
+                raise
+
+    def _iter_errors(self, context: ValidationContext,
+                     path: Optional[str] = None,
+                     schema_path: Optional[str] = None,
+                     allow_empty: bool = True,
+                     validation: str = 'lax') -> Iterator[XMLSchemaValidationError]:
+        resource = context.source
         namespaces = context.namespaces
         identities = context.identities
         ancestors: list[Element] = []
         prev_ancestors: list[Element] = []
+        xsd_ancestors: list[XsdElement] = []
+        ancestors_cache: dict[tuple[str, ...], list[XsdElement]] = {}
 
         namespace = resource.namespace or namespaces.get('', '')
         try:
@@ -1344,10 +1517,22 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                     for k in range(min(len(ancestors), len(prev_ancestors))):
                         if ancestors[k] is not prev_ancestors[k]:
                             break
-
-                    path_ = f"{'/'.join(e.tag for e in ancestors)}/ancestor-or-self::node()"
-                    xsd_ancestors = cast(list[XsdElement],
-                                         schema.findall(path_, namespaces)[1:])
+                    else:
+                        k = min(len(ancestors), len(prev_ancestors))
+
+                    tags = tuple(e.tag for e in ancestors)
+                    try:
+                        xsd_ancestors = ancestors_cache[tags]
+                    except KeyError:
+                        if k and len(xsd_ancestors) == len(prev_ancestors):
+                            xsd_ancestors = self._resolve_ancestors(
+                                xsd_ancestors[:k], tags[k:]
+                            )
+                        else:
+                            path_ = f"{'/'.join(tags)}/ancestor-or-self::node()"
+                            xsd_ancestors = cast(list[XsdElement],
+                                                 schema.findall(path_, namespaces)[1:])
+                        ancestors_cache[tags] = xsd_ancestors
 
                     # Clear identity constraints counters
                     for k, e in enumerate(xsd_ancestors[k:], start=k):
@@ -1355,7 +1540,9 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                             if identity in identities:
                                 identities[identity].reset(ancestors[k])
                             else:
-                                identities[identity] = identity.get_counter(ancestors[k])
+                                identities[identity] = identity.get_counter(
+                                    ancestors[k], context.identity_limit
+                                )
 
                     prev_ancestors = ancestors[:]
 
@@ -1372,7 +1559,9 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
             try:
                 xsd_element.raw_decode(elem, validation, context)
             except XMLSchemaStopValidation:
-                pass
+                if context.max_errors_exceeded:
+                    yield from context.errors
+                    return
 
             yield from context.errors
             context.errors.clear()
@@ -1385,18 +1574,34 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
 
         if context.identities is not identities:
             for identity, counter in context.identities.items():
-                identities[identity].counter.update(counter.counter)
+                identities[identity].update(counter)
             context.identities = identities
 
         yield from self._validate_references(validation, context)
 
+    @staticmethod
+    def _resolve_ancestors(xsd_ancestors: list[XsdElement], tags: tuple[str, ...]) \
+            -> list[XsdElement]:
+        """
+        Extends a chain of XSD ancestors with the child elements matching the tags,
+        returning an empty list if a tag doesn't match, like a schema path query.
+        """
+        xsd_ancestors = xsd_ancestors.copy()
+        for tag in tags:
+            for xsd_element in xsd_ancestors[-1].iterchildren(tag):
+                if isinstance(xsd_element, XsdElement):
+                    xsd_ancestors.append(xsd_element)
+                    break
+            else:
+                return []
+        return xsd_ancestors
+
     def _validate_references(self, validation: str, context: ValidationContext) \
             -> Iterator[XMLSchemaValidationError]:
         # Check unresolved IDREF values
-        for k, v in context.id_map.items():
-            if v == 0:
-                msg = _("IDREF %r not found in XML document") % k
-                yield context.validation_error(validation, self, msg, context.source.root)
+        for k in context.id_registry.iter_unresolved():
+            msg = _("IDREF %r not found in XML document") % k
+            yield context.validation_error(validation, self, msg, context.source.root)
 
         # Check still enabled key references (lazy validation cases)
         for identity, counter in context.identities.items():
@@ -1426,7 +1631,14 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                     yield context.missing_element_error(validation, self, elem, path, schema_path)
                     continue
 
-            result = xsd_element.raw_decode(elem, validation, context)
+            try:
+                result = xsd_element.raw_decode(elem, validation, context)
+            except XMLSchemaStopValidation:
+                if not context.max_errors_exceeded:
+                    raise
+                yield from context.errors
+                return
+
             if context.errors:
                 yield from context.errors
                 context.errors.clear()
@@ -1460,6 +1672,11 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
                     value_hook: Optional[ValueHookType] = None,
                     element_hook: Optional[ElementHookType] = None,
                     errors: Optional[list[XMLSchemaValidationError]] = None,
+                    use_decode_plans: bool = False,
+                    max_errors: Optional[int] = None,
+                    aggregate_errors: Optional[int] = None,
+                    use_value_cache: bool = False,
+                    identity_limit: Optional[int] = None,
                     **kwargs: Any) -> Iterator[Union[Any, XMLSchemaValidationError]]:
         """
         Creates an iterator for decoding an XML source to a data structure.
@@ -1532,6 +1749,18 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
         instance plus optionally the XSD element and the XSD type, and returns a \
         new `ElementData` instance.
         :param errors: optional internal collector for validation errors.
+        :param use_decode_plans: if set to `True` the child elements are decoded using \
+        decode plans, callables specialized for each XSD element that skip the checks \
+        not applicable to the XSD element and to the provided options.
+        :param max_errors: an optional limit for the number of validation errors. \
+        The decoding stops cleanly at the first error that exceeds the limit, \
+        discarding the data decoded from the XML element being processed.
+        :param aggregate_errors: if provided, only the first *aggregate_errors* \
+        errors of each group of similar errors are yielded, as for :meth:`iter_errors`.
+        :param use_value_cache: if set to `True` the values of atomic types are decoded \
+        using an LRU cache of the schema, as for :meth:`validate`.
+        :param identity_limit: an optional limit for the number of values that each \
+        identity constraint or the ID registry keeps in memory, as for :meth:`validate`.
         :param kwargs: keyword arguments with other options for building converter instances.
         :return: yields a decoded data object, eventually preceded by a sequence of \
         validation or decoding errors.
@@ -1559,7 +1788,12 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
             validation_hook=validation_hook,
             value_hook=value_hook,
             element_hook=element_hook,
-            errors=errors
+            errors=errors,
+            use_decode_plans=use_decode_plans,
+            max_errors=max_errors,
+            aggregate_errors=aggregate_errors,
+            value_cache=self.maps.cache if use_value_cache else None,
+            identity_limit=identity_limit,
         )
         kwargs['converter'] = self.maps.settings.get_converter(source=resource, **kwargs)
         context = DecodeContext(source=resource, **kwargs)
@@ -1588,29 +1822,42 @@ class XMLSchemaBase(XsdValidator, ElementPathMixin[Union[SchemaType, XsdElement]
 
         yielded_errors = 0
 
-        for elem in selector:
-            xsd_element = schema.get_element(elem.tag, schema_path, namespaces)
-            if xsd_element is None:
-                if nm.XSI_TYPE in elem.attrib:
-                    xsd_element = self.builders.create_element(elem.tag, self)
-                else:
-                    yield context.missing_element_error(validation, self, elem, path, schema_path)
-                    return
-
-            result = xsd_element.raw_decode(elem, validation, context)
-
-            if errors is not context.errors:
-                yield from context.errors
-                context.errors.clear()
-            elif len(context.errors) > yielded_errors:
-                yield from context.errors[yielded_errors:]
-                yielded_errors = len(context.errors)
+        try:
+            for elem in selector:
+                xsd_element = schema.get_element(elem.tag, schema_path, namespaces)
+                if xsd_element is None:
+                    if nm.XSI_TYPE in elem.attrib:
+                        xsd_element = self.builders.create_element(elem.tag, self)
+                    else:
+                        yield context.missing_element_error(
+                            validation, self, elem, path, schema_path
+                        )
+                        return
 
-            if result is not Empty:
-                yield result
+                try:
+                    result = xsd_element.raw_decode(elem, validation, context)
+                except XMLSchemaStopValidation:
+                    if not context.max_errors_exceeded:
+                        raise
+                    result = Empty
+
+                if errors is not context.errors:
+                    yield from context.errors
+                    context.errors.clear()
+                elif len(context.errors) > yielded_errors:
+                    yield from context.errors[yielded_errors:]
+                    yielded_errors = len(context.errors)
+
+                if result is not Empty:
+                    yield result
+                if context.max_errors_exceeded:
+                    return
 
-        if context.max_depth is not None:
-            yield from self._validate_references(validation, context)
+            if context.max_depth is not None:
+                yield from self._validate_references(validation, context)
+        except XMLSchemaStopValidation:
+            if not context.max_errors_exceeded:
+                raise
 
     def decode(self, source: Union[XMLSourceType, XMLResource],
                path: Optional[str] = None,
@@ -1815,6 +2062,7 @@ class XMLSchema10(XMLSchemaBase):
     builders = XsdBuilders()
 
     META_SCHEMA = SCHEMAS_DIR.joinpath('XSD_1.0', 'XMLSchema.xsd').as_uri()
+    META_SNAPSHOT = str(SCHEMAS_DIR.joinpath('XSD_1.0', 'meta-schema.pickle'))
     BASE_SCHEMAS = {
         nm.XML_NAMESPACE: SCHEMAS_DIR.joinpath('XML', 'xml.xsd').as_uri(),
         nm.XSI_NAMESPACE: SCHEMAS_DIR.joinpath('XSI', 'XMLSchema-instance.xsd').as_uri(),
@@ -1861,6 +2109,7 @@ class XMLSchema11(XMLSchemaBase):
 
     XSD_VERSION = '1.1'
     META_SCHEMA = SCHEMAS_DIR.joinpath('XSD_1.1', 'XMLSchema.xsd').as_uri()
+    META_SNAPSHOT = str(SCHEMAS_DIR.joinpath('XSD_1.1', 'meta-schema.pickle'))
     BASE_SCHEMAS = {
         nm.XML_NAMESPACE: SCHEMAS_DIR.joinpath('XML', 'xml.xsd').as_uri(),
         nm.XSI_NAMESPACE: SCHEMAS_DIR.joinpath('XSI', 'XMLSchema-instance.xsd').as_uri(),
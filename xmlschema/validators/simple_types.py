@@ -11,6 +11,8 @@
 This module contains classes for XML Schema simple data types.
 """
 import re
+import math
+import operator
 from collections.abc import Callable, Iterator
 from decimal import DecimalException, Decimal
 from functools import cached_property
@@ -26,19 +28,30 @@ from xmlschema.aliases import ElementType, AtomicValueType, ComponentClassType,
 from xmlschema.exceptions import XMLSchemaTypeError, XMLSchemaValueError
 from xmlschema.translation import gettext as _
 from xmlschema.utils.qnames import local_name, get_extended_qname
-from xmlschema.utils.decoding import raw_encode_value
-from xmlschema.caching import schema_cache
+from xmlschema.utils.decoding import raw_encode_value, Empty, EmptyType
+from xmlschema.caching import schema_cache, register_cached_function
 
 from .exceptions import XMLSchemaValidationError, XMLSchemaParseError, \
     XMLSchemaCircularityError, XMLSchemaDecodeError, XMLSchemaEncodeError
 from .validation import ValidationContext, EncodeContext, ValidationMixin, DecodeContext
 from .xsdbase import XsdComponent, XsdType
 from .facets import XsdFacet, XsdWhiteSpaceFacet, XsdPatternFacets, \
-    XsdEnumerationFacets, XsdAssertionFacet, MULTIPLE_FACETS
+    XsdEnumerationFacets, XsdAssertionFacet, XsdMinInclusiveFacet, \
+    XsdMinExclusiveFacet, XsdMaxInclusiveFacet, XsdMaxExclusiveFacet, \
+    XsdTotalDigitsFacet, XsdFractionDigitsFacet, MULTIPLE_FACETS
+from .helpers import decimal_validator, get_lexical_checker, count_lexical_digits
 
 FacetsValueType = Union[XsdFacet, Callable[[Any], None], list[XsdAssertionFacet]]
 PythonTypeClasses = Union[type[Any], tuple[type[Any]]]
 
+# Comparisons of the lexical forms of date/time values for range facets
+LEXICAL_BOUND_OPERATORS: dict[type[XsdFacet], Callable[[str, str], bool]] = {
+    XsdMinInclusiveFacet: operator.ge,
+    XsdMinExclusiveFacet: operator.gt,
+    XsdMaxInclusiveFacet: operator.le,
+    XsdMaxExclusiveFacet: operator.lt,
+}
+
 
 class XsdSimpleType(XsdType, ValidationMixin[str | bytes, DecodedValueType]):
     """
@@ -409,6 +422,21 @@ class XsdSimpleType(XsdType, ValidationMixin[str | bytes, DecodedValueType]):
     def is_element_only(self) -> bool:
         return False
 
+    def is_value_cacheable(self) -> bool:
+        """
+        Returns `True` if the decoded values depend only on the text and their
+        decoding has no side effects on the context, so they can be cached.
+        """
+        return False
+
+    def get_lexical_checker(self) -> Callable[[str], bool] | None:
+        """
+        Returns a function that checks a normalized text without decoding it, `None`
+        if the type has no lexical checker. The function returns `True` if the text is valid,
+        `False` if the text has to be decoded to be validated.
+        """
+        return None
+
     @schema_cache
     def is_derived(self, other: BaseXsdType, derivation: str | None = None) -> bool:
         if derivation:
@@ -469,6 +497,16 @@ class XsdSimpleType(XsdType, ValidationMixin[str | bytes, DecodedValueType]):
             return self.raw_decode(text, validation, self.schema.validation_context)
         return self.raw_decode(text, validation, context)
 
+    def lexical_decode(self, obj: str | bytes, validation: str,
+                       context: ValidationContext) -> DecodedValueType:
+        """
+        Decodes like `raw_decode()`, but skips building the datatype value if the text
+        is checked as valid by the lexical checker of the type. Date/time and duration
+        values are returned as normalized texts and decimal values as floats, for
+        contexts where these values are not requested as datatype instances.
+        """
+        return self.raw_decode(obj, validation, context)
+
     def text_is_valid(self, text: str, context: ValidationContext | None = None) -> bool:
         if context is None:
             self.schema.validation_context.clear()
@@ -596,6 +634,20 @@ class XsdAtomic(XsdSimpleType):
     def is_datetime(self) -> bool:
         return issubclass(self.primitive_type.python_type, AbstractDateTime)
 
+    def lexical_decode(self, obj: str | bytes, validation: str,
+                       context: ValidationContext) -> DecodedValueType:
+        if isinstance(obj, str) and (lexical_checker := self.get_lexical_checker()) is not None:
+            if self.primitive_type.name == nm.XSD_DECIMAL:
+                if context.float_decimals:
+                    text = self.normalize(obj)
+                    if lexical_checker(text) and not math.isinf(value := float(text)):
+                        return value
+            elif context.lexical_datetimes:
+                text = self.normalize(obj)
+                if lexical_checker(text):
+                    return text
+        return self.raw_decode(obj, validation, context)
+
     def get_facet(self, tag: str) -> FacetsValueType | None:
         facet = self.facets.get(tag)
         if facet is not None:
@@ -635,6 +687,25 @@ class XsdAtomic(XsdSimpleType):
     def is_primitive(self) -> bool:
         return self.base_type is None
 
+    @schema_cache
+    def is_value_cacheable(self) -> bool:
+        return not self.is_list() and not self.is_union() and not self.is_key() \
+            and not self.is_qname() and not self.is_notation() \
+            and not self.is_derived(self.maps.types[nm.XSD_IDREF])
+
+
+@register_cached_function(maxsize=4096)
+def decode_text(xsd_type: XsdAtomic, text: str) -> DecodedValueType | EmptyType:
+    """
+    Decodes a text with an atomic type, for caching the decoded values in the
+    cache of the global maps. Returns `Empty` if the text is not valid, in which
+    case the decoding has to be repeated with the validation context.
+    """
+    try:
+        return xsd_type.raw_decode(text, 'strict', xsd_type.schema.validation_context)
+    except XMLSchemaValidationError:
+        return Empty
+
 
 class XsdAtomicBuiltin(XsdAtomic):
     """
@@ -648,7 +719,7 @@ class XsdAtomicBuiltin(XsdAtomic):
       - from_python(value): Encoding to XML
     """
     __slots__ = ('datatype', 'instance_types', 'python_type', 'to_python', 'from_python',
-                 'post_decode', '_admitted_facets')
+                 'post_decode', '_admitted_facets', '_lexical_checker')
 
     def __init__(self, elem: ElementType,
                  schema: SchemaType,
@@ -694,6 +765,12 @@ class XsdAtomicBuiltin(XsdAtomic):
         self.from_python = from_python if from_python is not None else str
 
         self.post_decode = name in (nm.XSD_QNAME, nm.XSD_NOTATION, nm.XSD_ID, nm.XSD_IDREF)
+        if self.patterns is None and all(v is decimal_validator for v in self.validators):
+            # Decimal values that match the lexical form are not NaN or INF,
+            # but their float conversion overflows to INF if out of range.
+            self._lexical_checker = get_lexical_checker(name)
+        else:
+            self._lexical_checker = None
 
     def __repr__(self) -> str:
         return '%s(name=%r)' % (self.__class__.__name__, self.prefixed_name)
@@ -702,8 +779,19 @@ class XsdAtomicBuiltin(XsdAtomic):
     def admitted_facets(self) -> frozenset[str]:
         return self._admitted_facets or self.primitive_type.admitted_facets
 
+    def is_value_cacheable(self) -> bool:
+        return not self.post_decode
+
+    def get_lexical_checker(self) -> Callable[[str], bool] | None:
+        return self._lexical_checker
+
     def raw_decode(self, obj: str | bytes, validation: str,
                    context: ValidationContext) -> DecodedValueType:
+        if context.value_cache is not None and isinstance(obj, str) and not self.post_decode:
+            value = context.value_cache(decode_text, self, obj)
+            if not isinstance(value, EmptyType):
+                return value
+
         if isinstance(obj, (str, bytes)):
             obj = self.normalize(obj)
         elif not isinstance(obj, self.instance_types):
@@ -761,17 +849,13 @@ class XsdAtomicBuiltin(XsdAtomic):
             elif not context.check_identities:
                 pass  # context created from a component
             elif self.name == nm.XSD_IDREF:
-                if obj not in context.id_map:
-                    context.id_map[obj] = 0
+                context.id_registry.add_ref(obj)
             elif context.level:
                 if context.id_list is None:
-                    if not context.id_map[obj]:
-                        context.id_map[obj] = 1
-                    else:
+                    if not context.id_registry.add_id(obj):
                         reason = _("duplicated xs:ID value {!r}").format(obj)
                         context.validation_error(validation, self, reason, obj)
-                elif not context.id_map[obj]:
-                    context.id_map[obj] = 1
+                elif context.id_registry.add_id(obj):
                     context.id_list.append(obj)
                     if len(context.id_list) > 1 and self.xsd_version == '1.0':
                         reason = _("no more than one attribute of type ID should "
@@ -1448,6 +1532,11 @@ class XsdAtomicRestriction(XsdAtomic):
 
     def raw_decode(self, obj: str | bytes, validation: str,
                    context: ValidationContext) -> DecodedValueType:
+        if context.value_cache is not None and isinstance(obj, str) \
+                and self.is_value_cacheable():
+            value = context.value_cache(decode_text, self, obj)
+            if not isinstance(value, EmptyType):
+                return value
 
         if isinstance(obj, (str, bytes)):
             obj = self.normalize(obj)
@@ -1482,6 +1571,102 @@ class XsdAtomicRestriction(XsdAtomic):
 
         return result
 
+    @schema_cache
+    def get_lexical_checker(self) -> Callable[[str], bool] | None:
+        if not isinstance(self.base_type, XsdAtomic) \
+                or (base_checker := self.base_type.get_lexical_checker()) is None:
+            return None
+        elif self.primitive_type.name == nm.XSD_DECIMAL:
+            return self._get_decimal_checker(base_checker)
+
+        # Range facets are checked comparing the texts with the bounds, that is
+        # possible only for date/time values with the same length and timezone.
+        bounds = []
+        for validator in self.validators:
+            if not isinstance(validator, XsdFacet) or \
+                    (compare := LEXICAL_BOUND_OPERATORS.get(type(validator))) is None:
+                return None
+
+            bound = validator.elem.attrib['value'].strip()
+            if '.' in bound or not base_checker(bound) or \
+                    self.primitive_type.name == nm.XSD_DURATION:
+                return None
+            elif bound.endswith('Z'):
+                bounds.append((compare, bound, 'Z'))
+            elif bound[-6:-5] in ('+', '-') and bound[-3:-2] == ':':
+                bounds.append((compare, bound, bound[-6:]))
+            else:
+                bounds.append((compare, bound, ''))
+
+        patterns = self.patterns
+
+        def check_lexical(text: str) -> bool:
+            if not base_checker(text):
+                return False
+            elif patterns is not None:
+                try:
+                    patterns(text)
+                except XMLSchemaValidationError:
+                    return False
+
+            for compare, bound, tz in bounds:
+                if len(text) != len(bound) or not text.endswith(tz) \
+                        or not compare(text, bound):
+                    return False
+            return True
+
+        return check_lexical
+
+    def _get_decimal_checker(self, base_checker: Callable[[str], bool]) \
+            -> Callable[[str], bool] | None:
+        # Range facets are checked comparing floats, that is exact if the values
+        # differ. Texts with the same float value of a bound have to be decoded.
+        min_values: list[float] = []
+        max_values: list[float] = []
+        total_digits = fraction_digits = None
+        for validator in self.validators:
+            try:
+                if isinstance(validator, (XsdMinInclusiveFacet, XsdMinExclusiveFacet)):
+                    min_values.append(float(cast(Decimal, validator.value)))
+                elif isinstance(validator, (XsdMaxInclusiveFacet, XsdMaxExclusiveFacet)):
+                    max_values.append(float(cast(Decimal, validator.value)))
+                elif isinstance(validator, XsdTotalDigitsFacet):
+                    total_digits = validator.value
+                elif isinstance(validator, XsdFractionDigitsFacet):
+                    fraction_digits = validator.value
+                else:
+                    return None
+            except (TypeError, ValueError):
+                return None
+
+        check_range = bool(min_values or max_values)
+        min_value = max(min_values, default=-math.inf)
+        max_value = min(max_values, default=math.inf)
+        patterns = self.patterns
+
+        def check_decimal(text: str) -> bool:
+            if not base_checker(text):
+                return False
+            elif patterns is not None:
+                try:
+                    patterns(text)
+                except XMLSchemaValidationError:
+                    return False
+
+            if check_range:
+                value = float(text)
+                if math.isinf(value) or not min_value < value < max_value:
+                    return False
+            if total_digits is not None or fraction_digits is not None:
+                digits = count_lexical_digits(text)
+                if total_digits is not None and sum(digits) > total_digits:
+                    return False
+                elif fraction_digits is not None and digits[1] > fraction_digits:
+                    return False
+            return True
+
+        return check_decimal
+
     def raw_encode(self, obj: Any, validation: str, context: EncodeContext) -> str | None:
         base_type: XsdSimpleType
         if isinstance(self.base_type, XsdSimpleType):
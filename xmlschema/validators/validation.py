@@ -11,10 +11,9 @@ import copy
 import decimal
 import logging
 from abc import abstractmethod, ABCMeta
-from collections import Counter
 from collections.abc import Iterable, Iterator, MutableSequence
 from functools import partial
-from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar, Union
+from typing import Any, cast, Generic, Optional, TYPE_CHECKING, TypeVar, Union
 from xml.etree.ElementTree import Element
 
 from elementpath.datatypes import AbstractDateTime, Duration, AbstractBinary
@@ -26,21 +25,24 @@ from xmlschema.aliases import DecodeType, DepthFillerType, ElementType, \
     GlobalMapsType
 from xmlschema.exceptions import XMLSchemaTypeError
 from xmlschema.translation import gettext as _
-from xmlschema.utils.decoding import EmptyType, raw_encode_value
+from xmlschema.utils.decoding import Empty, EmptyType
 from xmlschema.utils.etree import is_etree_element, is_etree_document
 from xmlschema.utils.logger import format_xmlschema_stack
 from xmlschema.utils.misc import iter_class_slots
-from xmlschema.utils.qnames import get_prefixed_qname
+from xmlschema.utils.counters import IdRegistry
 from xmlschema.namespaces import NamespaceMapper
 from xmlschema.converters import XMLSchemaConverter
 from xmlschema.resources import XMLResource
-from xmlschema.arguments import Arguments, BooleanOption, NonNegIntOption, \
-    validate_type, Argument, MaxDepthOption, ExtraValidatorOption, \
+from xmlschema.caching import SchemaCache
+from xmlschema.arguments import Arguments, Option, BooleanOption, NonNegIntOption, \
+    validate_type, Argument, MaxDepthOption, MaxErrorsOption, ExtraValidatorOption, \
     ValidationHookOption, FillerOption, ElementHookOption, DepthFillerOption, \
-    ValueHookOption, DecimalTypeOption, ElementTypeOption
+    ValueHookOption, DecimalTypeOption, ElementTypeOption, AggregateErrorsOption, \
+    IdentityLimitOption
 
-from .exceptions import XMLSchemaValidationError, \
-    XMLSchemaChildrenValidationError, XMLSchemaDecodeError, XMLSchemaEncodeError
+from .exceptions import XMLSchemaValidationError, XMLSchemaValidationFailure, \
+    XMLSchemaChildrenValidationError, XMLSchemaDecodeError, XMLSchemaEncodeError, \
+    XMLSchemaStopValidation
 
 if TYPE_CHECKING:
     from .xsdbase import XsdValidator  # noqa: F401
@@ -49,6 +51,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('xmlschema')
 
+# Context flags for selecting the decode plans of XSD elements
+PLAN_DECODING = 1
+PLAN_HOOKS = 2
+PLAN_LEXICAL = 4
+
 
 ###
 # Arguments for validation contexts
@@ -78,18 +85,26 @@ class ErrorsArgument(Argument[list['XMLSchemaValidationError']]):
     _validators = partial(validate_type, types=list),
 
 
+class ValueCacheOption(Option[Optional[SchemaCache]]):
+    _validators = partial(validate_type, types=SchemaCache, none=True),
+
+
 class ValidationArguments(Arguments):
     source = ValidationSourceArgument()
     converter = NamespaceMapperArgument()
     errors = ErrorsArgument()
     level = NonNegIntOption(default=0)
     max_depth = MaxDepthOption(default=None)
+    max_errors = MaxErrorsOption(default=None)
+    aggregate_errors = AggregateErrorsOption(default=None)
     extra_validator = ExtraValidatorOption(default=None)
     validation_hook = ValidationHookOption(default=None)
+    value_cache = ValueCacheOption(default=None)
+    identity_limit = IdentityLimitOption(default=None)
 
     use_defaults = BooleanOption(default=True)
     check_identities = preserve_mixed = process_skipped = \
-        use_location_hints = BooleanOption(default=False)
+        use_location_hints = use_decode_plans = fail_fast = BooleanOption(default=False)
 
 
 class DecodeArguments(ValidationArguments):
@@ -125,10 +140,12 @@ class ValidationContext:
 
     __slots__ = ('source', 'converter', 'namespaces', 'errors', 'level',
                  'validation_only', 'check_identities', 'use_defaults',
-                 'preserve_mixed', 'process_skipped', 'max_depth',
-                 'extra_validator', 'validation_hook', 'use_location_hints',
-                 'inherited', 'id_map', 'identities', 'id_list', 'elem',
-                 'attribute', 'patterns')
+                 'preserve_mixed', 'process_skipped', 'max_depth', 'max_errors',
+                 'aggregate_errors', 'error_groups', 'extra_validator', 'validation_hook',
+                 'use_location_hints', 'use_decode_plans', 'plan_flags', 'value_cache',
+                 'identity_limit', 'fail_fast', 'inherited', 'id_registry', 'identities',
+                 'id_list', 'elem', 'attribute', 'patterns', 'errors_count',
+                 'lexical_datetimes', 'float_decimals')
 
     def __init__(self,
                  source: Union[XMLResource, Any],
@@ -143,6 +160,12 @@ class ValidationContext:
                  extra_validator: Optional[ExtraValidatorType] = None,
                  validation_hook: Optional[ValidationHookType] = None,
                  use_location_hints: bool = False,
+                 use_decode_plans: bool = False,
+                 value_cache: Optional[SchemaCache] = None,
+                 identity_limit: Optional[int] = None,
+                 fail_fast: bool = False,
+                 max_errors: Optional[int] = None,
+                 aggregate_errors: Optional[int] = None,
                  **kwargs: Any) -> None:
 
         self.source = source
@@ -162,19 +185,29 @@ class ValidationContext:
         self.extra_validator = extra_validator
         self.validation_hook = validation_hook
         self.use_location_hints = use_location_hints
-
-        self.id_map: Counter[str] = Counter()
+        self.use_decode_plans = use_decode_plans
+        self.value_cache = value_cache
+        self.identity_limit = identity_limit
+        self.fail_fast = fail_fast
+        self.max_errors = max_errors
+        self.aggregate_errors = aggregate_errors
+
+        self.id_registry = IdRegistry(identity_limit)
         self.identities: dict['XsdIdentity', 'IdentityCounter'] = {}
         self.inherited: dict[str, str] = {}
+        self.error_groups: dict[tuple[Any, ...], XMLSchemaValidationError] = {}
 
         # Local validation status
+        self.errors_count = 0
         self.id_list: Optional[list[Any]] = None
         self.elem: Optional[ElementType] = None
         self.attribute: Optional[str] = None
         self.patterns: Optional['XsdPatternFacets'] = None
 
         self.validation_only = self.__class__ is ValidationContext
+        self.lexical_datetimes = self.float_decimals = self.validation_only
         self._arguments.validate(self)
+        self.plan_flags = self.get_plan_flags() if use_decode_plans else None
 
     def __copy__(self) -> 'ValidationContext':
         context = object.__new__(self.__class__)
@@ -182,7 +215,6 @@ class ValidationContext:
             setattr(context, attr, getattr(self, attr))
 
         context.errors = self.errors.copy()
-        context.id_map = self.id_map.copy()
         context.identities = self.identities.copy()
         context.inherited = self.inherited.copy()
         context.id_list = self.id_list if self.id_list is None else self.id_list.copy()
@@ -197,15 +229,32 @@ class ValidationContext:
 
     def clear(self) -> None:
         self.errors.clear()
-        self.id_map.clear()
+        self.id_registry.clear()
         self.identities.clear()
         self.inherited.clear()
+        self.error_groups.clear()
         self.level = 0
+        self.errors_count = 0
         self.elem = None
         self.attribute = None
         self.id_list = None
         self.patterns = None
 
+    def get_plan_flags(self) -> int:
+        """
+        Returns the flags that select the decode plans of XSD elements
+        to use with the context.
+        """
+        if self.validation_hook is not None or self.extra_validator is not None \
+                or self.use_location_hints:
+            return PLAN_HOOKS
+        return PLAN_LEXICAL if self.validation_only else 0
+
+    @property
+    def max_errors_exceeded(self) -> bool:
+        """`True` if the validation has been stopped by the *max_errors* limit."""
+        return self.max_errors is not None and self.errors_count > self.max_errors
+
     @property
     def root_namespace(self) -> Optional[str]:
         if not isinstance(self.source, XMLResource):
@@ -218,11 +267,8 @@ class ValidationContext:
         if error.elem is None and self.elem is not None:
             error.elem = self.elem
 
-        if self.attribute is not None and error.reason is not None \
-                and not error.reason.startswith('attribute '):
-            name = get_prefixed_qname(self.attribute, self.namespaces)
-            value = raw_encode_value(error.obj)
-            error.reason = _('attribute {0}={1!r}: {2}').format(name, value, error.reason)
+        if self.attribute is not None and error.attribute is None:
+            error.set_attribute(self.attribute, self.namespaces)
 
         if validation == 'strict':
             raise error
@@ -232,9 +278,40 @@ class ValidationContext:
             logger.debug("Collect %r with traceback:\n%s", error, error.stack_trace)
 
         if validation == 'lax':
+            if self.aggregate_errors is not None and not self.aggregate_error(error):
+                return error
+            if self.max_errors is not None:
+                # Stop at the first error that exceeds the limit, so a truncated
+                # collection always means that the XML data has other errors.
+                self.errors_count += 1
+                if self.errors_count > self.max_errors:
+                    raise XMLSchemaStopValidation()
             self.errors.append(error)
         return error
 
+    def aggregate_error(self, error: XMLSchemaValidationError) -> bool:
+        """
+        Adds an error to its group of similar errors, identified by the error class,
+        the XSD validator, the model particle or the attribute and the XML element tag.
+        The first error of a group keeps the count of its occurrences. Returns `True`
+        if the error is within the first *aggregate_errors* errors of its group.
+        """
+        key = (
+            error.__class__,
+            id(error.validator),
+            id(getattr(error, 'particle', None)),
+            error.attribute,
+            None if self.elem is None else self.elem.tag,
+        )
+        try:
+            first_error = self.error_groups[key]
+        except KeyError:
+            self.error_groups[key] = error
+            return True
+        else:
+            first_error.occurrences += 1
+            return first_error.occurrences <= cast(int, self.aggregate_errors)
+
     def validation_error(self,
                          validation: str,
                          validator: 'XsdValidator',
@@ -248,6 +325,9 @@ class ValidationContext:
         :param error: an error instance or the detailed reason of failed validation.
         :param obj: the instance related to the error.
         """
+        if self.fail_fast and validation == 'lax':
+            raise XMLSchemaValidationFailure()
+
         if not isinstance(error, XMLSchemaValidationError):
             error = XMLSchemaValidationError(
                 validator, obj, str(error), self.source, self.namespaces
@@ -267,6 +347,9 @@ class ValidationContext:
             expected: Optional[Iterable[SchemaElementType]] = None) \
             -> XMLSchemaValidationError:
 
+        if self.fail_fast and validation == 'lax':
+            raise XMLSchemaValidationFailure()
+
         error = XMLSchemaChildrenValidationError(
             validator=validator,
             elem=elem,
@@ -284,6 +367,9 @@ class ValidationContext:
                               elem: ElementType,
                               path: Optional[str] = None,
                               schema_path: Optional[str] = None) -> XMLSchemaValidationError:
+        if self.fail_fast and validation == 'lax':
+            raise XMLSchemaValidationFailure()
+
         if not path:
             reason = _("{!r} is not an element of the schema").format(elem.tag)
         elif schema_path != path:
@@ -307,6 +393,9 @@ class ValidationContext:
                      decoder: Any,
                      error: Union[str, Exception]) -> XMLSchemaValidationError:
 
+        if self.fail_fast and validation == 'lax':
+            raise XMLSchemaValidationFailure()
+
         error = XMLSchemaDecodeError(
             validator=validator,
             obj=obj,
@@ -370,6 +459,19 @@ class DecodeContext(ValidationContext):
 
         super().__init__(source, converter, **kwargs)
 
+        # Date/time, duration and decimal values are checked on their lexical
+        # forms if the decoded values are returned as strings or as floats.
+        self.lexical_datetimes = not datetime_types and value_hook is None
+        self.float_decimals = decimal_type is float and value_hook is None
+
+    def get_plan_flags(self) -> int:
+        flags = super().get_plan_flags() | PLAN_DECODING
+        if self.value_hook is not None or self.element_hook is not None:
+            flags |= PLAN_HOOKS
+        elif not self.datetime_types or self.decimal_type is float:
+            flags |= PLAN_LEXICAL
+        return flags
+
 
 class EncodeContext(ValidationContext):
     """A context for handling validated encoding processes."""
@@ -520,10 +622,24 @@ class ValidationMixin(Generic[ST, DT], metaclass=ABCMeta):
         """
         Like :meth:`validate` except that does not raise an exception but returns
         ``True`` if the XML data instance is valid, ``False`` if it is invalid.
+        The validation stops at the first error, without building error instances.
         """
-        error = next(self.iter_errors(obj, use_defaults, namespaces, max_depth,
-                                      extra_validator, validation_hook), None)
-        return error is None
+        tag = getattr(self, 'tag', None)
+        source = self.maps.settings.get_resource_from_data(obj, tag)
+        context = ValidationContext(
+            source=source,
+            converter=NamespaceMapper(namespaces, source=source),
+            use_defaults=use_defaults,
+            fail_fast=True,
+            max_depth=max_depth,
+            extra_validator=extra_validator,
+            validation_hook=validation_hook,
+        )
+        try:
+            self.raw_decode(obj, 'lax', context)
+        except XMLSchemaValidationFailure:
+            return False
+        return not context.errors
 
     def iter_errors(self, obj: ST,
                     use_defaults: bool = True,
@@ -572,7 +688,12 @@ class ValidationMixin(Generic[ST, DT], metaclass=ABCMeta):
         kwargs['converter'] = self.maps.settings.get_converter(**kwargs)
         context = DecodeContext(**kwargs)
 
-        result = self.raw_decode(obj, validation, context)
+        try:
+            result = self.raw_decode(obj, validation, context)
+        except XMLSchemaStopValidation:
+            if not context.max_errors_exceeded:
+                raise
+            result = Empty
         if isinstance(result, EmptyType):
             return (None, context.errors) if validation == 'lax' else None
         return (result, context.errors) if validation == 'lax' else result
@@ -616,7 +737,12 @@ class ValidationMixin(Generic[ST, DT], metaclass=ABCMeta):
         kwargs['converter'] = self.maps.settings.get_converter(**kwargs)
         context = DecodeContext(**kwargs)
 
-        result = self.raw_decode(obj, validation, context)
+        try:
+            result = self.raw_decode(obj, validation, context)
+        except XMLSchemaStopValidation:
+            if not context.max_errors_exceeded:
+                raise
+            result = Empty
         yield from context.errors
         context.errors.clear()
         if not isinstance(result, EmptyType):
@@ -25,7 +25,7 @@ from xmlschema.exceptions import XMLSchemaAttributeError, XMLSchemaTypeError, \
     XMLSchemaValueError, XMLSchemaWarning, XMLSchemaNamespaceError, XMLSchemaException
 from xmlschema.translation import gettext as _
 from xmlschema.utils.misc import deprecated
-from xmlschema.utils.qnames import get_extended_qname
+from xmlschema.utils.qnames import get_extended_qname, get_namespace
 from xmlschema.utils.urls import get_url, normalize_url
 from xmlschema.locations import NamespaceResourcesMap
 from xmlschema.resources import XMLResource
@@ -35,7 +35,7 @@ from xmlschema.settings import SchemaSettings
 from .exceptions import XMLSchemaValidatorError, XMLSchemaModelError, \
     XMLSchemaModelDepthError, XMLSchemaParseError
 from .xsdbase import XsdValidator, XsdComponent
-from .models import check_model
+from .models import check_model, check_model_automaton
 from . import XsdAttribute, XsdSimpleType, XsdComplexType, XsdElement, \
     XsdGroup, XsdIdentity, XsdUnion, XsdAtomicRestriction, \
     XsdAtomic, XsdAtomicBuiltin, XsdNotation, XsdAttributeGroup
@@ -126,18 +126,18 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
         self.validator = validator
         self.namespaces = NamespaceResourcesMap()  # Registered schemas by namespace URI
 
-        self.global_maps = GlobalMaps.from_builders(validator.builders)
+        if isinstance(settings, SchemaSettings):
+            self.settings = settings
+        else:
+            self.settings = SchemaSettings(**kwargs)
+
+        self.global_maps = GlobalMaps.from_builders(validator.builders, self.settings.lazy_build)
         (self.types, self.notations, self.attributes,
          self.attribute_groups, self.elements, self.groups) = self.global_maps
 
         self.substitution_groups = {}
         self.identities = {}
 
-        if isinstance(settings, SchemaSettings):
-            self.settings = settings
-        else:
-            self.settings = SchemaSettings(**kwargs)
-
         if self.settings.use_xpath3:
             module = importlib.import_module('xmlschema.xpath.xpath3')
             self.xpath_parser_class = module.XPath3Parser
@@ -150,7 +150,7 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
             self._schemas.update(ancestor.maps.schemas)
             self.namespaces.update(ancestor.maps.namespaces)
 
-            ancestor.maps.build()
+            ancestor.maps.build_all()
             self.global_maps.update(ancestor.maps.global_maps)
             self.substitution_groups.update(ancestor.maps.substitution_groups)
             self.identities.update(ancestor.maps.identities)
@@ -318,11 +318,16 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
     def built(self) -> bool:
         return self._built
 
+    @property
+    def lazy_build(self) -> bool:
+        """`True` if the global components are built on demand."""
+        return self.global_maps.lazy
+
     @cached_property
     def validation_attempted(self) -> str:
         if not any(m for m in self.global_maps):
             return 'none'
-        elif not self._built or any(m.total_staged for m in self.global_maps):
+        elif not self._built or self.global_maps.total_staged:
             return 'partial'
         else:
             return 'full'
@@ -334,7 +339,7 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
         elif any(s.errors for s in self._schemas) or \
                 any(c.errors for c in self.iter_components()):
             return 'invalid'
-        elif not self._built or any(m.total_staged for m in self.global_maps):
+        elif not self._built or self.global_maps.total_staged:
             return 'notKnown'
         else:
             return 'valid'
@@ -379,6 +384,7 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
 
     def create_bindings(self, *bases: type[Any], **attrs: Any) -> None:
         """Creates data object bindings for the XSD elements of built schemas."""
+        self.build_all()
         for xsd_element in self.iter_components(xsd_classes=XsdElement):
             assert isinstance(xsd_element, XsdElement)
             if xsd_element.target_namespace != nm.XSD_NAMESPACE:
@@ -534,6 +540,155 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
 
         self._built = False
 
+    def reload(self, url: str) -> None:
+        """
+        Reloads a schema source and rebuilds incrementally the global maps. Only the
+        globals of the namespace of the reloaded source, and of the namespaces that
+        import it, are discarded and rebuilt, keeping the other global components.
+        Schemas included or imported only by the previous version of the source are
+        not unregistered. The source of the main validator can't be reloaded.
+
+        :param url: the URL or the file path of a schema source owned by the instance.
+        """
+        url = normalize_url(url)
+        for old_schema in self.owned_schemas:
+            if old_schema.url == url:
+                break
+        else:
+            msg = _("no schema loaded from {!r} is owned by {!r}")
+            raise XMLSchemaValueError(msg.format(url, self))
+
+        if old_schema is self.validator:
+            msg = _("can't reload the source of the main validator {!r}")
+            raise XMLSchemaValueError(msg.format(old_schema))
+
+        with self._build_lock:
+            built = self._built
+            schemas = self._schemas.copy()
+            namespaces = self.namespaces.copy()
+            global_maps = self.global_maps.copy()
+            substitution_groups = {k: v.copy() for k, v in self.substitution_groups.items()}
+            identities = self.identities.copy()
+            # The sets of substitutes are shared with element references
+            substitutes = [
+                (e.substitutes, e.substitutes.copy()) for e in self.global_maps.iter_globals()
+                if isinstance(e, XsdElement) and e.schema.maps is self
+                and isinstance(e.substitutes, set)
+            ]
+            default_attributes = [(s, s.__dict__['default_attributes'])
+                                  for s in self.owned_schemas
+                                  if 'default_attributes' in s.__dict__]
+
+            namespace = old_schema.target_namespace
+            index = self.namespaces[namespace].index(old_schema)
+            self._schemas.remove(old_schema)
+            self.namespaces[namespace].remove(old_schema)
+
+            # Redefinitions and overrides are set again by the new schema
+            redefined = [(s, attr) for s in self.owned_schemas
+                         for attr in ('redefine', 'override')
+                         if s.__dict__.get(attr) is old_schema]
+            for s, attr in redefined:
+                del s.__dict__[attr]
+
+            references = [(schemas_map, k) for other in self.owned_schemas
+                          for schemas_map in (other.includes, other.imports)
+                          for k, v in schemas_map.items() if v is old_schema]
+
+            try:
+                schema = self.loader.schema_class(
+                    source=url,
+                    namespace=namespace,
+                    validation=self.validation,
+                    global_maps=self,
+                    build=False,
+                )
+
+                # Keep the registration order, that is relevant for redefinitions
+                self.namespaces[namespace].remove(schema)
+                self.namespaces[namespace].insert(index, schema)
+
+                if old_schema.redefine is not None:
+                    schema.redefine = old_schema.redefine
+                if old_schema.override is not None:
+                    schema.override = old_schema.override
+
+                for schemas_map, k in references:
+                    schemas_map[k] = schema
+
+                self._rebuild_namespaces(schemas)
+            except Exception:
+                # Restore the status before the reload
+                self._schemas.clear()
+                self._schemas.update(schemas)
+                self.namespaces.clear()
+                self.namespaces.update(namespaces)
+                self.global_maps.restore(global_maps)
+                self.substitution_groups.clear()
+                self.substitution_groups.update(substitution_groups)
+                self.identities.clear()
+                self.identities.update(identities)
+
+                for current_substitutes, xsd_substitutes in substitutes:
+                    current_substitutes.clear()
+                    current_substitutes.update(xsd_substitutes)
+                for s, value in default_attributes:
+                    s.__dict__['default_attributes'] = value
+                for s, attr in redefined:
+                    s.__dict__[attr] = old_schema
+                for schemas_map, k in references:
+                    schemas_map[k] = old_schema
+
+                self.cache.clear()
+                self._built = built
+                for s in self.owned_schemas:
+                    s.clear()
+                raise
+
+    def _rebuild_namespaces(self, schemas: set[SchemaType]) -> None:
+        """
+        Rebuilds the globals of the namespaces of the schemas registered after the
+        provided set of schemas, and of the namespaces that import them.
+        """
+        affected = {s.target_namespace for s in self._schemas if s not in schemas}
+        while dependents := {
+            s.target_namespace for s in self.owned_schemas
+            if s.target_namespace not in affected
+            and any(ns in affected for ns in s.imported_namespaces)
+        }:
+            affected.update(dependents)
+
+        self.global_maps.clear_namespaces(affected)
+        for name in [k for k in self.identities if get_namespace(k) in affected]:
+            del self.identities[name]
+        for name in [k for k in self.substitution_groups if get_namespace(k) in affected]:
+            del self.substitution_groups[name]
+        for xsd_elements in self.substitution_groups.values():
+            xsd_elements.difference_update(
+                [e for e in xsd_elements if get_namespace(e.name) in affected]
+            )
+
+        for xsd_global in self.global_maps.iter_globals():
+            if isinstance(xsd_global, XsdElement) and xsd_global.schema.maps is self \
+                    and isinstance(xsd_global.substitutes, set):
+                xsd_global.substitutes.difference_update(
+                    [x for x in xsd_global.substitutes if get_namespace(x) in affected]
+                )
+
+        affected_schemas = [s for ns, ns_schemas in self.namespaces.items()
+                            if ns in affected for s in ns_schemas if s.maps is self]
+        for s in affected_schemas:
+            if isinstance(s.default_attributes, XsdAttributeGroup):
+                # Restore the reference to be resolved by the build
+                s.__dict__['default_attributes'] = s.default_attributes.name
+
+        self.cache.clear()
+        self._built = False
+
+        self.global_maps.load(affected_schemas)
+        self.global_maps.build(affected_schemas)
+        self._complete_build(affected_schemas)
+
     def build(self) -> None:
         """
         Build the maps of XSD global definitions/declarations. The global maps are
@@ -550,7 +705,7 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
             self.clear()
 
             for ancestor in self.iter_ancestors():
-                ancestor.maps.build()
+                ancestor.maps.build_all()
                 self.global_maps.update(ancestor.maps.global_maps)
                 self.substitution_groups.update(ancestor.maps.substitution_groups)
                 self.identities.update(ancestor.maps.identities)
@@ -562,20 +717,41 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
             self.global_maps.load(schemas)
             self.types.build_builtins(self.validator)
             self.global_maps.build(schemas)
+            self._complete_build(schemas)
 
-            # Update substitutes of global elements
-            for name in self.substitution_groups:
-                xsd_element = self.elements[name]
-                assert not isinstance(xsd_element.substitutes, tuple)
-                xsd_element.substitutes.update(e.name for e in xsd_element.iter_substitutes())
+    def build_all(self) -> None:
+        """
+        Builds and checks all the global components of the maps. With lazy build
+        mode, the global components not looked up yet are built, otherwise it's
+        equivalent to :meth:`build`.
+        """
+        self.build()
+        if not self.global_maps.lazy or not self.global_maps.total_staged:
+            return
+
+        with self._build_lock:
+            schemas = [s for ns_schemas in self.namespaces.values()
+                       for s in ns_schemas if s.maps is self]
 
+            for staged_map in self.global_maps:
+                staged_map.build()
+            self._complete_build(schemas)
+
+    def _complete_build(self, schemas: list[SchemaType]) -> None:
+        # Update substitutes of global elements
+        for name in self.substitution_groups:
+            xsd_element = self.elements[name]
+            assert not isinstance(xsd_element.substitutes, tuple)
+            xsd_element.substitutes.update(e.name for e in xsd_element.iter_substitutes())
+
+        if not self.global_maps.lazy or not self.global_maps.total_staged:
             self.check(schemas)
 
-            self._built = True
-            for s in schemas:
-                s.clear()
+        self._built = True
+        for s in schemas:
+            s.clear()
 
-            self.check_validator()
+        self.check_validator()
 
     @contextmanager
     def protect_status(self, reraise: bool = True) -> Iterator['XsdGlobals']:
@@ -657,38 +833,56 @@ class XsdGlobals(XsdValidator, Collection[SchemaType]):
 
                 group = group.redefine
 
+        if self.global_maps.lazy:
+            return  # lazily built globals are checked by the lookup
+
         # Check complex content types models restrictions
         for xsd_global in filter(lambda x: x.schema in schemas, self.iter_globals()):
-            xsd_type: Any
-            for xsd_type in xsd_global.iter_components(XsdComplexType):
-                if not isinstance(xsd_type.content, XsdGroup):
-                    continue
-
-                if xsd_type.derivation == 'restriction':
-                    base_type = xsd_type.base_type
-                    if base_type and base_type.name != nm.XSD_ANY_TYPE and base_type.is_complex():
-                        if not xsd_type.content.is_restriction(base_type.content):
-                            msg = _("the derived group is an illegal restriction")
-                            xsd_type.parse_error(msg)
-
-                    if base_type.is_complex() and not base_type.open_content and \
-                            xsd_type.open_content and xsd_type.open_content.mode != 'none':
-                        _group = xsd_type.schema.builders.create_any_content_group(
-                            parent=xsd_type,
-                            any_element=xsd_type.open_content.any_element
-                        )
-                        if not _group.is_restriction(base_type.content):
-                            msg = _("restriction has an open content but base type has not")
-                            _group.parse_error(msg)
-
-                try:
-                    check_model(xsd_type.content)
-                except XMLSchemaModelDepthError:
-                    msg = _("can't verify the content model of {!r} "
-                            "due to exceeding of maximum recursion depth")
-                    xsd_type.schema.warnings.append(msg.format(xsd_type))
-                    warnings.warn(msg, XMLSchemaWarning, stacklevel=4)
-                except XMLSchemaModelError as err:
-                    if self.validation == 'strict':
-                        raise
-                    xsd_type.errors.append(err)
+            self.check_models(xsd_global)
+
+    def check_models(self, xsd_global: SchemaGlobalType) -> None:
+        """
+        Checks the content models of the complex types of a global component,
+        including the restrictions of the base types models.
+
+        :param xsd_global: the global component to check.
+        :raise: XMLSchemaModelError
+        """
+        if self.settings.model_checker == 'automaton':
+            model_checker = check_model_automaton
+        else:
+            model_checker = check_model
+
+        xsd_type: Any
+        for xsd_type in xsd_global.iter_components(XsdComplexType):
+            if not isinstance(xsd_type.content, XsdGroup):
+                continue
+
+            if xsd_type.derivation == 'restriction':
+                base_type = xsd_type.base_type
+                if base_type and base_type.name != nm.XSD_ANY_TYPE and base_type.is_complex():
+                    if not xsd_type.content.is_restriction(base_type.content):
+                        msg = _("the derived group is an illegal restriction")
+                        xsd_type.parse_error(msg)
+
+                if base_type.is_complex() and not base_type.open_content and \
+                        xsd_type.open_content and xsd_type.open_content.mode != 'none':
+                    _group = xsd_type.schema.builders.create_any_content_group(
+                        parent=xsd_type,
+                        any_element=xsd_type.open_content.any_element
+                    )
+                    if not _group.is_restriction(base_type.content):
+                        msg = _("restriction has an open content but base type has not")
+                        _group.parse_error(msg)
+
+            try:
+                model_checker(xsd_type.content)
+            except XMLSchemaModelDepthError:
+                msg = _("can't verify the content model of {!r} "
+                        "due to exceeding of maximum recursion depth")
+                xsd_type.schema.warnings.append(msg.format(xsd_type))
+                warnings.warn(msg, XMLSchemaWarning, stacklevel=5)
+            except XMLSchemaModelError as err:
+                if self.validation == 'strict':
+                    raise
+                xsd_type.errors.append(err)
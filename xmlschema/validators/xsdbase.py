@@ -97,6 +97,11 @@ class XsdValidator:
         """
         raise NotImplementedError()
 
+    @property
+    def lazy_build(self) -> bool:
+        """`True` if the global components of the validator are built on demand."""
+        return False
+
     @property
     def validation_attempted(self) -> str:
         """
@@ -142,10 +147,12 @@ class XsdValidator:
             raise XMLSchemaNotBuiltError(self, msg)
 
         if validation == 'strict':
-            if self.validation_attempted != 'full':
+            # The staged components of lazily built validators are checked on demand
+            staged = self.lazy_build and self.validation_attempted == 'partial'
+            if self.validation_attempted != 'full' and not staged:
                 msg = _("validation mode is 'strict' and %r is not built") % self
                 raise XMLSchemaNotBuiltError(self, msg)
-            if self.validity != 'valid':
+            if self.validity != 'valid' and not (staged and self.validity == 'notKnown'):
                 msg = _("validation mode is 'strict' and %r is not valid") % self
                 raise XMLSchemaNotBuiltError(self, msg)
 
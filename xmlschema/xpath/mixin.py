@@ -9,9 +9,10 @@
 #
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
+from functools import lru_cache
 from typing import cast, overload, Any, Optional, TypeVar, Union, TYPE_CHECKING
 
-from elementpath import XPathSchemaContext, LazyElementNode, SchemaElementNode
+from elementpath import XPathToken, XPathSchemaContext, LazyElementNode, SchemaElementNode
 from elementpath.protocols import XsdElementProtocol
 
 from xmlschema.aliases import NsmapType, SchemaType, BaseXsdType
@@ -26,6 +27,16 @@ if TYPE_CHECKING:
 E_co = TypeVar('E_co', covariant=True, bound='ElementPathMixin[Any]')
 
 
+@lru_cache(maxsize=1024)
+def parse_find_path(path: str, namespaces: tuple[tuple[str, str], ...]) -> XPathToken:
+    """
+    Parses a path for find/findall/iterfind API, returning the root token. The
+    namespaces are provided as a tuple of items, the tokens are cached and reused
+    for selecting XSD subelements with different contexts.
+    """
+    return SchemaFindParser(dict(namespaces), strict=False).parse(path)
+
+
 class ElementPathMixin(Sequence[E_co]):
     """
     Mixin abstract class for enabling ElementTree and XPath 2.0 API on XSD components.
@@ -103,9 +114,9 @@ class ElementPathMixin(Sequence[E_co]):
         """
         if namespaces is None:
             namespaces = self.namespaces
-        parser = SchemaFindParser(namespaces, strict=False)
+        root_token = parse_find_path(path, tuple(namespaces.items()))
         context = XPathSchemaContext(self.xpath_node)
-        return cast(Optional[E_co], next(parser.parse(path).select_results(context), None))
+        return cast(Optional[E_co], next(root_token.select_results(context), None))
 
     def findall(self, path: str, namespaces: Optional[NsmapType] = None) -> list[E_co]:
         """
@@ -118,9 +129,9 @@ class ElementPathMixin(Sequence[E_co]):
         """
         if namespaces is None:
             namespaces = self.namespaces
-        parser = SchemaFindParser(namespaces, strict=False)
+        root_token = parse_find_path(path, tuple(namespaces.items()))
         context = XPathSchemaContext(self.xpath_node)
-        return cast(list[E_co], parser.parse(path).get_results(context))
+        return cast(list[E_co], root_token.get_results(context))
 
     def iterfind(self, path: str, namespaces: Optional[NsmapType] = None) -> Iterator[E_co]:
         """
@@ -132,9 +143,9 @@ class ElementPathMixin(Sequence[E_co]):
         """
         if namespaces is None:
             namespaces = self.namespaces
-        parser = SchemaFindParser(namespaces, strict=False)
+        root_token = parse_find_path(path, tuple(namespaces.items()))
         context = XPathSchemaContext(self.xpath_node)
-        return cast(Iterator[E_co], parser.parse(path).select_results(context))
+        return cast(Iterator[E_co], root_token.select_results(context))
 
     def iter(self, tag: Optional[str] = None) -> Iterator[E_co]:
         """